@@ -0,0 +1,3 @@
+"""
+Performance micro-benchmarks for the simulator components.
+"""
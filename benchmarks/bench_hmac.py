@@ -0,0 +1,47 @@
+"""
+Micro-benchmark for per-packet HMAC-SHA256 cost on short CCSDS packets.
+
+Compares the original ``hmac.new`` per message against the pre-keyed context copy
+and the one-shot ``hmac.digest`` paths used by HMACSigner/HMACVerifier.
+
+Usage:
+    python -m benchmarks.bench_hmac
+"""
+
+import hashlib
+import hmac
+import timeit
+
+from satellite_sim.crypto.hmac_signer import HMACSigner
+
+SECRET = b"TOP_SECRET_SATELLITE_KEY_2024"
+# Primary header (6) + timestamp (8) + short command payload
+PACKET = b"\x19\x00\xc0\x00\x00\x15" + b"\x00" * 8 + b"ADJUST_THRUST"
+NUMBER = 100_000
+REPEAT = 5
+
+
+def per_call_us(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main() -> None:
+    copy_signer = HMACSigner(SECRET)
+    one_shot_signer = HMACSigner(SECRET, one_shot=True)
+
+    results = {
+        "hmac.new per message": per_call_us(
+            lambda: hmac.new(SECRET, PACKET, hashlib.sha256).digest()
+        ),
+        "pre-keyed copy": per_call_us(lambda: copy_signer.digest(PACKET)),
+        "one-shot hmac.digest": per_call_us(lambda: one_shot_signer.digest(PACKET)),
+    }
+
+    baseline = results["hmac.new per message"]
+    print(f"HMAC-SHA256 over {len(PACKET)}-byte packet ({NUMBER} iterations, best of {REPEAT})")
+    for name, us in results.items():
+        print(f"  {name:<24} {us:6.2f} us/packet  ({baseline / us:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Micro-benchmark for building and signing one command packet.
+
+Compares the original path (struct.pack per field, three concatenations, hmac.new,
+f-string log messages, signature appended with another concatenation) against the current
+LegitGroundStation.create_command (one precompiled struct for both headers,
+pre-keyed HMAC, two concatenations) and against writing everything into one
+preallocated bytearray with pack_into and signing in place.
+
+Usage:
+    python -m benchmarks.bench_packet_build
+"""
+
+import hashlib
+import hmac
+import logging
+import struct
+import time
+import timeit
+
+from satellite_sim.ground_station.legit import LegitGroundStation
+
+logger = logging.getLogger(__name__)
+
+SECRET = b"TOP_SECRET_SATELLITE_KEY_2024"
+COMMAND = "ADJUST_THRUST"
+NUMBER = 50_000
+REPEAT = 5
+
+
+class LegacyStation:
+    """
+    The original build+sign path, including its eagerly formatted log messages.
+    """
+
+    def __init__(self, apid: int, secret_key: bytes):
+        self.apid = apid
+        self.secret_key = secret_key
+        self.sequence_count = 0
+
+    def create_command(self, command_str: str) -> bytes:
+        logger.info(f"[STATION_ALPHA] Generating command: {command_str}")
+        payload_bytes = command_str.encode("utf-8")
+        sec_header_bytes = struct.pack(">d", time.time())
+        length_field_value = len(sec_header_bytes) + len(payload_bytes) - 1
+        byte1_2 = (0 << 13) | (1 << 12) | (1 << 11) | (self.apid & 0x7FF)
+        byte3_4 = (3 << 14) | (self.sequence_count & 0x3FFF)
+        self.sequence_count = (self.sequence_count + 1) % 16384
+        primary_header = struct.pack(">HHH", byte1_2, byte3_4, length_field_value)
+        raw_packet = primary_header + sec_header_bytes + payload_bytes
+        signature = hmac.new(self.secret_key, raw_packet, hashlib.sha256).digest()
+        logger.debug(
+            f"Signed data of length {len(raw_packet)} with signature {signature.hex()[:8]}..."
+        )
+        signed_packet = raw_packet + signature
+        logger.info(f"[STATION_ALPHA] Packet signed. Total length: {len(signed_packet)} bytes.")
+        return signed_packet
+
+
+def preallocated_create_command(station: LegitGroundStation, command_str: str) -> bytes:
+    """
+    Single-allocation variant: header, timestamp, payload and HMAC written into one
+    bytearray. Kept for comparison; for packets this small it is slower in CPython
+    than packing and concatenating.
+    """
+    builder = station.packet_builder
+    payload = command_str.encode("utf-8")
+    size = 14 + len(payload)
+    buffer = bytearray(size + 32)
+    struct.pack_into(
+        ">HHHd",
+        buffer,
+        0,
+        (1 << 12) | (1 << 11) | (builder.apid & 0x7FF),
+        (3 << 14) | builder.sequence_count,
+        8 + len(payload) - 1,
+        time.time(),
+    )
+    builder.sequence_count = (builder.sequence_count + 1) % 16384
+    buffer[14:size] = payload
+    view = memoryview(buffer)
+    view[size:] = station.signer.digest(view[:size])
+    view.release()
+    return bytes(buffer)
+
+
+def per_call_us(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main() -> None:
+    # Log records are never emitted; only the cost of building their messages counts
+    logging.disable(logging.CRITICAL)
+
+    legacy = LegacyStation(apid=0x100, secret_key=SECRET)
+    current = LegitGroundStation(apid=0x100, secret_key=SECRET)
+    preallocated = LegitGroundStation(apid=0x100, secret_key=SECRET)
+
+    results = {
+        "legacy build+sign": per_call_us(lambda: legacy.create_command(COMMAND)),
+        "create_command": per_call_us(lambda: current.create_command(COMMAND)),
+        "preallocated buffer": per_call_us(
+            lambda: preallocated_create_command(preallocated, COMMAND)
+        ),
+    }
+
+    baseline = results["legacy build+sign"]
+    print(f"Build + sign '{COMMAND}' ({NUMBER} iterations, best of {REPEAT})")
+    for name, us in results.items():
+        print(f"  {name:<26} {us:6.2f} us/packet  ({baseline / us:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
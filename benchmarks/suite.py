@@ -0,0 +1,415 @@
+"""
+Benchmark suite with machine-readable results and regression gating.
+
+Each benchmark builds its inputs in a setup step (not timed) and returns a callable
+that performs a fixed number of operations. The callable is timed over several
+rounds, each with a fresh setup, and the best round is reported as operations per
+second. End-to-end scenarios use fixed seeds so every run sees the same traffic mix.
+
+Usage:
+    python -m benchmarks.suite                          # run and print
+    python -m benchmarks.suite --output results.json    # also write JSON
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --threshold 0.15
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --baseline other-machine.json --normalize
+
+With --baseline the exit status is 1 if any benchmark's throughput dropped by more
+than the threshold (a fraction) relative to the baseline.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from satellite_sim.channel.capture import CaptureReader, CaptureWriter
+from satellite_sim.channel.uplink import UplinkChannel
+from satellite_sim.crypto.hmac_signer import HMACSigner
+from satellite_sim.crypto.keyring import Keyring
+from satellite_sim.crypto.verifier import HMACVerifier
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.packet_builder import CCSDSPacketBuilder
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from satellite_sim.pipeline.streaming import StreamingPipeline, mixed_traffic
+from satellite_sim.satellite.firewall import SpaceFirewall
+from satellite_sim.satellite.metrics import FirewallMetrics
+from satellite_sim.satellite.suppression import ViolationAggregator
+from satellite_sim.satellite.telemetry import TelemetrySystem
+
+SECRET = b"TOP_SECRET_SATELLITE_KEY_2024"
+APID = 0x100
+SEED = 1234
+
+# (callable performing the work, number of operations it performs)
+Workload = Tuple[Callable[[], Any], int]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[str, int], Workload]
+    ops: int
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, ops: int) -> Callable[[Callable[[str, int], Workload]], Any]:
+    """
+    Register a setup function ``setup(workdir, ops) -> (work, ops)`` under ``name``.
+    """
+
+    def register(setup: Callable[[str, int], Workload]) -> Callable[[str, int], Workload]:
+        BENCHMARKS.append(Benchmark(name, setup, ops))
+        return setup
+
+    return register
+
+
+def _firewall(workdir: str, **kwargs: Any) -> SpaceFirewall:
+    telemetry = TelemetrySystem(
+        log_file=os.path.join(workdir, "telemetry.log"),
+        events_file=os.path.join(workdir, "security_events.json"),
+        **kwargs,
+    )
+    return SpaceFirewall(SECRET, telemetry)
+
+
+@benchmark("hmac_sign", ops=50_000)
+def _hmac_sign(workdir: str, ops: int) -> Workload:
+    signer = HMACSigner(SECRET)
+    packet = CCSDSPacketBuilder(APID).build_packet("ADJUST_THRUST")
+
+    def work() -> None:
+        sign = signer.sign
+        for _ in range(ops):
+            sign(packet)
+
+    return work, ops
+
+
+@benchmark("hmac_verify", ops=50_000)
+def _hmac_verify(workdir: str, ops: int) -> Workload:
+    verifier = HMACVerifier(SECRET)
+    packet = CCSDSPacketBuilder(APID).build_packet("ADJUST_THRUST")
+    signature = HMACSigner(SECRET).sign(packet)
+
+    def work() -> None:
+        verify = verifier.verify
+        for _ in range(ops):
+            verify(packet, signature)
+
+    return work, ops
+
+
+@benchmark("build_packet", ops=50_000)
+def _build_packet(workdir: str, ops: int) -> Workload:
+    builder = CCSDSPacketBuilder(APID)
+
+    def work() -> None:
+        build = builder.build_packet
+        for _ in range(ops):
+            build("ADJUST_THRUST")
+
+    return work, ops
+
+
+def _process_legit(workdir: str, ops: int, instrument: bool = False) -> Workload:
+    firewall = _firewall(workdir)
+    if instrument:
+        firewall.metrics = FirewallMetrics()
+    station = LegitGroundStation(apid=APID, secret_key=SECRET)
+    packets = [station.create_command(f"CMD_{i}") for i in range(ops)]
+
+    def work() -> None:
+        process = firewall.process_packet
+        for packet in packets:
+            process(packet)
+        firewall.telemetry.close()
+
+    return work, ops
+
+
+benchmark("process_packet_legit", ops=5_000)(_process_legit)
+benchmark("process_packet_legit_instrumented", ops=5_000)(
+    lambda workdir, ops: _process_legit(workdir, ops, instrument=True)
+)
+
+
+@benchmark("process_packet_keyring_64_keys", ops=5_000)
+def _process_keyring(workdir: str, ops: int) -> Workload:
+    # 64 stations, one key each, interleaved on one APID. Every packet is accepted,
+    # so this times the key ID prefilter, key lookup and keyed MAC on each packet
+    keyring = Keyring()
+    for key_id in range(64):
+        keyring.add(key_id, SECRET + bytes([key_id]))
+    firewall = SpaceFirewall(None, _firewall(workdir).telemetry, keyring=keyring)
+    stations = [LegitGroundStation.from_keyring(APID, entry) for entry in keyring]
+    packets = [stations[i % 64].create_command(f"CMD_{i}") for i in range(ops)]
+
+    def work() -> None:
+        process = firewall.process_packet
+        for packet in packets:
+            process(packet)
+        firewall.telemetry.close()
+
+    return work, ops
+
+
+def _process_attack(workdir: str, ops: int, suppress: bool = False) -> Workload:
+    firewall = _firewall(workdir)
+    if suppress:
+        firewall.violations = ViolationAggregator(firewall.telemetry)
+    rogue = RogueGroundStation(apid=APID)
+    packets = [rogue.create_attack_packet(f"ATTACK_{i}") for i in range(ops)]
+
+    def work() -> None:
+        process = firewall.process_packet
+        for packet in packets:
+            process(packet)
+        firewall.telemetry.close()
+
+    return work, ops
+
+
+benchmark("process_packet_attack", ops=5_000)(_process_attack)
+benchmark("process_packet_attack_suppressed", ops=5_000)(
+    lambda workdir, ops: _process_attack(workdir, ops, suppress=True)
+)
+
+
+@benchmark("telemetry_log_event", ops=20_000)
+def _log_event(workdir: str, ops: int) -> Workload:
+    telemetry = _firewall(workdir).telemetry
+
+    def work() -> None:
+        log_event = telemetry.log_event
+        for i in range(ops):
+            log_event("COMMAND_EXECUTED", {"command": "ADJUST_THRUST", "apid": APID}, "INFO")
+        telemetry.close()
+
+    return work, ops
+
+
+def _pipeline(attack_ratio: float) -> Callable[[str, int], Workload]:
+    def setup(workdir: str, ops: int) -> Workload:
+        firewall = _firewall(workdir)
+        source = list(
+            mixed_traffic(
+                LegitGroundStation(apid=APID, secret_key=SECRET),
+                RogueGroundStation(apid=APID),
+                count=ops,
+                attack_ratio=attack_ratio,
+                seed=SEED,
+            )
+        )
+
+        def work() -> None:
+            StreamingPipeline(iter(source), firewall, UplinkChannel(seed=SEED)).run()
+            firewall.telemetry.close()
+
+        return work, ops
+
+    return setup
+
+
+benchmark("e2e_legit_only", ops=10_000)(_pipeline(0.0))
+benchmark("e2e_mixed_30pct_attack", ops=10_000)(_pipeline(0.3))
+benchmark("e2e_attack_heavy_90pct", ops=10_000)(_pipeline(0.9))
+
+
+@benchmark("replay_capture_mmap", ops=10_000)
+def _replay_capture(workdir: str, ops: int) -> Workload:
+    firewall = _firewall(workdir)
+    path = os.path.join(workdir, "uplink.cap")
+    source = mixed_traffic(
+        LegitGroundStation(apid=APID, secret_key=SECRET),
+        RogueGroundStation(apid=APID),
+        count=ops,
+        attack_ratio=0.3,
+        seed=SEED,
+    )
+    with CaptureWriter(path) as writer:
+        for packet in source:
+            writer.write(packet)
+
+    def work() -> None:
+        with CaptureReader(path) as reader:
+            reader.replay(firewall)
+        firewall.telemetry.close()
+
+    return work, ops
+
+
+def calibrate(rounds: int = 5, n: int = 200_000) -> float:
+    """
+    Score the interpreter/machine with a fixed pure-Python loop (iterations/sec).
+
+    Stored with each report so that --normalize can compare runs from machines (or
+    load conditions) of different speed.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        total = 0
+        table = {}
+        for i in range(n):
+            total += i * i % 7
+            if i & 3 == 0:
+                table[i] = str(i)
+        best = min(best, time.perf_counter() - start)
+    return n / best
+
+
+def run_benchmark(bench: Benchmark, rounds: int = 5, scale: float = 1.0) -> Dict[str, Any]:
+    """
+    Time a benchmark over ``rounds`` fresh setups and report the best round.
+
+    Args:
+        bench (Benchmark): The benchmark to run.
+        rounds (int): Number of timed rounds.
+        scale (float): Multiplier on the operation count (e.g. 0.1 for a smoke run).
+
+    Returns:
+        Dict[str, Any]: ops_per_sec, us_per_op, ops and rounds.
+    """
+    ops = max(1, int(bench.ops * scale))
+    best = float("inf")
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory() as workdir:
+            work, ops = bench.setup(workdir, ops)
+            start = time.perf_counter()
+            work()
+            best = min(best, time.perf_counter() - start)
+    return {
+        "ops_per_sec": ops / best,
+        "us_per_op": best / ops * 1e6,
+        "ops": ops,
+        "rounds": rounds,
+    }
+
+
+def run_suite(
+    names: Optional[List[str]] = None, rounds: int = 5, scale: float = 1.0
+) -> Dict[str, Any]:
+    """
+    Run the selected benchmarks (all by default) and return a JSON-serialisable report.
+    """
+    results = {}
+    for bench in BENCHMARKS:
+        if names and bench.name not in names:
+            continue
+        results[bench.name] = run_benchmark(bench, rounds, scale)
+    return {
+        "meta": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "rounds": rounds,
+            "scale": scale,
+            "calibration": calibrate(rounds),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 0.10,
+    normalize: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Compare throughput against a baseline report.
+
+    Args:
+        results (Dict[str, Any]): Report from run_suite().
+        baseline (Dict[str, Any]): An earlier report.
+        threshold (float): Allowed fractional drop in ops/sec before a benchmark
+            counts as regressed.
+        normalize (bool): Divide out the difference in calibration scores, so a
+            uniformly slower machine does not count as a regression.
+
+    Returns:
+        List[Dict[str, Any]]: One row per benchmark present in both reports, with
+        the throughput ratio (current / baseline) and a ``regressed`` flag.
+    """
+    speed = 1.0
+    if normalize:
+        speed = results["meta"]["calibration"] / baseline["meta"]["calibration"]
+    rows = []
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        ratio = current["ops_per_sec"] / previous["ops_per_sec"] / speed
+        rows.append(
+            {
+                "name": name,
+                "baseline_ops_per_sec": previous["ops_per_sec"],
+                "ops_per_sec": current["ops_per_sec"],
+                "ratio": ratio,
+                "regressed": ratio < 1.0 - threshold,
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("names", nargs="*", help="Benchmarks to run (default: all)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier on operation counts")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against this JSON report")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed throughput drop")
+    parser.add_argument(
+        "--normalize", action="store_true", help="Adjust for machine speed via calibration"
+    )
+    parser.add_argument("--save-baseline", help="Write the report as a new baseline")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in BENCHMARKS:
+            print(f"{bench.name:<34} {bench.ops} ops")
+        return 0
+    unknown = set(args.names) - {bench.name for bench in BENCHMARKS}
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    # Keep log output from the components out of the measurements
+    logging.disable(logging.CRITICAL)
+    report = run_suite(args.names, args.rounds, args.scale)
+
+    print(f"{'benchmark':<34} {'ops/s':>12} {'us/op':>10}")
+    for name, result in report["results"].items():
+        print(f"{name:<34} {result['ops_per_sec']:>12.0f} {result['us_per_op']:>10.2f}")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare(report, baseline, args.threshold, args.normalize)
+    print(f"\nAgainst {args.baseline} (fail below {1.0 - args.threshold:.0%} of baseline):")
+    for row in rows:
+        status = "REGRESSED" if row["regressed"] else "ok"
+        print(f"{row['name']:<34} {row['ratio']:>8.2f}x  {status}")
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
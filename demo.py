@@ -5,8 +5,11 @@ Runs a full scenario: Legit commands + Multiple attack attempts
 """
 
 import subprocess
+import sys
 import time
 
+from satellite_sim.cli.client import DEFAULT_SOCKET, connect
+
 
 def run_command(cmd):
     """Execute a CLI command and display output."""
@@ -14,13 +17,44 @@ def run_command(cmd):
     print(f"EXECUTING: {cmd}")
     print(f"{'='*80}")
     result = subprocess.run(cmd, shell=True, capture_output=False)
-    time.sleep(1)
     return result.returncode
 
 
+def start_daemon(timeout=10.0):
+    """Start the satellite daemon so all commands share one firewall and telemetry."""
+    client = connect(DEFAULT_SOCKET)
+    if client is not None:
+        # Never take over (or later shut down) a daemon this demo did not start
+        client.close()
+        raise RuntimeError(
+            f"A satellite daemon is already running on {DEFAULT_SOCKET}; "
+            "stop it with 'sat_cli stop-daemon' before running the demo"
+        )
+    # The daemon removes a stale socket file left behind by a crashed run
+    proc = subprocess.Popen([sys.executable, "-m", "satellite_sim.cli.sat_cli", "daemon"])
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and proc.poll() is None:
+        client = connect(DEFAULT_SOCKET)
+        if client is not None:
+            client.close()
+            return proc
+        time.sleep(0.05)
+    proc.terminate()
+    raise RuntimeError("Satellite daemon did not start")
+
+
+def stop_daemon(proc, timeout=10.0):
+    """Ask the daemon to shut down, terminating it if it does not exit in time."""
+    run_command("python -m satellite_sim.cli.sat_cli stop-daemon")
+    try:
+        proc.wait(timeout)
+    except subprocess.TimeoutExpired:
+        proc.terminate()
+        proc.wait()
+
+
 def main():
-    print(
-        """
+    print("""
     ╔═══════════════════════════════════════════════════════════════════════╗
     ║                                                                       ║
     ║   LEO SATELLITE COMMAND LINK INTRUSION SIMULATION DEMO                ║
@@ -29,44 +63,48 @@ def main():
     ║                 Spoofing Detection, and Security Logging              ║
     ║                                                                       ║
     ╚═══════════════════════════════════════════════════════════════════════╝
-    """
-    )
-
-    # Scenario 1: Legitimate Operations
-    print("\n🛰️  SCENARIO 1: LEGITIMATE GROUND STATION OPERATIONS")
-    print("-" * 80)
-    run_command("python -m satellite_sim.cli.sat_cli send --station legit --cmd 'ADJUST_THRUST'")
-    run_command(
-        "python -m satellite_sim.cli.sat_cli send --station legit --cmd 'UPDATE_ORBIT_PARAMETERS'"
-    )
-    run_command(
-        "python -m satellite_sim.cli.sat_cli send --station legit --cmd 'DEPLOY_SOLAR_PANEL'"
-    )
-
-    # Scenario 2: Attack Attempts
-    print("\n\n⚠️  SCENARIO 2: ROGUE STATION ATTACK ATTEMPTS")
-    print("-" * 80)
-    run_command(
-        "python -m satellite_sim.cli.sat_cli send --station rogue --cmd 'SHUTDOWN_REACTOR' --attack-type BAD_SIGNATURE"
-    )
-    run_command(
-        "python -m satellite_sim.cli.sat_cli send --station rogue --cmd 'DISABLE_ATTITUDE_CONTROL' --attack-type NO_SIGNATURE"
-    )
-    run_command(
-        "python -m satellite_sim.cli.sat_cli send --station rogue --cmd 'CHANGE_ORBIT' --attack-type SHORT_SIGNATURE"
-    )
-
-    # View Results
-    print("\n\n📊 TELEMETRY & SECURITY LOGS")
-    print("-" * 80)
-    run_command("python -m satellite_sim.cli.sat_cli watch-telemetry")
-
-    print("\n\n📈 SECURITY REPORT")
-    print("-" * 80)
-    run_command("python -m satellite_sim.cli.sat_cli export-report")
-
-    print(
-        """
+    """)
+
+    daemon = start_daemon()
+    try:
+        # Scenario 1: Legitimate Operations
+        print("\n🛰️  SCENARIO 1: LEGITIMATE GROUND STATION OPERATIONS")
+        print("-" * 80)
+        run_command(
+            "python -m satellite_sim.cli.sat_cli send --station legit --cmd 'ADJUST_THRUST'"
+        )
+        run_command(
+            "python -m satellite_sim.cli.sat_cli send --station legit --cmd 'UPDATE_ORBIT_PARAMETERS'"
+        )
+        run_command(
+            "python -m satellite_sim.cli.sat_cli send --station legit --cmd 'DEPLOY_SOLAR_PANEL'"
+        )
+
+        # Scenario 2: Attack Attempts
+        print("\n\n⚠️  SCENARIO 2: ROGUE STATION ATTACK ATTEMPTS")
+        print("-" * 80)
+        run_command(
+            "python -m satellite_sim.cli.sat_cli send --station rogue --cmd 'SHUTDOWN_REACTOR' --attack-type BAD_SIGNATURE"
+        )
+        run_command(
+            "python -m satellite_sim.cli.sat_cli send --station rogue --cmd 'DISABLE_ATTITUDE_CONTROL' --attack-type NO_SIGNATURE"
+        )
+        run_command(
+            "python -m satellite_sim.cli.sat_cli send --station rogue --cmd 'CHANGE_ORBIT' --attack-type SHORT_SIGNATURE"
+        )
+
+        # View Results
+        print("\n\n📊 TELEMETRY & SECURITY LOGS")
+        print("-" * 80)
+        run_command("python -m satellite_sim.cli.sat_cli watch-telemetry")
+
+        print("\n\n📈 SECURITY REPORT")
+        print("-" * 80)
+        run_command("python -m satellite_sim.cli.sat_cli export-report")
+    finally:
+        stop_daemon(daemon)
+
+    print("""
     \n╔═══════════════════════════════════════════════════════════════════════╗
     ║                                                                       ║
     ║   ✅ DEMONSTRATION COMPLETE                                           ║
@@ -74,8 +112,7 @@ def main():
     ║   Results: Check 'telemetry.log' and 'security_events.json'          ║
     ║                                                                       ║
     ╚═══════════════════════════════════════════════════════════════════════╝
-    """
-    )
+    """)
 
 
 if __name__ == "__main__":
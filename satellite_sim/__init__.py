@@ -10,20 +10,31 @@ __version__ = "1.0.0"
 __author__ = "Raouf"
 __license__ = "MIT"
 
-from satellite_sim.crypto.hmac_signer import HMACSigner
-from satellite_sim.crypto.verifier import HMACVerifier
-from satellite_sim.ground_station.legit import LegitGroundStation
-from satellite_sim.ground_station.rogue import RogueGroundStation
-from satellite_sim.satellite.firewall import SpaceFirewall
-from satellite_sim.satellite.telemetry import TelemetrySystem
-from satellite_sim.channel.uplink import UplinkChannel
-
-__all__ = [
-    "HMACSigner",
-    "HMACVerifier",
-    "LegitGroundStation",
-    "RogueGroundStation",
-    "SpaceFirewall",
-    "TelemetrySystem",
-    "UplinkChannel",
-]
+from typing import TYPE_CHECKING
+
+from satellite_sim._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from satellite_sim.crypto.hmac_signer import HMACSigner
+    from satellite_sim.crypto.keyring import Keyring
+    from satellite_sim.crypto.verifier import HMACVerifier
+    from satellite_sim.ground_station.legit import LegitGroundStation
+    from satellite_sim.ground_station.rogue import RogueGroundStation
+    from satellite_sim.satellite.firewall import SpaceFirewall
+    from satellite_sim.satellite.telemetry import TelemetrySystem
+    from satellite_sim.channel.uplink import UplinkChannel
+
+_EXPORTS = {
+    "HMACSigner": "satellite_sim.crypto.hmac_signer",
+    "HMACVerifier": "satellite_sim.crypto.verifier",
+    "Keyring": "satellite_sim.crypto.keyring",
+    "LegitGroundStation": "satellite_sim.ground_station.legit",
+    "RogueGroundStation": "satellite_sim.ground_station.rogue",
+    "SpaceFirewall": "satellite_sim.satellite.firewall",
+    "TelemetrySystem": "satellite_sim.satellite.telemetry",
+    "UplinkChannel": "satellite_sim.channel.uplink",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,36 @@
+"""
+Lazy attribute loading for package ``__init__`` modules (PEP 562).
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` hooks that import exported names on first access.
+
+    Args:
+        package (str): The package's ``__name__``.
+        exports (Dict[str, str]): Exported name -> module that defines it.
+
+    Returns:
+        Tuple: The ``__getattr__`` and ``__dir__`` functions for the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        # Cache on the package so later lookups skip this hook
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
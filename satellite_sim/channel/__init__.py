@@ -2,6 +2,23 @@
 RF uplink channel simulation module.
 """
 
-from satellite_sim.channel.uplink import UplinkChannel
+from typing import TYPE_CHECKING
 
-__all__ = ["UplinkChannel"]
+from satellite_sim._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from satellite_sim.channel.capture import CaptureReader, CaptureWriter, ReplayReport
+    from satellite_sim.channel.uplink import Delivery, GilbertElliott, UplinkChannel
+
+_EXPORTS = {
+    "UplinkChannel": "satellite_sim.channel.uplink",
+    "GilbertElliott": "satellite_sim.channel.uplink",
+    "Delivery": "satellite_sim.channel.uplink",
+    "CaptureWriter": "satellite_sim.channel.capture",
+    "CaptureReader": "satellite_sim.channel.capture",
+    "ReplayReport": "satellite_sim.channel.capture",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
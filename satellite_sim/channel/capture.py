@@ -0,0 +1,305 @@
+import logging
+import mmap
+import struct
+import sys
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, NamedTuple, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from satellite_sim.satellite.firewall import SpaceFirewall
+
+logger = logging.getLogger(__name__)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# File layout (all little-endian):
+#   header   magic, format version, flags
+#   records  arrival time (f64 epoch seconds), packet length (u32), packet bytes
+#   padding  zeros up to an 8-byte boundary
+#   index    one u64 file offset per record
+#   trailer  index offset, record count, index magic
+# The index and trailer are written on close; a capture without them (e.g. after
+# a crash) is still readable, its index is rebuilt by scanning the records.
+MAGIC = b"SATCAP01"
+INDEX_MAGIC = b"SATIDX01"
+VERSION = 1
+_FILE_HEADER = struct.Struct("<8sII")
+_RECORD = struct.Struct("<dI")
+_TRAILER = struct.Struct("<QQ8s")
+
+
+class CaptureRecord(NamedTuple):
+    """
+    One captured packet. ``packet`` is a view into the memory-mapped file.
+    """
+
+    arrival_time: float
+    packet: memoryview
+
+
+class CaptureWriter:
+    """
+    Appends received packets to a capture file.
+
+    Pass ``writer.write`` as an UplinkChannel tap to record everything the channel
+    delivers:
+
+        with CaptureWriter("uplink.cap") as writer:
+            channel = UplinkChannel(tap=writer.write)
+            ...
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 20):
+        """
+        Args:
+            path (str): Capture file to create (overwritten if it exists).
+            buffer_size (int): Write buffer size in bytes.
+        """
+        self.path = path
+        self._file = open(path, "wb", buffering=buffer_size)
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION, 0))
+        self._position = _FILE_HEADER.size
+        self._offsets = array("Q")
+        self.bytes_written = 0
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def write(self, packet: Buffer, arrival_time: Optional[float] = None) -> None:
+        """
+        Append one packet.
+
+        Args:
+            packet (Buffer): Packet bytes as received.
+            arrival_time (float): Epoch time the packet arrived. Defaults to now.
+        """
+        if arrival_time is None:
+            arrival_time = time.time()
+        size = len(packet)
+        self._offsets.append(self._position)
+        self._file.write(_RECORD.pack(arrival_time, size))
+        self._file.write(packet)
+        self._position += _RECORD.size + size
+        self.bytes_written += size
+
+    def close(self) -> None:
+        """
+        Write the offset index and trailer, then close the file.
+        """
+        if self._file.closed:
+            return
+        padding = -self._position % 8
+        self._file.write(b"\0" * padding)
+        index_offset = self._position + padding
+        offsets = self._offsets
+        if sys.byteorder != "little":
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+        self._file.write(offsets.tobytes())
+        self._file.write(_TRAILER.pack(index_offset, len(self._offsets), INDEX_MAGIC))
+        self._file.close()
+        logger.info("Wrote %d packets to capture %s", len(self._offsets), self.path)
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+@dataclass
+class ReplayReport:
+    """
+    Result of CaptureReader.replay().
+    """
+
+    packets: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    reasons: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def packets_per_second(self) -> float:
+        return self.packets / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class CaptureReader:
+    """
+    Memory-maps a capture file for random access and replay.
+
+    Packets are returned as memoryview slices of the mapping, so iterating over or
+    replaying a capture never copies packet bytes and the file can be much larger
+    than RAM. With a complete index the reader opens in constant time, because the
+    index is used in place from the mapping.
+
+    Views handed out by the reader are only valid until close().
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Capture file written by CaptureWriter.
+
+        Raises:
+            ValueError: If the file is not a capture file.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a capture file") from None
+        self._view = memoryview(self._mmap)
+        if len(self._view) < _FILE_HEADER.size or self._view[:8] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a capture file")
+        version = _FILE_HEADER.unpack_from(self._view)[1]
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported capture format version {version}")
+        self.offsets: Sequence[int] = self._load_index()
+
+    def _load_index(self) -> Sequence[int]:
+        size = len(self._view)
+        if size >= _FILE_HEADER.size + _TRAILER.size:
+            index_offset, count, magic = _TRAILER.unpack_from(self._view, size - _TRAILER.size)
+            if magic == INDEX_MAGIC and index_offset + count * 8 == size - _TRAILER.size:
+                index = self._view[index_offset : index_offset + count * 8]
+                if sys.byteorder == "little":
+                    return index.cast("Q")
+                offsets = array("Q", index.tobytes())
+                offsets.byteswap()
+                return offsets
+        logger.warning("Capture %s has no index; rebuilding it by scanning", self.path)
+        return self._scan()
+
+    def _scan(self) -> "array[int]":
+        offsets = array("Q")
+        view = self._view
+        position = _FILE_HEADER.size
+        end = len(view)
+        while position + _RECORD.size <= end:
+            length = _RECORD.unpack_from(view, position)[1]
+            if position + _RECORD.size + length > end:
+                break  # Truncated final record
+            offsets.append(position)
+            position += _RECORD.size + length
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def arrival_time(self, index: int) -> float:
+        return float(_RECORD.unpack_from(self._view, self.offsets[index])[0])
+
+    def record(self, index: int) -> CaptureRecord:
+        offset = self.offsets[index]
+        arrival_time, length = _RECORD.unpack_from(self._view, offset)
+        start = offset + _RECORD.size
+        return CaptureRecord(arrival_time, self._view[start : start + length])
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        for i in range(len(self.offsets)):
+            yield self.record(i)
+
+    def packets(self, start: int = 0, stop: Optional[int] = None) -> Iterator[memoryview]:
+        """
+        Yield zero-copy views of packets ``start`` to ``stop`` (exclusive).
+        """
+        view = self._view
+        offsets = self.offsets
+        unpack = _RECORD.unpack_from
+        header = _RECORD.size
+        for i in range(start, len(offsets) if stop is None else stop):
+            offset = offsets[i]
+            length = unpack(view, offset)[1]
+            yield view[offset + header : offset + header + length]
+
+    def replay(
+        self,
+        firewall: "SpaceFirewall",
+        batch_size: int = 1024,
+        pace: bool = False,
+        speed: float = 1.0,
+        recorded_time: bool = True,
+    ) -> ReplayReport:
+        """
+        Feed the capture through a firewall's process_batch().
+
+        At maximum speed (the default) packets are handed over in fixed-size
+        batches. With ``pace`` each packet is released at its original arrival
+        offset (divided by ``speed``); packets that are already due when the
+        replay catches up are batched together, up to ``batch_size``.
+
+        Args:
+            firewall (SpaceFirewall): Receives the packets.
+            batch_size (int): Maximum packets per process_batch() call.
+            pace (bool): Reproduce the captured inter-arrival times.
+            speed (float): Time compression for paced replay (2.0 = twice as fast).
+            recorded_time (bool): Use each batch's captured arrival time as the
+                firewall's reference time, so freshness checks judge packets as they
+                were judged live. Set False to check against the current time.
+
+        Returns:
+            ReplayReport: Packet and verdict counts and the wall time taken.
+
+        Raises:
+            ValueError: If ``speed`` is not positive or ``batch_size`` is below 1.
+        """
+        if not speed > 0:
+            raise ValueError(f"Replay speed must be positive, got {speed}")
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {batch_size}")
+        report = ReplayReport()
+        reasons: "Counter[str]" = Counter()
+        total = len(self.offsets)
+        first = self.arrival_time(0) if total else 0.0
+        clock = time.perf_counter
+        start = clock()
+        i = 0
+        while i < total:
+            if pace:
+                delay = (self.arrival_time(i) - first) / speed - (clock() - start)
+                if delay > 0:
+                    time.sleep(delay)
+                due = first + (clock() - start) * speed
+                j = i + 1
+                while j < total and j - i < batch_size and self.arrival_time(j) <= due:
+                    j += 1
+            else:
+                j = min(i + batch_size, total)
+            reference = self.arrival_time(j - 1) if recorded_time else None
+            result = firewall.process_batch(self.packets(i, j), current_time=reference)
+            report.packets += len(result.verdicts)
+            report.accepted += result.accepted
+            report.rejected += result.rejected
+            report.batches += 1
+            reasons.update(result.reasons)
+            i = j
+        report.elapsed = clock() - start
+        report.reasons = dict(reasons)
+        return report
+
+    def close(self) -> None:
+        offsets = self.__dict__.get("offsets")
+        if isinstance(offsets, memoryview):
+            offsets.release()
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # The caller still holds packet views; the mapping is freed with them
+            pass
+        self._file.close()
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,19 +1,174 @@
+import bisect
 import logging
+import math
 import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Called with every delivered packet and its arrival time (epoch seconds)
+Tap = Callable[[bytes, float], Any]
+
+
+@dataclass
+class GilbertElliott:
+    """
+    Two-state (good/bad) Markov burst-error model.
+
+    The channel switches state per transmitted bit with the given probabilities and
+    each state has its own bit error rate, producing clustered errors.
+    """
+
+    p_good_to_bad: float
+    p_bad_to_good: float
+    ber_good: float = 0.0
+    ber_bad: float = 0.5
+
+
+class Delivery(NamedTuple):
+    """
+    A packet that made it across the channel.
+    """
+
+    arrival_time: float
+    packet: bytes
+    send_index: int
+
+
+def _geometric(rng: random.Random, p: float) -> float:
+    """
+    Number of Bernoulli(p) trials up to and including the first success.
+
+    Returns ``math.inf`` when p is zero, so callers keep positions as floats.
+    """
+    if p <= 0.0:
+        return math.inf
+    if p >= 1.0:
+        return 1
+    return int(math.log(1.0 - rng.random()) / math.log(1.0 - p)) + 1
+
+
+def _bernoulli_positions(rng: random.Random, start: int, end: int, p: float) -> List[int]:
+    """
+    Positions in [start, end) hit by independent errors with probability p.
+
+    Gaps between errors are drawn from a geometric distribution, so the cost is
+    proportional to the number of errors rather than the number of bits.
+    """
+    positions: List[int] = []
+    if p <= 0.0:
+        return positions
+    pos: float = start - 1
+    while True:
+        pos += _geometric(rng, p)
+        if pos >= end:
+            return positions
+        positions.append(int(pos))
+
 
 class UplinkChannel:
     """
     Simulates the RF Uplink Channel.
-    Can introduce noise or packet loss if desired.
+    Can introduce packet loss, independent or bursty bit errors, latency, jitter and
+    the reordering that jitter causes.
+
+    A ``tap`` sees every packet that reaches the receiver, e.g. CaptureWriter.write
+    to record the uplink for later replay.
     """
 
-    def __init__(self, noise_level: float = 0.0):
+    def __init__(
+        self,
+        noise_level: float = 0.0,
+        bit_error_rate: float = 0.0,
+        burst: Optional[GilbertElliott] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: Optional[int] = None,
+        tap: Optional[Tap] = None,
+    ):
+        """
+        Args:
+            noise_level (float): Probability that a whole packet is lost.
+            bit_error_rate (float): Independent bit error probability (ignored when
+                ``burst`` is set).
+            burst (GilbertElliott): Burst error model; its state persists across packets.
+            latency (float): Fixed one-way delay in seconds (transmit_batch only).
+            jitter (float): Extra uniformly distributed delay in [0, jitter) seconds.
+            seed (int): Seed for a reproducible channel.
+            tap (Tap): Called with each delivered packet and its arrival time. For
+                transmit_batch the arrival time is the wall-clock time of the call
+                plus the packet's simulated delay relative to ``start_time``.
+        """
         self.noise_level = noise_level
+        self.bit_error_rate = bit_error_rate
+        self.burst = burst
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.tap = tap
+        self._bad_state = False
+
+        self.packets_sent = 0
+        self.packets_lost = 0
+        self.packets_corrupted = 0
+        self.bit_errors = 0
+
+    def _error_positions(self, nbits: int) -> List[int]:
+        """
+        Sorted bit positions in a stream of ``nbits`` bits that get flipped.
+        """
+        if self.burst is None:
+            return _bernoulli_positions(self.rng, 0, nbits, self.bit_error_rate)
+
+        positions: List[int] = []
+        pos = 0
+        while pos < nbits:
+            if self._bad_state:
+                leave, ber = self.burst.p_bad_to_good, self.burst.ber_bad
+            else:
+                leave, ber = self.burst.p_good_to_bad, self.burst.ber_good
+            run = _geometric(self.rng, leave)
+            end = int(min(nbits, pos + run))
+            positions.extend(_bernoulli_positions(self.rng, pos, end, ber))
+            if pos + run <= nbits:
+                self._bad_state = not self._bad_state
+            pos = end
+        return positions
+
+    def _corrupt(self, packets: Sequence[bytes]) -> List[bytes]:
+        """
+        Apply bit errors to a batch in one pass over the concatenated bitstream.
+        """
+        if self.burst is None and self.bit_error_rate <= 0.0:
+            return list(packets)
+
+        bit_starts = []
+        total_bits = 0
+        for packet in packets:
+            bit_starts.append(total_bits)
+            total_bits += len(packet) * 8
+
+        masks = [0] * len(packets)
+        positions = self._error_positions(total_bits)
+        for pos in positions:
+            i = bisect.bisect_right(bit_starts, pos) - 1
+            bit = pos - bit_starts[i]
+            # Bit 0 is the most significant bit of the first byte
+            masks[i] |= 1 << (len(packets[i]) * 8 - 1 - bit)
+        self.bit_errors += len(positions)
 
-    def transmit(self, packet: bytes) -> bytes:
+        received = []
+        for packet, mask in zip(packets, masks):
+            if mask:
+                self.packets_corrupted += 1
+                value = int.from_bytes(packet, "big") ^ mask
+                packet = value.to_bytes(len(packet), "big")
+            received.append(packet)
+        return received
+
+    def transmit(self, packet: bytes) -> Optional[bytes]:
         """
         Transmits the packet to the satellite.
 
@@ -23,10 +178,60 @@ class UplinkChannel:
         Returns:
             bytes: The received packet (potentially corrupted or None if lost).
         """
-        if random.random() < self.noise_level:
+        self.packets_sent += 1
+        if self.rng.random() < self.noise_level:
+            self.packets_lost += 1
             logger.warning("Packet lost in transmission due to noise.")
             return None
 
-        # In a real sim, we might bit-flip here.
-        # For now, perfect transmission.
-        return packet
+        received = self._corrupt([packet])[0]
+        if self.tap is not None:
+            self.tap(received, time.time())
+        return received
+
+    def transmit_batch(
+        self, packets: Sequence[bytes], start_time: float = 0.0, send_interval: float = 0.0
+    ) -> List[Delivery]:
+        """
+        Transmits a batch of packets and returns them in arrival order.
+
+        Packet i is sent at ``start_time + i * send_interval`` and arrives after
+        ``latency`` plus random jitter; when jitter exceeds the send interval,
+        packets overtake each other. Lost packets are omitted.
+
+        Args:
+            packets (Sequence[bytes]): Packets in send order.
+            start_time (float): Send time of the first packet.
+            send_interval (float): Time between consecutive sends.
+
+        Returns:
+            List[Delivery]: Received packets sorted by arrival time.
+        """
+        rng = self.rng
+        survivors = []
+        indices = []
+        for i, packet in enumerate(packets):
+            if rng.random() < self.noise_level:
+                continue
+            survivors.append(packet)
+            indices.append(i)
+
+        self.packets_sent += len(packets)
+        self.packets_lost += len(packets) - len(survivors)
+
+        deliveries = []
+        for index, packet in zip(indices, self._corrupt(survivors)):
+            arrival = start_time + index * send_interval + self.latency
+            if self.jitter > 0.0:
+                arrival += rng.random() * self.jitter
+            deliveries.append(Delivery(arrival, packet, index))
+        deliveries.sort(key=lambda d: (d.arrival_time, d.send_index))
+        if self.tap is not None:
+            origin = time.time() - start_time
+            for delivery in deliveries:
+                self.tap(delivery.packet, origin + delivery.arrival_time)
+
+        logger.debug(
+            "Transmitted batch of %d packets: %d lost", len(packets), len(packets) - len(survivors)
+        )
+        return deliveries
@@ -0,0 +1,94 @@
+"""
+Lightweight client for the satellite daemon.
+
+Only depends on the standard library so that short CLI commands which talk to a
+running daemon do not pay for importing the simulator itself.
+"""
+
+import json
+import os
+import socket
+from typing import Any, Dict, Optional
+
+DEFAULT_SOCKET = os.environ.get("SAT_DAEMON_SOCKET", "sat_daemon.sock")
+
+
+class DaemonError(Exception):
+    """
+    Raised by DaemonClient when the daemon rejects a request.
+    """
+
+
+class DaemonClient:
+    """
+    Minimal blocking client for SatelliteDaemon.
+
+    Keeps one connection open across requests.
+    """
+
+    def __init__(self, path: str = DEFAULT_SOCKET, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._file: Any = None
+
+    def _connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._file = sock.makefile("rwb")
+
+    def request(self, op: str, **params: Any) -> Dict[str, Any]:
+        """
+        Send one request and wait for its response.
+
+        Raises:
+            OSError: If the daemon cannot be reached.
+            DaemonError: If the daemon rejects the request.
+        """
+        if self._sock is None:
+            self._connect()
+        self._file.write(json.dumps({"op": op, **params}).encode() + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("Daemon closed the connection")
+        response: Dict[str, Any] = json.loads(line)
+        if not response.pop("ok", False):
+            raise DaemonError(response.get("error", "Request failed"))
+        return response
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def connect(path: str = DEFAULT_SOCKET) -> Optional[DaemonClient]:
+    """
+    Return a connected client if a daemon is listening on ``path``, else None.
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    client = DaemonClient(path)
+    try:
+        client.request("ping")
+    except (OSError, DaemonError):
+        client.close()
+        return None
+    return client
@@ -0,0 +1,275 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from satellite_sim.channel.uplink import UplinkChannel
+from satellite_sim.cli.client import DEFAULT_SOCKET
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from satellite_sim.satellite.event_store import (
+    EventStore,
+    MultiEventStore,
+    NDJSONEventStore,
+    SQLiteEventStore,
+)
+from satellite_sim.satellite.firewall import SpaceFirewall
+from satellite_sim.satellite.metrics import FirewallMetrics
+from satellite_sim.satellite.suppression import ViolationAggregator
+from satellite_sim.satellite.telemetry import TelemetrySystem
+
+logger = logging.getLogger(__name__)
+
+
+class SatelliteState:
+    """
+    Everything a CLI session needs: telemetry, firewall, uplink and both stations.
+
+    Used directly for one-shot CLI invocations and kept alive by the daemon so that
+    counters, the replay window and the legit station's sequence count persist
+    across sends.
+    """
+
+    def __init__(
+        self,
+        secret_key: bytes,
+        log_file: str = "telemetry.log",
+        events_file: str = "security_events.json",
+        uplink: Optional[UplinkChannel] = None,
+        apid: int = 0x100,
+        index_db: Optional[str] = "security_events.db",
+        instrument: bool = True,
+        violation_window: Optional[float] = 5.0,
+        buffered: bool = False,
+    ):
+        """
+        Args:
+            secret_key (bytes): Key shared by the legit station and the firewall.
+            log_file (str): Human-readable telemetry log.
+            events_file (str): JSON snapshot of this session's security events.
+            uplink (UplinkChannel): Channel to transmit over (a perfect one by default).
+            apid (int): APID used by both stations.
+            index_db (str): SQLite index that accumulates events across sessions
+                for `sat_cli query`. None disables it.
+            instrument (bool): Record per-stage firewall latencies for `sat_cli stats`.
+            violation_window (float): Collapse repeated identical violations into one
+                summary event per this many seconds. None reports every rejection.
+            buffered (bool): Write telemetry in batches from a background thread, so
+                the SQLite index commits one transaction per batch rather than per
+                event. Used by the long-running daemon.
+        """
+        event_store: EventStore = NDJSONEventStore(events_file)
+        if index_db is not None:
+            event_store = MultiEventStore([event_store, SQLiteEventStore(index_db)])
+        self.telemetry = TelemetrySystem(
+            log_file, events_file, event_store=event_store, buffered=buffered
+        )
+        self.violations = None
+        if violation_window is not None:
+            self.violations = ViolationAggregator(self.telemetry, window=violation_window)
+        self.firewall = SpaceFirewall(
+            secret_key,
+            self.telemetry,
+            metrics=FirewallMetrics() if instrument else None,
+            violations=self.violations,
+        )
+        self.uplink = uplink if uplink is not None else UplinkChannel()
+        self.legit = LegitGroundStation(apid=apid, secret_key=secret_key)
+        self.rogue = RogueGroundStation(apid=apid)
+
+    def send(self, station: str, cmd: str, attack_type: str = "BAD_SIGNATURE") -> Dict[str, Any]:
+        """
+        Build a packet at the given station, transmit it and run it through the firewall.
+
+        Args:
+            station (str): 'legit' or 'rogue'.
+            cmd (str): Command string to send.
+            attack_type (str): Attack type for the rogue station.
+
+        Returns:
+            Dict[str, Any]: Whether the packet arrived, its verdict and the running counters.
+
+        Raises:
+            ValueError: If the station type is unknown.
+        """
+        station = station.lower()
+        if station == "legit":
+            packet = self.legit.create_command(cmd)
+        elif station == "rogue":
+            packet = self.rogue.create_attack_packet(cmd, attack_type=attack_type)
+        else:
+            raise ValueError(f"Unknown station type: {station!r}")
+
+        received = self.uplink.transmit(packet)
+        verdict = None
+        if received is not None:
+            verdict = self.firewall.process_packet(received).name
+        return {
+            "delivered": received is not None,
+            "verdict": verdict,
+            "accepted": self.firewall.accepted_commands,
+            "rejected": self.firewall.rejected_commands,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Running firewall, channel and telemetry counters, plus per-stage latency
+        histograms when instrumentation is enabled.
+        """
+        return {
+            **self.firewall.metrics_snapshot(),
+            "packets_sent": self.uplink.packets_sent,
+            "packets_lost": self.uplink.packets_lost,
+            "telemetry": self.telemetry.get_summary(),
+        }
+
+    def report(
+        self,
+        limit: Optional[int] = None,
+        severities: Optional[List[str]] = None,
+        event_types: Optional[List[str]] = None,
+        summary_only: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Retained security events plus the telemetry summary.
+
+        Args:
+            limit (int): Only return the most recent N matching events.
+            severities (List[str]): Only return events with these severities.
+            event_types (List[str]): Only return events of these types.
+            summary_only (bool): Skip the events and return just the aggregates.
+
+        Returns:
+            Dict[str, Any]: ``events`` (oldest first) and ``summary``.
+        """
+        if self.violations is not None:
+            self.violations.flush(self.violations.clock())
+        self.telemetry.flush()
+        summary = self.telemetry.get_summary()
+        if summary_only:
+            return {"events": [], "summary": summary}
+
+        wanted_severities = {s.upper() for s in severities} if severities else None
+        wanted_types = {t.upper() for t in event_types} if event_types else None
+        events = [
+            e
+            for e in self.telemetry.events
+            if (wanted_severities is None or e.severity in wanted_severities)
+            and (wanted_types is None or e.event_type in wanted_types)
+        ]
+        if limit is not None:
+            events = events[-limit:] if limit > 0 else []
+        return {"events": [e.to_dict() for e in events], "summary": summary}
+
+    def close(self) -> None:
+        if self.violations is not None:
+            self.violations.flush()
+        self.telemetry.close()
+
+
+class SatelliteDaemon:
+    """
+    Serves a SatelliteState over a local Unix socket.
+
+    The protocol is one JSON object per line in each direction. Requests carry an
+    ``op`` ('send', 'stats', 'report', 'ping' or 'shutdown') plus its arguments;
+    responses carry ``ok`` and either the result or an ``error`` message. Requests
+    are handled one at a time on the event loop, so the firewall is never shared
+    between threads.
+    """
+
+    def __init__(self, state: SatelliteState, path: str = DEFAULT_SOCKET):
+        self.state = state
+        self.path = path
+        self.requests_handled = 0
+        self._stop: Optional[asyncio.Event] = None
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Dispatch a single decoded request.
+        """
+        op = request.get("op")
+        try:
+            if op == "send":
+                result = self.state.send(
+                    request["station"], request["cmd"], request.get("attack_type", "BAD_SIGNATURE")
+                )
+            elif op == "stats":
+                result = self.state.stats()
+            elif op == "report":
+                result = self.state.report(
+                    limit=request.get("limit"),
+                    severities=request.get("severities"),
+                    event_types=request.get("event_types"),
+                    summary_only=request.get("summary_only", False),
+                )
+            elif op == "ping":
+                result = {"pid": os.getpid()}
+            elif op == "shutdown":
+                if self._stop is not None:
+                    self._stop.set()
+                result = {}
+            else:
+                return {"ok": False, "error": f"Unknown op: {op!r}"}
+        except Exception as e:
+            # Malformed parameters surface as any exception type (a TypeError from
+            # a wrong-typed field, say); report them rather than drop the connection
+            return {"ok": False, "error": f"Bad {op} request: {e}"}
+        self.requests_handled += 1
+        return {"ok": True, **result}
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = self.handle(json.loads(line))
+                except json.JSONDecodeError:
+                    response = {"ok": False, "error": "Malformed request"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+                if self._stop is not None and self._stop.is_set():
+                    # Don't leave this handler parked on readline() while the loop shuts down
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, ready: Optional[asyncio.Event] = None) -> None:
+        """
+        Serve until a 'shutdown' request arrives, then close the state.
+
+        Args:
+            ready (asyncio.Event): Set once the socket is listening.
+        """
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._stop = asyncio.Event()
+        server = await asyncio.start_unix_server(self._handle_client, self.path)
+        logger.info("Satellite daemon listening on %s", self.path)
+        if ready is not None:
+            ready.set()
+        try:
+            await self._stop.wait()
+        finally:
+            server.close()
+            await server.wait_closed()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self.state.close()
+            logger.info("Satellite daemon stopped after %d requests", self.requests_handled)
+
+    def run(self) -> None:
+        """
+        Serve in the foreground (blocking) until shut down or interrupted.
+        """
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
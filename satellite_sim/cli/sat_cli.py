@@ -1,13 +1,16 @@
+import atexit
 import typer
 import logging
 import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 from rich.console import Console
-from rich.table import Table
-from satellite_sim.ground_station.legit import LegitGroundStation
-from satellite_sim.ground_station.rogue import RogueGroundStation
-from satellite_sim.satellite.firewall import SpaceFirewall
-from satellite_sim.satellite.telemetry import TelemetrySystem
-from satellite_sim.channel.uplink import UplinkChannel
+from satellite_sim.cli import client as daemon_client
+
+if TYPE_CHECKING:
+    from satellite_sim.cli.daemon import SatelliteState
+
+# The simulator itself (and rich.table) is imported inside the commands that need
+# it, so `--help`, `watch-telemetry` and daemon-backed commands start quickly.
 
 # Configure logging
 logging.basicConfig(
@@ -20,10 +23,25 @@ console = Console()
 # Shared Secret for the simulation
 SHARED_SECRET = b"TOP_SECRET_SATELLITE_KEY_2024"
 
-# Initialize components (Global state for simple CLI simulation)
-telemetry = TelemetrySystem()
-firewall = SpaceFirewall(SHARED_SECRET, telemetry)
-uplink = UplinkChannel()
+# Components are built on first use so that talking to a running daemon does not
+# truncate the log files the daemon is writing to.
+_state: Optional["SatelliteState"] = None
+
+
+def get_state() -> "SatelliteState":
+    """
+    In-process satellite state for commands run without a daemon.
+    """
+    global _state
+    if _state is None:
+        from satellite_sim.cli.daemon import SatelliteState
+
+        _state = SatelliteState(SHARED_SECRET)
+        atexit.register(_state.close)
+    return _state
+
+
+SOCKET_OPTION = typer.Option(daemon_client.DEFAULT_SOCKET, help="Satellite daemon socket path")
 
 
 @app.command()
@@ -33,76 +51,493 @@ def send(
     attack_type: str = typer.Option(
         "BAD_SIGNATURE", help="Attack type for rogue station (BAD_SIGNATURE, NO_SIGNATURE)"
     ),
-):
+    socket: str = SOCKET_OPTION,
+) -> None:
     """
     Send a command to the satellite from a Ground Station.
     """
     console.print("[bold blue]Initiating Uplink Transmission...[/bold blue]")
 
-    packet = None
-
     if station.lower() == "legit":
-        gs = LegitGroundStation(apid=0x100, secret_key=SHARED_SECRET)
-        packet = gs.create_command(cmd)
         console.print(f"[green]Legit Station[/green] sending: '{cmd}'")
-
     elif station.lower() == "rogue":
-        rogue = RogueGroundStation(apid=0x100)
-        packet = rogue.create_attack_packet(cmd, attack_type=attack_type)
         console.print(f"[red]Rogue Station[/red] attacking with: '{cmd}' (Type: {attack_type})")
-
     else:
         console.print("[bold red]Unknown station type![/bold red]")
         return
 
-    # Transmit
-    received_packet = uplink.transmit(packet)
+    client = daemon_client.connect(socket)
+    if client is not None:
+        with client:
+            result = client.request("send", station=station, cmd=cmd, attack_type=attack_type)
+    else:
+        result = get_state().send(station, cmd, attack_type)
 
-    if received_packet:
+    if result["delivered"]:
         console.print("[italic]Packet received by satellite... processing...[/italic]")
-        firewall.process_packet(received_packet)
         console.print("[bold]Transmission Complete.[/bold]")
-        console.print(
-            f"\n✅ Accepted: {firewall.accepted_commands} | ❌ Rejected: {firewall.rejected_commands}"
-        )
+        console.print(f"\n✅ Accepted: {result['accepted']} | ❌ Rejected: {result['rejected']}")
     else:
         console.print("[bold red]Transmission Failed (Signal Lost).[/bold red]")
 
 
 @app.command()
-def watch_telemetry():
+def simulate(
+    packets: int = typer.Option(10000, help="Number of packets to send"),
+    attack_ratio: float = typer.Option(0.3, help="Fraction of packets from the rogue station"),
+    batch_size: int = typer.Option(256, help="Packets per pipeline batch"),
+    bit_error_rate: float = typer.Option(0.0, help="Uplink bit error rate"),
+    loss: float = typer.Option(0.0, help="Uplink packet loss probability"),
+    seed: int = typer.Option(0, help="Seed for traffic mix and channel"),
+    capture: Optional[str] = typer.Option(
+        None, help="Record the packets the satellite receives to this capture file"
+    ),
+) -> None:
+    """
+    Stream a mixed legit/attack scenario through the channel and firewall.
+    """
+    from rich.table import Table
+    from satellite_sim.channel.capture import CaptureWriter
+    from satellite_sim.channel.uplink import UplinkChannel
+    from satellite_sim.ground_station.legit import LegitGroundStation
+    from satellite_sim.ground_station.rogue import RogueGroundStation
+    from satellite_sim.pipeline.streaming import StreamingPipeline, mixed_traffic
+    from satellite_sim.satellite.suppression import install_log_suppression
+
+    install_log_suppression()
+    source = mixed_traffic(
+        LegitGroundStation(apid=0x100, secret_key=SHARED_SECRET),
+        RogueGroundStation(apid=0x100),
+        count=packets,
+        attack_ratio=attack_ratio,
+        seed=seed,
+    )
+    writer = CaptureWriter(capture) if capture else None
+    channel = UplinkChannel(
+        noise_level=loss,
+        bit_error_rate=bit_error_rate,
+        seed=seed,
+        tap=writer.write if writer is not None else None,
+    )
+    firewall = get_state().firewall
+    try:
+        report = StreamingPipeline(source, firewall, channel, batch_size=batch_size).run()
+    finally:
+        if writer is not None:
+            writer.close()
+
+    table = Table(title="Pipeline Stages")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Packets", justify="right")
+    table.add_column("Busy (s)", justify="right")
+    table.add_column("Mean batch latency (ms)", justify="right")
+    table.add_column("Packets/s", justify="right")
+    for stage in report.stages:
+        table.add_row(
+            stage.name,
+            str(stage.items),
+            f"{stage.busy_time:.3f}",
+            f"{stage.mean_batch_latency * 1000:.2f}",
+            f"{stage.items_per_second:.0f}",
+        )
+    console.print(table)
+    console.print(
+        f"Sent {report.packets_sent} | Received {report.packets_received} | "
+        f"✅ Accepted: {report.accepted} | ❌ Rejected: {report.rejected} {report.reasons}"
+    )
+    console.print(
+        f"[bold green]End-to-end: {report.packets_per_second:.0f} packets/s "
+        f"in {report.elapsed:.2f}s[/bold green]"
+    )
+    if writer is not None:
+        console.print(f"Captured {len(writer)} packets to {capture}")
+
+
+@app.command()
+def replay(
+    capture: str = typer.Argument(..., help="Capture file written by `simulate --capture`"),
+    pace: bool = typer.Option(False, "--pace", help="Reproduce the captured arrival times"),
+    speed: float = typer.Option(1.0, help="Time compression for --pace (2.0 = twice as fast)"),
+    batch_size: int = typer.Option(1024, help="Maximum packets per firewall batch"),
+    current_time: bool = typer.Option(
+        False, "--current-time", help="Check freshness against now, not the capture times"
+    ),
+) -> None:
+    """
+    Replay a capture file through the firewall, at full speed or original pacing.
+    """
+    if not speed > 0:
+        raise typer.BadParameter(f"must be positive, got {speed}", param_hint="--speed")
+    if batch_size < 1:
+        raise typer.BadParameter(f"must be at least 1, got {batch_size}", param_hint="--batch-size")
+
+    from satellite_sim.channel.capture import CaptureReader
+    from satellite_sim.satellite.suppression import install_log_suppression
+
+    try:
+        reader = CaptureReader(capture)
+    except (OSError, ValueError) as e:
+        raise typer.BadParameter(str(e))
+    install_log_suppression()
+    with reader:
+        console.print(f"Replaying {len(reader)} packets from {capture}...")
+        report = reader.replay(
+            get_state().firewall,
+            batch_size=batch_size,
+            pace=pace,
+            speed=speed,
+            recorded_time=not current_time,
+        )
+    console.print(
+        f"Replayed {report.packets} in {report.batches} batches | "
+        f"✅ Accepted: {report.accepted} | ❌ Rejected: {report.rejected} {report.reasons}"
+    )
+    console.print(
+        f"[bold green]{report.packets_per_second:.0f} packets/s "
+        f"in {report.elapsed:.2f}s[/bold green]"
+    )
+
+
+@app.command()
+def watch_telemetry(
+    tail: Optional[int] = typer.Option(None, help="Only show the last N matching entries"),
+    follow: bool = typer.Option(False, "--follow", "-f", help="Keep printing new entries"),
+    since: Optional[str] = typer.Option(
+        None, help="Only entries newer than this (e.g. 15m, 2h, an ISO time or epoch)"
+    ),
+    severity: Optional[List[str]] = typer.Option(None, help="Only these severities"),
+    event_type: Optional[List[str]] = typer.Option(None, help="Only these event types"),
+    log_file: str = typer.Option("telemetry.log", help="Telemetry log to read"),
+) -> None:
     """
     View the latest telemetry logs.
+
+    The log is streamed line by line (or scanned backwards for --tail), so memory use
+    does not grow with the size of the file.
     """
+    from satellite_sim.satellite import telemetry_log
+
     console.print("[bold cyan]--- SATELLITE TELEMETRY LOG ---[/bold cyan]")
 
-    if os.path.exists("telemetry.log"):
-        with open("telemetry.log", "r") as f:
-            console.print(f.read())
-    else:
+    if not os.path.exists(log_file):
         console.print("No telemetry log found.")
+        return
+
+    try:
+        since_ts = telemetry_log.parse_since(since) if since else None
+    except ValueError:
+        raise typer.BadParameter(f"Cannot parse --since value {since!r}")
+    log_filter = telemetry_log.LogFilter(severity, event_type, since_ts)
+
+    if tail is not None:
+        _print_log_entries(telemetry_log.tail_entries(log_file, tail, log_filter))
+    elif not follow:
+        _print_log_entries(telemetry_log.iter_entries(log_file, log_filter))
+
+    if follow:
+        # Anything requested with --tail is already printed; only new entries from here on
+        try:
+            _print_log_entries(telemetry_log.follow_entries(log_file, log_filter))
+        except KeyboardInterrupt:
+            pass
+
+
+def _print_log_entries(entries: Iterable[Any]) -> None:
+    for entry in entries:
+        console.print(entry.line, markup=False, highlight=False, soft_wrap=True)
+
+
+def _print_summary(summary: Dict[str, Any]) -> None:
+    if summary["dropped_events"]:
+        console.print(
+            f"[yellow]Showing the {summary['retained_events']} most recent of "
+            f"{summary['total_events']} events.[/yellow]"
+        )
+    for event_type, count in sorted(summary["by_type"].items()):
+        console.print(f"  {event_type}: {count}")
+    for severity, count in sorted(summary["by_severity"].items()):
+        console.print(f"  {severity}: {count}")
+    console.print(
+        f"[bold green]Report exported with {summary['total_events']} events.[/bold green]"
+    )
+
+
+def _journal_report(
+    journal: str,
+    limit: Optional[int],
+    severities: Optional[List[str]],
+    event_types: Optional[List[str]],
+) -> Dict[str, Any]:
+    """
+    Build the same report as SatelliteState.report() from the event journal on disk,
+    in one streaming pass and without opening the journal for writing.
+    """
+    from collections import Counter, deque
+
+    from satellite_sim.satellite.event_store import iter_journal
+
+    wanted_severities = {s.upper() for s in severities} if severities else None
+    wanted_types = {t.upper() for t in event_types} if event_types else None
+    if limit is not None and limit <= 0:
+        limit = 0
+    events: "deque[Dict[str, Any]]" = deque(maxlen=limit)
+    by_type: "Counter[str]" = Counter()
+    by_severity: "Counter[str]" = Counter()
+    for event in iter_journal(journal):
+        by_type[event["event_type"]] += 1
+        by_severity[event["severity"]] += 1
+        if (wanted_severities is None or event["severity"] in wanted_severities) and (
+            wanted_types is None or event["event_type"] in wanted_types
+        ):
+            events.append(event)
+    total = sum(by_type.values())
+    summary = {
+        "total_events": total,
+        "retained_events": total,
+        "dropped_events": 0,
+        "by_type": dict(by_type),
+        "by_severity": dict(by_severity),
+    }
+    return {"events": list(events), "summary": summary}
 
 
 @app.command()
-def export_report():
+def export_report(
+    socket: str = SOCKET_OPTION,
+    summary_only: bool = typer.Option(
+        False, "--summary-only", help="Print only aggregate counts, not individual events"
+    ),
+    limit: Optional[int] = typer.Option(None, help="Only list the most recent N events"),
+    severity: Optional[List[str]] = typer.Option(None, help="Only list these severities"),
+    event_type: Optional[List[str]] = typer.Option(None, help="Only list these event types"),
+    log_file: str = typer.Option("telemetry.log", help="Log to summarize when no daemon runs"),
+    journal: str = typer.Option(
+        "security_events.ndjson", help="Event journal to report from when no daemon runs"
+    ),
+) -> None:
     """
     Export a security report summary.
+
+    Without a running daemon the report is read from the files the last session
+    left on disk; they are never reopened for writing.
+    """
+    from rich.table import Table
+
+    client = daemon_client.connect(socket)
+    if client is None and summary_only:
+        # No live satellite: aggregate the log on disk in a single streaming pass
+        from satellite_sim.satellite import telemetry_log
+
+        if not os.path.exists(log_file):
+            console.print("No telemetry log found.")
+            return
+        _print_summary(telemetry_log.summarize_entries(telemetry_log.iter_entries(log_file)))
+        return
+
+    params: Dict[str, Any] = dict(
+        limit=limit, severities=severity, event_types=event_type, summary_only=summary_only
+    )
+    if client is not None:
+        with client:
+            report: Dict[str, Any] = client.request("report", **params)
+    elif os.path.exists(journal):
+        report = _journal_report(journal, limit, severity, event_type)
+    else:
+        console.print("No security event journal found.")
+        return
+
+    if not summary_only:
+        table = Table(title="Security Events Report")
+        table.add_column("Timestamp", justify="right", style="cyan", no_wrap=True)
+        table.add_column("Severity", style="magenta")
+        table.add_column("Event Type", style="green")
+        table.add_column("Details", style="white")
+
+        for event in report["events"]:
+            table.add_row(
+                str(event["timestamp"]),
+                event["severity"],
+                event["event_type"],
+                str(event["details"]),
+            )
+
+        console.print(table)
+
+    _print_summary(report["summary"])
+
+
+@app.command()
+def query(
+    since: Optional[str] = typer.Option(
+        None, help="Start of range (e.g. 1h, an ISO time or epoch)"
+    ),
+    until: Optional[str] = typer.Option(None, help="End of range (same formats as --since)"),
+    severity: Optional[List[str]] = typer.Option(None, help="Only these severities"),
+    event_type: Optional[List[str]] = typer.Option(None, help="Only these event types"),
+    apid: Optional[List[int]] = typer.Option(None, help="Only these APIDs"),
+    group_by: Optional[str] = typer.Option(
+        None, help="Count per event_type, severity or apid instead of listing events"
+    ),
+    limit: int = typer.Option(50, help="Maximum events to list"),
+    db: str = typer.Option("security_events.db", help="Event index database"),
+) -> None:
+    """
+    Query historical security events from the indexed event store.
+    """
+    from rich.table import Table
+    from satellite_sim.satellite.event_store import SQLiteEventStore
+    from satellite_sim.satellite.telemetry_log import parse_since
+
+    if not os.path.exists(db):
+        console.print("No event index found.")
+        return
+    try:
+        since_ts = parse_since(since) if since else None
+        until_ts = parse_since(until) if until else None
+    except ValueError:
+        raise typer.BadParameter("Cannot parse --since/--until")
+    filters: Dict[str, Any] = dict(
+        since=since_ts, until=until_ts, severities=severity, event_types=event_type, apids=apid
+    )
+
+    store = SQLiteEventStore(db)
+    try:
+        if group_by is not None:
+            try:
+                counts = store.count(group_by=group_by, **filters)
+            except ValueError as e:
+                raise typer.BadParameter(str(e))
+            table = Table(title=f"Security Events by {group_by}")
+            table.add_column(group_by, style="cyan")
+            table.add_column("Events", justify="right")
+            for key, count in sorted(counts.items(), key=lambda item: -item[1]):
+                table.add_row(str(key), str(count))
+        else:
+            table = Table(title="Security Events")
+            table.add_column("Timestamp", justify="right", style="cyan", no_wrap=True)
+            table.add_column("Severity", style="magenta")
+            table.add_column("Event Type", style="green")
+            table.add_column("Details", style="white")
+            for event in store.query(limit=limit, **filters):
+                table.add_row(
+                    str(event["timestamp"]),
+                    event["severity"],
+                    event["event_type"],
+                    str(event["details"]),
+                )
+    finally:
+        store.close()
+    console.print(table)
+
+
+@app.command("daemon")
+def run_daemon(
+    socket: str = SOCKET_OPTION,
+    metrics_port: Optional[int] = typer.Option(
+        None, help="Also serve Prometheus metrics on http://127.0.0.1:PORT/metrics"
+    ),
+) -> None:
+    """
+    Run the satellite as a long-lived daemon that `send` and `export-report` talk to.
+    """
+    client = daemon_client.connect(socket)
+    if client is not None:
+        # Starting a second daemon would truncate the running one's telemetry files
+        client.close()
+        console.print(f"[bold red]A satellite daemon is already running on {socket}[/bold red]")
+        raise typer.Exit(code=1)
+
+    from satellite_sim.cli.daemon import SatelliteDaemon, SatelliteState
+    from satellite_sim.satellite.metrics import MetricsServer, render_prometheus
+    from satellite_sim.satellite.suppression import install_log_suppression
+
+    # An attack against the daemon must not turn into a log storm
+    install_log_suppression()
+    # Buffered, so the event index gets one transaction per batch of events;
+    # SatelliteDaemon closes the state (flushing the queue) when it stops
+    state = SatelliteState(SHARED_SECRET, buffered=True)
+    server = None
+    if metrics_port is not None:
+        server = MetricsServer(
+            lambda: render_prometheus(state.firewall.metrics_snapshot()), port=metrics_port
+        ).start()
+        host, port = server.address
+        console.print(f"[bold blue]Metrics at http://{host}:{port}/metrics[/bold blue]")
+
+    console.print(f"[bold blue]Satellite daemon listening on {socket}[/bold blue]")
+    try:
+        SatelliteDaemon(state, socket).run()
+    finally:
+        if server is not None:
+            server.close()
+
+
+@app.command()
+def stats(
+    socket: str = SOCKET_OPTION,
+    prometheus: bool = typer.Option(False, "--prometheus", help="Print in Prometheus text format"),
+) -> None:
+    """
+    Show firewall counters and per-stage latencies from the running daemon.
     """
-    events = telemetry.get_all_events()
+    client = daemon_client.connect(socket)
+    if client is None:
+        console.print("No satellite daemon running.")
+        return
+    with client:
+        snapshot = client.request("stats")
+
+    if prometheus:
+        from satellite_sim.satellite.metrics import render_prometheus
+
+        typer.echo(render_prometheus(snapshot), nl=False)
+        return
 
-    table = Table(title="Security Events Report")
-    table.add_column("Timestamp", justify="right", style="cyan", no_wrap=True)
-    table.add_column("Severity", style="magenta")
-    table.add_column("Event Type", style="green")
-    table.add_column("Details", style="white")
+    from rich.table import Table
 
-    for event in events:
+    console.print(
+        f"✅ Accepted: {snapshot['accepted']} | ❌ Rejected: {snapshot['rejected']} | "
+        f"HMAC checks: {snapshot['hmac_verifications']}"
+    )
+    metrics = snapshot.get("metrics")
+    if not metrics:
+        console.print("Latency instrumentation is disabled.")
+        return
+
+    table = Table(title="Firewall Stage Latency")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Mean (us)", justify="right")
+    table.add_column("p50 <= (us)", justify="right")
+    table.add_column("p99 <= (us)", justify="right")
+    for stage, hist in metrics["stages"].items():
         table.add_row(
-            str(event["timestamp"]), event["severity"], event["event_type"], str(event["details"])
+            stage,
+            str(hist["count"]),
+            f"{hist['mean'] * 1e6:.1f}",
+            f"{hist['p50'] * 1e6:g}",
+            f"{hist['p99'] * 1e6:g}",
         )
-
     console.print(table)
-    console.print(f"[bold green]Report exported with {len(events)} events.[/bold green]")
+    for verdict, count in sorted(metrics["verdicts"].items()):
+        console.print(f"  {verdict}: {count}")
+
+
+@app.command()
+def stop_daemon(socket: str = SOCKET_OPTION) -> None:
+    """
+    Shut down a running satellite daemon.
+    """
+    client = daemon_client.connect(socket)
+    if client is None:
+        console.print("No satellite daemon running.")
+        return
+    with client:
+        final_stats = client.request("stats")
+        client.request("shutdown")
+    console.print(
+        f"Daemon stopped. ✅ Accepted: {final_stats['accepted']} | ❌ Rejected: {final_stats['rejected']}"
+    )
 
 
 if __name__ == "__main__":
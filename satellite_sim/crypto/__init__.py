@@ -2,7 +2,22 @@
 Cryptographic modules for HMAC-SHA256 signing and verification.
 """
 
-from satellite_sim.crypto.hmac_signer import HMACSigner
-from satellite_sim.crypto.verifier import HMACVerifier
+from typing import TYPE_CHECKING
 
-__all__ = ["HMACSigner", "HMACVerifier"]
+from satellite_sim._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from satellite_sim.crypto.hmac_signer import HMACSigner
+    from satellite_sim.crypto.keyring import KeyEntry, Keyring
+    from satellite_sim.crypto.verifier import HMACVerifier
+
+_EXPORTS = {
+    "HMACSigner": "satellite_sim.crypto.hmac_signer",
+    "HMACVerifier": "satellite_sim.crypto.verifier",
+    "Keyring": "satellite_sim.crypto.keyring",
+    "KeyEntry": "satellite_sim.crypto.keyring",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
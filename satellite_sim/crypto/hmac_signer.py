@@ -1,6 +1,7 @@
 import hmac
 import hashlib
 import logging
+from typing import Any, Dict, Union
 
 logger = logging.getLogger(__name__)
 
@@ -8,18 +9,45 @@ logger = logging.getLogger(__name__)
 class HMACSigner:
     """
     Handles HMAC-SHA256 signing of data.
+
+    The keyed HMAC state (inner/outer padded key) is computed once at construction
+    and copied for each message, which is noticeably cheaper than ``hmac.new`` for
+    the short packets we sign.
     """
 
-    def __init__(self, secret_key: bytes):
+    def __init__(self, secret_key: bytes, one_shot: bool = False):
         """
         Initialize the signer with a secret key.
 
         Args:
             secret_key (bytes): The shared secret key for signing.
+            one_shot (bool): Use ``hmac.digest`` per message instead of copying the
+                pre-keyed context.
         """
         self.secret_key = secret_key
+        self.one_shot = one_shot
+        self._keyed = hmac.new(secret_key, digestmod=hashlib.sha256)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_keyed"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._keyed = hmac.new(self.secret_key, digestmod=hashlib.sha256)
+
+    def digest(self, data: Union[bytes, memoryview]) -> bytes:
+        """
+        Compute the raw HMAC-SHA256 of data, without logging.
+        """
+        if self.one_shot:
+            return hmac.digest(self.secret_key, data, "sha256")
+        h = self._keyed.copy()
+        h.update(data)
+        return h.digest()
 
-    def sign(self, data: bytes) -> bytes:
+    def sign(self, data: Union[bytes, memoryview]) -> bytes:
         """
         Compute the HMAC-SHA256 signature for the given data.
 
@@ -29,6 +57,9 @@ class HMACSigner:
         Returns:
             bytes: The computed HMAC signature.
         """
-        signature = hmac.new(self.secret_key, data, hashlib.sha256).digest()
-        logger.debug(f"Signed data of length {len(data)} with signature {signature.hex()[:8]}...")
+        signature = self.digest(data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Signed data of length %d with signature %s...", len(data), signature.hex()[:8]
+            )
         return signature
@@ -0,0 +1,159 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from satellite_sim.crypto.hmac_signer import HMACSigner
+from satellite_sim.crypto.verifier import HMACVerifier
+
+# Key IDs travel as an unsigned 16-bit field in the secondary header
+MAX_KEY_ID = 0xFFFF
+
+
+@dataclass
+class KeyEntry:
+    """
+    One key in a Keyring with its validity window and pre-keyed verifier.
+    """
+
+    key_id: int
+    verifier: HMACVerifier
+    not_before: float = -math.inf
+    not_after: float = math.inf
+    station_id: Optional[str] = None
+
+    @property
+    def secret_key(self) -> bytes:
+        return self.verifier.secret_key
+
+    def valid_at(self, when: float) -> bool:
+        return self.not_before <= when <= self.not_after
+
+    def signer(self) -> HMACSigner:
+        """
+        A signer for this key (e.g. for the ground station that owns it).
+        """
+        return HMACSigner(self.secret_key)
+
+
+class Keyring:
+    """
+    HMAC keys indexed by the key ID carried in each packet's secondary header.
+
+    Every key gets its own pre-keyed HMACVerifier when it is added, so looking up
+    the key for a packet is a single dict access and verification costs the same
+    however many stations and keys are configured.
+
+    Keys have an optional validity window. To rotate a key, add its successor and
+    let the two windows overlap so packets signed just before the switch still
+    verify; see rotate().
+
+    ``version`` increases on every change made through the keyring's methods, so
+    copies held elsewhere (e.g. by ParallelFirewall workers) can tell they are stale.
+    """
+
+    def __init__(self) -> None:
+        self._keys: Dict[int, KeyEntry] = {}
+        self.version = 0
+
+    def add(
+        self,
+        key_id: int,
+        secret_key: bytes,
+        not_before: Optional[float] = None,
+        not_after: Optional[float] = None,
+        station_id: Optional[str] = None,
+    ) -> KeyEntry:
+        """
+        Register a key.
+
+        Args:
+            key_id (int): Identifier carried in packets (0-65535).
+            secret_key (bytes): The HMAC key.
+            not_before (float): Epoch time the key becomes valid. Defaults to always.
+            not_after (float): Epoch time the key expires. Defaults to never.
+            station_id (str): Ground station the key is issued to, for bookkeeping.
+
+        Returns:
+            KeyEntry: The new entry.
+
+        Raises:
+            ValueError: If the ID is out of range or already in use.
+        """
+        if not 0 <= key_id <= MAX_KEY_ID:
+            raise ValueError(f"Key ID must be between 0 and {MAX_KEY_ID}, got {key_id}")
+        if key_id in self._keys:
+            raise ValueError(f"Key ID {key_id} is already in the keyring")
+        entry = KeyEntry(
+            key_id,
+            HMACVerifier(secret_key),
+            -math.inf if not_before is None else not_before,
+            math.inf if not_after is None else not_after,
+            station_id,
+        )
+        self._keys[key_id] = entry
+        self.version += 1
+        return entry
+
+    def get(self, key_id: int) -> Optional[KeyEntry]:
+        return self._keys.get(key_id)
+
+    def remove(self, key_id: int) -> None:
+        if self._keys.pop(key_id, None) is not None:
+            self.version += 1
+
+    def retire(self, key_id: int, at: Optional[float] = None) -> None:
+        """
+        End a key's validity at ``at`` (now by default).
+
+        Raises:
+            KeyError: If the key is not in the keyring.
+        """
+        self._keys[key_id].not_after = time.time() if at is None else at
+        self.version += 1
+
+    def rotate(
+        self,
+        old_id: int,
+        new_id: int,
+        secret_key: bytes,
+        overlap: float = 60.0,
+        now: Optional[float] = None,
+    ) -> KeyEntry:
+        """
+        Replace a key with a new one, keeping both valid for ``overlap`` seconds.
+
+        The new key inherits the old key's station.
+
+        Args:
+            old_id (int): Key being replaced.
+            new_id (int): ID of the replacement key.
+            secret_key (bytes): The replacement key.
+            overlap (float): Seconds during which both keys are accepted.
+            now (float): Rotation time. Defaults to now.
+
+        Returns:
+            KeyEntry: The new entry.
+        """
+        now = time.time() if now is None else now
+        old = self._keys[old_id]
+        entry = self.add(new_id, secret_key, not_before=now, station_id=old.station_id)
+        old.not_after = min(old.not_after, now + overlap)
+        self.version += 1
+        return entry
+
+    def active(self, now: Optional[float] = None) -> List[KeyEntry]:
+        """
+        Keys valid at ``now`` (defaults to the current time).
+        """
+        now = time.time() if now is None else now
+        return [entry for entry in self._keys.values() if entry.valid_at(now)]
+
+    def __contains__(self, key_id: object) -> bool:
+        return key_id in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[KeyEntry]:
+        return iter(list(self._keys.values()))
@@ -1,6 +1,7 @@
 import hmac
 import hashlib
 import logging
+from typing import Any, Dict, Union
 
 logger = logging.getLogger(__name__)
 
@@ -8,36 +9,67 @@ logger = logging.getLogger(__name__)
 class HMACVerifier:
     """
     Handles validation of HMAC-SHA256 signatures.
+
+    Like HMACSigner, the keyed HMAC state is precomputed once and copied per message.
     """
 
-    def __init__(self, secret_key: bytes):
+    def __init__(self, secret_key: bytes, one_shot: bool = False):
         """
         Initialize the verifier with a secret key.
 
         Args:
             secret_key (bytes): The shared secret key for verification.
+            one_shot (bool): Use ``hmac.digest`` per message instead of copying the
+                pre-keyed context.
         """
         self.secret_key = secret_key
+        self.one_shot = one_shot
+        self._keyed = hmac.new(secret_key, digestmod=hashlib.sha256)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # HMAC objects cannot be pickled; rebuild the keyed context on load.
+        state = self.__dict__.copy()
+        del state["_keyed"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._keyed = hmac.new(self.secret_key, digestmod=hashlib.sha256)
+
+    def digest(self, data: Union[bytes, memoryview]) -> bytes:
+        """
+        Compute the expected HMAC-SHA256 of data.
+        """
+        if self.one_shot:
+            return hmac.digest(self.secret_key, data, "sha256")
+        h = self._keyed.copy()
+        h.update(data)
+        return h.digest()
 
-    def verify(self, data: bytes, received_signature: bytes) -> bool:
+    def verify(
+        self, data: Union[bytes, memoryview], received_signature: Union[bytes, memoryview]
+    ) -> bool:
         """
         Verify the HMAC-SHA256 signature for the given data.
 
         Args:
-            data (bytes): The data that was signed.
+            data (bytes): The data that was signed (any bytes-like object).
             received_signature (bytes): The signature to verify.
 
         Returns:
             bool: True if the signature is valid, False otherwise.
         """
-        expected_signature = hmac.new(self.secret_key, data, hashlib.sha256).digest()
+        expected_signature = self.digest(data)
         is_valid = hmac.compare_digest(expected_signature, received_signature)
 
         if is_valid:
             logger.debug("Signature verification successful.")
-        else:
+        elif logger.isEnabledFor(logging.WARNING):
+            # Only hex-encode when the record will actually be created
             logger.warning(
-                f"Signature verification failed! Expected {expected_signature.hex()[:8]}..., got {received_signature.hex()[:8]}..."
+                "Signature verification failed! Expected %s..., got %s...",
+                expected_signature.hex()[:8],
+                bytes(received_signature).hex()[:8],
             )
 
         return is_valid
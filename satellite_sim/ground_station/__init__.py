@@ -2,8 +2,22 @@
 Ground station modules for legitimate and rogue command transmission.
 """
 
-from satellite_sim.ground_station.legit import LegitGroundStation
-from satellite_sim.ground_station.rogue import RogueGroundStation
-from satellite_sim.ground_station.packet_builder import CCSDSPacketBuilder
+from typing import TYPE_CHECKING
 
-__all__ = ["LegitGroundStation", "RogueGroundStation", "CCSDSPacketBuilder"]
+from satellite_sim._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from satellite_sim.ground_station.legit import LegitGroundStation
+    from satellite_sim.ground_station.rogue import RogueGroundStation
+    from satellite_sim.ground_station.packet_builder import CCSDSPacketBuilder, PacketBatch
+
+_EXPORTS = {
+    "LegitGroundStation": "satellite_sim.ground_station.legit",
+    "RogueGroundStation": "satellite_sim.ground_station.rogue",
+    "CCSDSPacketBuilder": "satellite_sim.ground_station.packet_builder",
+    "PacketBatch": "satellite_sim.ground_station.packet_builder",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,6 +1,8 @@
 import logging
-from satellite_sim.ground_station.packet_builder import CCSDSPacketBuilder
+from typing import Optional, Sequence
+from satellite_sim.ground_station.packet_builder import CCSDSPacketBuilder, PacketBatch
 from satellite_sim.crypto.hmac_signer import HMACSigner
+from satellite_sim.crypto.keyring import KeyEntry
 
 logger = logging.getLogger(__name__)
 
@@ -10,10 +12,43 @@ class LegitGroundStation:
     Simulates a legitimate Ground Station that sends authenticated commands.
     """
 
-    def __init__(self, apid: int, secret_key: bytes):
-        self.packet_builder = CCSDSPacketBuilder(apid=apid)
+    def __init__(
+        self,
+        apid: int,
+        secret_key: bytes,
+        key_id: Optional[int] = None,
+        station_id: str = "STATION_ALPHA",
+    ):
+        """
+        Args:
+            apid (int): APID to address commands to.
+            secret_key (bytes): This station's HMAC key.
+            key_id (int): ID of the key in the satellite's Keyring. When set, it is
+                sent in every packet's secondary header.
+            station_id (str): Name used in log messages.
+        """
+        self.packet_builder = CCSDSPacketBuilder(apid=apid, key_id=key_id)
+        self.signer = HMACSigner(secret_key)
+        self.station_id = station_id
+
+    @classmethod
+    def from_keyring(cls, apid: int, entry: KeyEntry) -> "LegitGroundStation":
+        """
+        Create the station that owns a keyring entry.
+        """
+        return cls(apid, entry.secret_key, entry.key_id, entry.station_id or "STATION_ALPHA")
+
+    @property
+    def key_id(self) -> Optional[int]:
+        return self.packet_builder.key_id
+
+    def rotate_key(self, secret_key: bytes, key_id: int) -> None:
+        """
+        Start signing with a new key (after it was added to the satellite's keyring).
+        """
         self.signer = HMACSigner(secret_key)
-        self.station_id = "STATION_ALPHA"
+        self.packet_builder.key_id = key_id
+        logger.info("[%s] Switched to key ID %d", self.station_id, key_id)
 
     def create_command(self, command_str: str) -> bytes:
         """
@@ -25,16 +60,40 @@ class LegitGroundStation:
         Returns:
             bytes: The full packet with HMAC signature appended.
         """
-        logger.info(f"[{self.station_id}] Generating command: {command_str}")
+        logger.info("[%s] Generating command: %s", self.station_id, command_str)
 
         # Build the raw packet (Header + Payload)
         raw_packet = self.packet_builder.build_packet(command_str)
 
-        # Sign the packet
-        signature = self.signer.sign(raw_packet)
-
-        # Append signature
-        signed_packet = raw_packet + signature
+        # Sign the packet with the pre-keyed HMAC and append the signature
+        signed_packet = raw_packet + self.signer.digest(raw_packet)
 
-        logger.info(f"[{self.station_id}] Packet signed. Total length: {len(signed_packet)} bytes.")
+        logger.info(
+            "[%s] Packet signed. Total length: %d bytes.", self.station_id, len(signed_packet)
+        )
         return signed_packet
+
+    def create_batch(
+        self, commands: Sequence[str], timestamp: Optional[float] = None
+    ) -> PacketBatch:
+        """
+        Creates many signed command packets in one contiguous buffer.
+
+        Args:
+            commands (Sequence[str]): The commands to send.
+            timestamp (float): Secondary-header time for the batch. Defaults to now.
+
+        Returns:
+            PacketBatch: Signed packets and their offsets index.
+        """
+        sig_len = 32
+        batch = self.packet_builder.build_batch(commands, timestamp=timestamp, reserve=sig_len)
+        view = memoryview(batch.buffer)
+        digest = self.signer.digest
+        offsets = batch.offsets
+        for i in range(len(batch)):
+            end = offsets[i + 1]
+            view[end - sig_len : end] = digest(view[offsets[i] : end - sig_len])
+
+        logger.info("[%s] Signed batch of %d packets.", self.station_id, len(batch))
+        return batch
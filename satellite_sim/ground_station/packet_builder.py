@@ -1,6 +1,16 @@
 import struct
 import time
+from array import array
+from dataclasses import dataclass
 from enum import Enum
+from typing import Iterator, Optional, Sequence
+
+# Precompiled layouts: primary header (three 16-bit words) and 8-byte timestamp
+_PRIMARY_HEADER = struct.Struct(">HHH")
+_TIMESTAMP = struct.Struct(">d")
+_HEADER_WITH_TIMESTAMP = struct.Struct(">HHHd")
+_KEY_ID = struct.Struct(">H")
+_HEADER_WITH_KEY_ID = struct.Struct(">HHHdH")
 
 
 class PacketType(Enum):
@@ -8,22 +18,58 @@ class PacketType(Enum):
     TLM = 0
 
 
+@dataclass
+class PacketBatch:
+    """
+    Many packets stored back to back in one contiguous buffer.
+
+    Packet i occupies ``buffer[offsets[i]:offsets[i + 1]]``; this is the layout
+    SpaceFirewall.process_buffer() consumes.
+    """
+
+    buffer: bytearray
+    offsets: "array[int]"
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> memoryview:
+        if index < 0:
+            index += len(self)
+        return memoryview(self.buffer)[self.offsets[index] : self.offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        view = memoryview(self.buffer)
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            yield view[offsets[i] : offsets[i + 1]]
+
+
 class CCSDSPacketBuilder:
     """
     Constructs CCSDS packets with Primary Header, Secondary Header, and Payload.
+
+    With a ``key_id`` the secondary header also carries the ID of the signing key
+    (big-endian 16 bits after the timestamp), for firewalls that use a Keyring.
     """
 
-    def __init__(self, apid: int = 0x100):
+    def __init__(self, apid: int = 0x100, key_id: Optional[int] = None):
         self.apid = apid
+        self.key_id = key_id
         self.sequence_count = 0
 
+    def _secondary_header_len(self, include_secondary_header: bool) -> int:
+        if not include_secondary_header:
+            return 0
+        return _TIMESTAMP.size + (_KEY_ID.size if self.key_id is not None else 0)
+
     def build_packet(self, cmd_payload: str, include_secondary_header: bool = True) -> bytes:
         """
         Builds a CCSDS packet.
 
         Structure:
         [Primary Header (6 bytes)]
-        [Secondary Header (Timestamp - 8 bytes, optional)]
+        [Secondary Header (Timestamp - 8 bytes [+ Key ID - 2 bytes], optional)]
         [Payload (Command String)]
 
         Args:
@@ -36,39 +82,94 @@ class CCSDSPacketBuilder:
         # 1. Prepare Payload
         payload_bytes = cmd_payload.encode("utf-8")
 
-        # 2. Prepare Secondary Header (Timestamp)
+        # 2. Secondary Header (Timestamp)
         # Using a simple 8-byte float timestamp for simulation purposes
-        sec_header_bytes = b""
-        if include_secondary_header:
-            timestamp = time.time()
-            sec_header_bytes = struct.pack(">d", timestamp)
+        sec_len = self._secondary_header_len(include_secondary_header)
 
         # 3. Calculate Length
-        # Packet Length field = total bytes - 7 (Primary Header is 6 bytes, length field counts from byte after it?)
         # CCSDS 133.0-B-1: "The Packet Length field specifies the number of octets in the Packet Data Field minus 1."
         # Packet Data Field = Secondary Header + User Data
-        packet_data_length = len(sec_header_bytes) + len(payload_bytes)
-        length_field_value = packet_data_length - 1
+        length_field_value = sec_len + len(payload_bytes) - 1
 
         # 4. Build Primary Header
         # Version (3 bits) = 000
         # Type (1 bit) = 1 (Command)
         # Sec Header Flag (1 bit) = 1 if present
         # APID (11 bits)
-        version = 0
-        packet_type = 1  # Telecommand
         sh_flag = 1 if include_secondary_header else 0
-
-        byte1_2 = (version << 13) | (packet_type << 12) | (sh_flag << 11) | (self.apid & 0x7FF)
+        byte1_2 = (0 << 13) | (1 << 12) | (sh_flag << 11) | (self.apid & 0x7FF)
 
         # Seq Flags (2 bits) = 11 (Unsegmented)
         # Seq Count (14 bits)
-        seq_flags = 3
-        byte3_4 = (seq_flags << 14) | (self.sequence_count & 0x3FFF)
+        byte3_4 = (3 << 14) | (self.sequence_count & 0x3FFF)
 
         # Increment sequence count
         self.sequence_count = (self.sequence_count + 1) % 16384
 
-        primary_header = struct.pack(">HHH", byte1_2, byte3_4, length_field_value)
+        # 5. Pack both headers with one precompiled struct and append the payload
+        if sec_len and self.key_id is not None:
+            header = _HEADER_WITH_KEY_ID.pack(
+                byte1_2, byte3_4, length_field_value, time.time(), self.key_id
+            )
+        elif sec_len:
+            header = _HEADER_WITH_TIMESTAMP.pack(byte1_2, byte3_4, length_field_value, time.time())
+        else:
+            header = _PRIMARY_HEADER.pack(byte1_2, byte3_4, length_field_value)
+        return header + payload_bytes
+
+    def build_batch(
+        self,
+        commands: Sequence[str],
+        include_secondary_header: bool = True,
+        timestamp: Optional[float] = None,
+        reserve: int = 0,
+    ) -> PacketBatch:
+        """
+        Builds many CCSDS packets into one preallocated buffer.
+
+        Headers are written in place with precompiled structs, sequence counts
+        continue from (and wrap around like) build_packet, and every packet in the
+        batch shares one timestamp.
+
+        Args:
+            commands (Sequence[str]): Command strings, one per packet.
+            include_secondary_header (bool): Whether to include a timestamp header.
+            timestamp (float): Secondary-header time. Defaults to now.
+            reserve (int): Extra zeroed bytes left at the end of each packet, e.g. for
+                an HMAC filled in afterwards.
 
-        return primary_header + sec_header_bytes + payload_bytes
+        Returns:
+            PacketBatch: The contiguous buffer and its N+1 offsets index.
+        """
+        payloads = [cmd.encode("utf-8") for cmd in commands]
+        sec_len = self._secondary_header_len(include_secondary_header)
+        fixed_len = _PRIMARY_HEADER.size + sec_len
+
+        offsets = array("Q", [0])
+        total = 0
+        for payload in payloads:
+            total += fixed_len + len(payload) + reserve
+            offsets.append(total)
+        buffer = bytearray(total)
+
+        sh_flag = 1 if include_secondary_header else 0
+        byte1_2 = (0 << 13) | (1 << 12) | (sh_flag << 11) | (self.apid & 0x7FF)
+        seq_flags = 3 << 14
+        seq = self.sequence_count
+        ts = time.time() if timestamp is None else timestamp
+        pack_header = _PRIMARY_HEADER.pack_into
+        pack_timestamp = _TIMESTAMP.pack_into
+
+        for i, payload in enumerate(payloads):
+            offset = offsets[i]
+            pack_header(buffer, offset, byte1_2, seq_flags | seq, sec_len + len(payload) - 1)
+            if sec_len:
+                pack_timestamp(buffer, offset + _PRIMARY_HEADER.size, ts)
+                if self.key_id is not None:
+                    _KEY_ID.pack_into(buffer, offset + _HEADER_WITH_TIMESTAMP.size, self.key_id)
+            start = offset + fixed_len
+            buffer[start : start + len(payload)] = payload
+            seq = (seq + 1) & 0x3FFF
+
+        self.sequence_count = seq
+        return PacketBatch(buffer, offsets)
@@ -26,7 +26,7 @@ class RogueGroundStation:
             bytes: The malicious packet.
         """
         logger.info(
-            f"[{self.station_id}] constructing ATTACK packet: {command_str} [{attack_type}]"
+            "[%s] constructing ATTACK packet: %s [%s]", self.station_id, command_str, attack_type
         )
 
         raw_packet = self.packet_builder.build_packet(command_str)
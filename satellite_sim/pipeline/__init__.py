@@ -0,0 +1,26 @@
+"""
+Streaming simulation pipeline connecting ground stations, channel and firewall.
+"""
+
+from typing import TYPE_CHECKING
+
+from satellite_sim._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from satellite_sim.pipeline.streaming import (
+        PipelineReport,
+        StageStats,
+        StreamingPipeline,
+        mixed_traffic,
+    )
+
+_EXPORTS = {
+    "StreamingPipeline": "satellite_sim.pipeline.streaming",
+    "PipelineReport": "satellite_sim.pipeline.streaming",
+    "StageStats": "satellite_sim.pipeline.streaming",
+    "mixed_traffic": "satellite_sim.pipeline.streaming",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
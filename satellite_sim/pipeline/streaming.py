@@ -0,0 +1,197 @@
+import itertools
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from satellite_sim.channel.uplink import UplinkChannel
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from satellite_sim.satellite.firewall import BatchResult, SpaceFirewall
+
+logger = logging.getLogger(__name__)
+
+ATTACK_TYPES = ("BAD_SIGNATURE", "NO_SIGNATURE", "SHORT_SIGNATURE")
+
+
+def mixed_traffic(
+    legit: LegitGroundStation,
+    rogue: RogueGroundStation,
+    count: Optional[int] = None,
+    attack_ratio: float = 0.5,
+    attack_types: Sequence[str] = ATTACK_TYPES,
+    seed: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Generate an interleaved stream of legitimate and attack packets.
+
+    Args:
+        legit (LegitGroundStation): Source of signed commands.
+        rogue (RogueGroundStation): Source of attack packets.
+        count (int): Number of packets to generate; None means unbounded.
+        attack_ratio (float): Probability that a packet is an attack.
+        attack_types (Sequence[str]): Attack types to draw from.
+        seed (int): Seed for the legit/attack interleaving.
+
+    Yields:
+        bytes: One packet at a time, generated on demand.
+    """
+    rng = random.Random(seed)
+    counter = itertools.count() if count is None else range(count)
+    for i in counter:
+        if rng.random() < attack_ratio:
+            yield rogue.create_attack_packet(f"ATTACK_{i}", rng.choice(attack_types))
+        else:
+            yield legit.create_command(f"CMD_{i}")
+
+
+@dataclass
+class StageStats:
+    """
+    Work done by one pipeline stage.
+    """
+
+    name: str
+    items: int = 0
+    batches: int = 0
+    busy_time: float = 0.0
+    max_batch_time: float = 0.0
+
+    def record(self, items: int, elapsed: float) -> None:
+        self.items += items
+        self.batches += 1
+        self.busy_time += elapsed
+        self.max_batch_time = max(self.max_batch_time, elapsed)
+
+    @property
+    def mean_batch_latency(self) -> float:
+        return self.busy_time / self.batches if self.batches else 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.busy_time if self.busy_time > 0 else 0.0
+
+
+@dataclass
+class PipelineReport:
+    """
+    End-to-end result of StreamingPipeline.run().
+    """
+
+    packets_sent: int
+    packets_received: int
+    accepted: int
+    rejected: int
+    elapsed: float
+    reasons: Dict[str, int] = field(default_factory=dict)
+    stages: List[StageStats] = field(default_factory=list)
+
+    @property
+    def packets_per_second(self) -> float:
+        return self.packets_sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class StreamingPipeline:
+    """
+    Pull-based pipeline: traffic source -> uplink channel -> firewall.
+
+    Each stage is a generator that asks upstream for one batch only when downstream
+    wants the next one, so at most one batch per stage is in flight and memory use
+    is bounded by ``batch_size`` however long the scenario runs.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[bytes],
+        firewall: SpaceFirewall,
+        channel: Optional[UplinkChannel] = None,
+        batch_size: int = 256,
+        send_interval: float = 0.0,
+    ):
+        """
+        Args:
+            source (Iterable[bytes]): Packets in send order (e.g. mixed_traffic()).
+            firewall (SpaceFirewall): Receives each channel batch via process_batch().
+            channel (UplinkChannel): Link model between source and firewall; None
+                delivers packets unchanged.
+            batch_size (int): Packets pulled from the source per step.
+            send_interval (float): Simulated time between sends, passed to the channel.
+        """
+        self.source = source
+        self.firewall = firewall
+        self.channel = channel
+        self.batch_size = batch_size
+        self.send_interval = send_interval
+        self.source_stats = StageStats("source")
+        self.channel_stats = StageStats("channel")
+        self.firewall_stats = StageStats("firewall")
+
+    def _source_batches(self) -> Iterator[List[bytes]]:
+        it = iter(self.source)
+        while True:
+            start = time.perf_counter()
+            batch = list(itertools.islice(it, self.batch_size))
+            if not batch:
+                return
+            self.source_stats.record(len(batch), time.perf_counter() - start)
+            yield batch
+
+    def _channel_batches(self, batches: Iterable[List[bytes]]) -> Iterator[List[bytes]]:
+        sent = 0
+        for batch in batches:
+            start = time.perf_counter()
+            if self.channel is None:
+                received = batch
+            else:
+                deliveries = self.channel.transmit_batch(
+                    batch, start_time=sent * self.send_interval, send_interval=self.send_interval
+                )
+                received = [d.packet for d in deliveries]
+            sent += len(batch)
+            self.channel_stats.record(len(batch), time.perf_counter() - start)
+            yield received
+
+    def _firewall_batches(self, batches: Iterable[List[bytes]]) -> Iterator[BatchResult]:
+        for batch in batches:
+            start = time.perf_counter()
+            result = self.firewall.process_batch(batch)
+            self.firewall_stats.record(len(batch), time.perf_counter() - start)
+            yield result
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        """
+        Stream firewall results batch by batch.
+        """
+        return self._firewall_batches(self._channel_batches(self._source_batches()))
+
+    def run(self) -> PipelineReport:
+        """
+        Drain the source through the pipeline and summarise the run.
+        """
+        start = time.perf_counter()
+        accepted = rejected = received = 0
+        reasons: Dict[str, int] = {}
+        for result in self:
+            received += len(result.verdicts)
+            accepted += result.accepted
+            rejected += result.rejected
+            for reason, count in result.reasons.items():
+                reasons[reason] = reasons.get(reason, 0) + count
+
+        report = PipelineReport(
+            packets_sent=self.source_stats.items,
+            packets_received=received,
+            accepted=accepted,
+            rejected=rejected,
+            elapsed=time.perf_counter() - start,
+            reasons=reasons,
+            stages=[self.source_stats, self.channel_stats, self.firewall_stats],
+        )
+        logger.info(
+            "Pipeline processed %d packets in %.3fs (%.0f pkt/s)",
+            report.packets_sent,
+            report.elapsed,
+            report.packets_per_second,
+        )
+        return report
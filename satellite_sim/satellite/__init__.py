@@ -2,7 +2,62 @@
 Satellite-side modules for command validation and telemetry.
 """
 
-from satellite_sim.satellite.firewall import SpaceFirewall
-from satellite_sim.satellite.telemetry import TelemetrySystem
+from typing import TYPE_CHECKING
 
-__all__ = ["SpaceFirewall", "TelemetrySystem"]
+from satellite_sim._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from satellite_sim.satellite.firewall import BatchResult, SpaceFirewall, Verdict
+    from satellite_sim.satellite.metrics import FirewallMetrics, MetricsServer
+    from satellite_sim.satellite.parallel import ParallelFirewall
+    from satellite_sim.satellite.prefilters import (
+        AllowedAPIDFilter,
+        HeaderSanityFilter,
+        KeyIDFilter,
+        LengthFieldFilter,
+        Prefilter,
+        RateLimitFilter,
+        TimestampWindowFilter,
+    )
+    from satellite_sim.satellite.replay import ReplayGuard, SequenceWindow
+    from satellite_sim.satellite.suppression import SuppressionFilter, ViolationAggregator
+    from satellite_sim.satellite.telemetry import TelemetrySystem
+    from satellite_sim.satellite.uplink_server import UplinkServer
+    from satellite_sim.satellite.event_store import (
+        EventStore,
+        JSONArrayEventStore,
+        MultiEventStore,
+        NDJSONEventStore,
+        SQLiteEventStore,
+    )
+
+_EXPORTS = {
+    "SpaceFirewall": "satellite_sim.satellite.firewall",
+    "Verdict": "satellite_sim.satellite.firewall",
+    "BatchResult": "satellite_sim.satellite.firewall",
+    "ParallelFirewall": "satellite_sim.satellite.parallel",
+    "FirewallMetrics": "satellite_sim.satellite.metrics",
+    "MetricsServer": "satellite_sim.satellite.metrics",
+    "Prefilter": "satellite_sim.satellite.prefilters",
+    "HeaderSanityFilter": "satellite_sim.satellite.prefilters",
+    "LengthFieldFilter": "satellite_sim.satellite.prefilters",
+    "KeyIDFilter": "satellite_sim.satellite.prefilters",
+    "AllowedAPIDFilter": "satellite_sim.satellite.prefilters",
+    "TimestampWindowFilter": "satellite_sim.satellite.prefilters",
+    "RateLimitFilter": "satellite_sim.satellite.prefilters",
+    "ReplayGuard": "satellite_sim.satellite.replay",
+    "SequenceWindow": "satellite_sim.satellite.replay",
+    "ViolationAggregator": "satellite_sim.satellite.suppression",
+    "SuppressionFilter": "satellite_sim.satellite.suppression",
+    "TelemetrySystem": "satellite_sim.satellite.telemetry",
+    "UplinkServer": "satellite_sim.satellite.uplink_server",
+    "EventStore": "satellite_sim.satellite.event_store",
+    "JSONArrayEventStore": "satellite_sim.satellite.event_store",
+    "NDJSONEventStore": "satellite_sim.satellite.event_store",
+    "MultiEventStore": "satellite_sim.satellite.event_store",
+    "SQLiteEventStore": "satellite_sim.satellite.event_store",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
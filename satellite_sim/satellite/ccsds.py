@@ -0,0 +1,83 @@
+import struct
+from typing import NamedTuple, Union
+
+# Primary header: three big-endian 16-bit words
+_PRIMARY_HEADER = struct.Struct(">HHH")
+# Secondary header: 8-byte big-endian float timestamp following the primary header
+_TIMESTAMP = struct.Struct(">d")
+# Optional key ID (keyring mode) following the timestamp in the secondary header
+_KEY_ID = struct.Struct(">H")
+
+PRIMARY_HEADER_LEN = _PRIMARY_HEADER.size
+SEC_HEADER_LEN = _TIMESTAMP.size
+KEY_ID_LEN = _KEY_ID.size
+
+
+class PrimaryHeader(NamedTuple):
+    """
+    Decoded CCSDS Space Packet primary header (CCSDS 133.0-B).
+    """
+
+    version: int
+    packet_type: int
+    sec_header_flag: int
+    apid: int
+    sequence_flags: int
+    sequence_count: int
+    data_length: int
+
+    @property
+    def packet_data_length(self) -> int:
+        """
+        Octets in the packet data field (the length field stores this minus 1).
+        """
+        return self.data_length + 1
+
+    @property
+    def total_length(self) -> int:
+        """
+        Total packet length implied by the header, excluding any trailing HMAC.
+        """
+        return PRIMARY_HEADER_LEN + self.data_length + 1
+
+
+def decode_primary_header(
+    buffer: Union[bytes, bytearray, memoryview], offset: int = 0
+) -> PrimaryHeader:
+    """
+    Decode the 6-byte primary header at ``offset`` without copying the buffer.
+
+    Args:
+        buffer: Packet bytes or a receive buffer containing the packet.
+        offset (int): Position of the first header byte.
+
+    Returns:
+        PrimaryHeader: The decoded fields.
+
+    Raises:
+        struct.error: If fewer than 6 bytes are available.
+    """
+    word1, word2, length = _PRIMARY_HEADER.unpack_from(buffer, offset)
+    return PrimaryHeader(
+        word1 >> 13,
+        (word1 >> 12) & 0x1,
+        (word1 >> 11) & 0x1,
+        word1 & 0x7FF,
+        word2 >> 14,
+        word2 & 0x3FFF,
+        length,
+    )
+
+
+def decode_timestamp(buffer: Union[bytes, bytearray, memoryview], offset: int = 0) -> float:
+    """
+    Read the secondary-header timestamp of the packet starting at ``offset``.
+    """
+    return float(_TIMESTAMP.unpack_from(buffer, offset + PRIMARY_HEADER_LEN)[0])
+
+
+def decode_key_id(buffer: Union[bytes, bytearray, memoryview], offset: int = 0) -> int:
+    """
+    Read the key ID that follows the timestamp in a keyring-mode secondary header.
+    """
+    return int(_KEY_ID.unpack_from(buffer, offset + PRIMARY_HEADER_LEN + SEC_HEADER_LEN)[0])
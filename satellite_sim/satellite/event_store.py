@@ -0,0 +1,448 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class EventStore:
+    """
+    Base class for security event persistence backends used by TelemetrySystem.
+    """
+
+    def reset(self) -> None:
+        """
+        Discard any previously persisted events (called when telemetry starts).
+        """
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """
+        Persist a single event.
+
+        Args:
+            event (Dict[str, Any]): The serialized security event.
+        """
+        raise NotImplementedError
+
+    def append_many(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Persist a batch of events, in order.
+
+        Args:
+            events (List[Dict[str, Any]]): The serialized security events.
+        """
+        for event in events:
+            self.append(event)
+
+    def flush(self) -> None:
+        """
+        Push any buffered data to disk.
+        """
+
+    def close(self) -> None:
+        """
+        Flush and release any resources held by the store.
+        """
+        self.flush()
+
+
+class JSONArrayEventStore(EventStore):
+    """
+    Legacy backend: rewrites the full JSON array on every event.
+
+    Kept for compatibility; each append costs O(N) in the number of stored events.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.events: List[Dict[str, Any]] = []
+
+    def reset(self) -> None:
+        self.events = []
+
+    def append(self, event: Dict[str, Any]) -> None:
+        self.events.append(event)
+        with open(self.path, "w") as f:
+            json.dump(self.events, f, indent=2)
+
+
+class NDJSONEventStore(EventStore):
+    """
+    Append-only newline-delimited JSON backend.
+
+    Each event is written as a single line to the journal file, so the cost of an
+    append does not depend on how many events were logged before it. The journal is
+    periodically compacted into a snapshot using the legacy JSON array format so that
+    tools reading ``security_events.json`` keep working. After the first compaction
+    only journal lines written since the previous one are appended to the snapshot,
+    so each compaction costs O(new events) rather than O(history).
+    """
+
+    _SNAPSHOT_TAIL = b"\n]\n"
+    _EMPTY_SNAPSHOT_TAIL = b"]\n"
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        journal_path: Optional[str] = None,
+        compact_every: Optional[int] = 1000,
+    ):
+        """
+        Args:
+            snapshot_path (str): Where the JSON array snapshot is written.
+            journal_path (str): NDJSON journal file. Defaults to the snapshot path
+                with an ``.ndjson`` extension.
+            compact_every (int): Write a snapshot every N appends. None disables
+                periodic compaction (a snapshot is still written on close).
+        """
+        self.snapshot_path = snapshot_path
+        if journal_path is None:
+            journal_path = os.path.splitext(snapshot_path)[0] + ".ndjson"
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self._pending_compaction = 0
+        # Journal bytes already in the snapshot, and the snapshot's expected size and
+        # event count. A size of None forces the next compaction to rewrite it.
+        self._journal_offset = 0
+        self._snapshot_size: Optional[int] = None
+        self._snapshot_count = 0
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+
+    def reset(self) -> None:
+        self._journal.close()
+        self._journal = open(self.journal_path, "w", encoding="utf-8")
+        self._pending_compaction = 0
+        self._snapshot_size = None
+
+    def append(self, event: Dict[str, Any]) -> None:
+        self._journal.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self._pending_compaction += 1
+        if self.compact_every and self._pending_compaction >= self.compact_every:
+            self.compact()
+
+    def append_many(self, events: List[Dict[str, Any]]) -> None:
+        self._journal.write("".join(json.dumps(e, separators=(",", ":")) + "\n" for e in events))
+        self._pending_compaction += len(events)
+        if self.compact_every and self._pending_compaction >= self.compact_every:
+            self.compact()
+
+    def flush(self) -> None:
+        if not self._journal.closed:
+            self._journal.flush()
+
+    def _read_journal(self, offset: int) -> Tuple[List[bytes], int]:
+        """
+        Read the complete journal lines starting at a byte offset.
+
+        Args:
+            offset (int): Byte offset to start reading from.
+
+        Returns:
+            Tuple[List[bytes], int]: The non-empty lines and the offset just past the
+            last complete line.
+        """
+        lines: List[bytes] = []
+        with open(self.journal_path, "rb") as src:
+            src.seek(offset)
+            for raw in src:
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                line = raw.strip()
+                if line:
+                    lines.append(line)
+        return lines, offset
+
+    def _snapshot_intact(self) -> bool:
+        try:
+            return os.path.getsize(self.snapshot_path) == self._snapshot_size
+        except OSError:
+            return False
+
+    def _entries(self, lines: List[bytes]) -> bytes:
+        first = self._snapshot_count == 0
+        parts = []
+        for line in lines:
+            parts.append(b"\n  " if first else b",\n  ")
+            parts.append(line)
+            first = False
+        return b"".join(parts)
+
+    def _rewrite_snapshot(self) -> None:
+        lines, offset = self._read_journal(0)
+        self._snapshot_count = 0
+        body = b"[" + self._entries(lines)
+        body += self._SNAPSHOT_TAIL if lines else self._EMPTY_SNAPSHOT_TAIL
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as dst:
+            dst.write(body)
+        os.replace(tmp_path, self.snapshot_path)
+        self._journal_offset = offset
+        self._snapshot_count = len(lines)
+        self._snapshot_size = len(body)
+
+    def _extend_snapshot(self, size: int) -> None:
+        lines, offset = self._read_journal(self._journal_offset)
+        self._journal_offset = offset
+        if not lines:
+            return
+        tail = self._SNAPSHOT_TAIL if self._snapshot_count else self._EMPTY_SNAPSHOT_TAIL
+        body = self._entries(lines) + self._SNAPSHOT_TAIL
+        with open(self.snapshot_path, "r+b") as dst:
+            dst.seek(size - len(tail))
+            dst.write(body)
+            dst.truncate()
+        self._snapshot_count += len(lines)
+        self._snapshot_size = size + len(body) - len(tail)
+
+    def compact(self) -> None:
+        """
+        Bring the JSON array snapshot up to date with the journal.
+
+        The first compaction (and any after a reset, or if the snapshot was changed
+        on disk) rewrites the snapshot atomically from the whole journal. Later ones
+        read the journal from where the previous one stopped and splice only the new
+        events in before the closing bracket.
+        """
+        self.flush()
+        size = self._snapshot_size
+        if size is None or not self._snapshot_intact():
+            self._rewrite_snapshot()
+        else:
+            self._extend_snapshot(size)
+        self._pending_compaction = 0
+        logger.debug("Compacted event journal into %s", self.snapshot_path)
+
+    def close(self) -> None:
+        if self._journal.closed:
+            return
+        self.compact()
+        self._journal.close()
+
+
+def iter_journal(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the events in an NDJSON journal, oldest first, without modifying it.
+
+    Blank lines are skipped, as is a trailing partial line that a writer is still
+    appending.
+
+    Args:
+        path (str): The NDJSON journal written by NDJSONEventStore.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class MultiEventStore(EventStore):
+    """
+    Fan events out to several backends (e.g. the JSON journal plus an index).
+    """
+
+    def __init__(self, stores: List[EventStore]):
+        self.stores = stores
+
+    def reset(self) -> None:
+        for store in self.stores:
+            store.reset()
+
+    def append(self, event: Dict[str, Any]) -> None:
+        for store in self.stores:
+            store.append(event)
+
+    def append_many(self, events: List[Dict[str, Any]]) -> None:
+        for store in self.stores:
+            store.append_many(events)
+
+    def flush(self) -> None:
+        for store in self.stores:
+            store.flush()
+
+    def close(self) -> None:
+        for store in self.stores:
+            store.close()
+
+
+class SQLiteEventStore(EventStore):
+    """
+    Indexed SQLite backend for querying historical events.
+
+    Events are stored with their timestamp, type, severity and APID (taken from the
+    event details when present) as indexed columns and the full details as JSON.
+    The type and severity indexes also carry the APID, so per-APID counts over a
+    time range are answered from the index alone.
+    Each batch is inserted in a single transaction. History is kept across
+    telemetry sessions unless ``keep_history`` is False.
+
+    The database uses WAL journaling so other processes can query it while the
+    satellite is writing.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY,
+            timestamp REAL NOT NULL,
+            event_type TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            apid INTEGER,
+            details TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_events_type_time ON events (event_type, timestamp, apid);
+        CREATE INDEX IF NOT EXISTS idx_events_severity_time ON events (severity, timestamp, apid);
+        CREATE INDEX IF NOT EXISTS idx_events_apid_time ON events (apid, timestamp);
+    """
+
+    GROUP_COLUMNS = ("event_type", "severity", "apid")
+
+    def __init__(self, path: str, keep_history: bool = True):
+        """
+        Args:
+            path (str): SQLite database file.
+            keep_history (bool): Keep events from earlier sessions on reset().
+        """
+        self.path = path
+        self.keep_history = keep_history
+        self._lock = threading.Lock()
+        # The buffered telemetry writer appends from its own thread; the lock serialises use
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def reset(self) -> None:
+        if self.keep_history:
+            return
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM events")
+
+    @staticmethod
+    def _row(event: Dict[str, Any]) -> Tuple[Any, ...]:
+        details = event.get("details") or {}
+        apid = details.get("apid") if isinstance(details, dict) else None
+        return (
+            event["timestamp"],
+            event["event_type"],
+            event["severity"],
+            apid,
+            json.dumps(details, separators=(",", ":"), default=str),
+        )
+
+    def append(self, event: Dict[str, Any]) -> None:
+        self.append_many([event])
+
+    def append_many(self, events: List[Dict[str, Any]]) -> None:
+        rows = [self._row(event) for event in events]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO events (timestamp, event_type, severity, apid, details) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _where(
+        self,
+        since: Optional[float],
+        until: Optional[float],
+        severities: Optional[Sequence[str]],
+        event_types: Optional[Sequence[str]],
+        apids: Optional[Sequence[int]],
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        for column, values in (
+            ("severity", [s.upper() for s in severities or ()]),
+            ("event_type", [t.upper() for t in event_types or ()]),
+            ("apid", list(apids or ())),
+        ):
+            if values:
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severities: Optional[Sequence[str]] = None,
+        event_types: Optional[Sequence[str]] = None,
+        apids: Optional[Sequence[int]] = None,
+        limit: Optional[int] = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return matching events, newest first.
+
+        Args:
+            since (float): Only events at or after this epoch timestamp.
+            until (float): Only events before this epoch timestamp.
+            severities (Sequence[str]): Only these severities.
+            event_types (Sequence[str]): Only these event types.
+            apids (Sequence[int]): Only events for these APIDs.
+            limit (int): Maximum number of events (None for all).
+
+        Returns:
+            List[Dict[str, Any]]: Events in the same shape TelemetrySystem stores them.
+        """
+        where, params = self._where(since, until, severities, event_types, apids)
+        sql = f"SELECT timestamp, event_type, severity, details FROM events{where} "
+        sql += "ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {"timestamp": ts, "event_type": etype, "details": json.loads(details), "severity": sev}
+            for ts, etype, sev, details in rows
+        ]
+
+    def count(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severities: Optional[Sequence[str]] = None,
+        event_types: Optional[Sequence[str]] = None,
+        apids: Optional[Sequence[int]] = None,
+        group_by: Optional[str] = None,
+    ) -> Dict[Any, int]:
+        """
+        Count matching events, optionally grouped by a column.
+
+        Args:
+            group_by (str): 'event_type', 'severity' or 'apid'; None for a single total.
+                The other arguments filter as in query().
+
+        Returns:
+            Dict[Any, int]: Count per group value (or ``{None: total}`` when ungrouped).
+
+        Raises:
+            ValueError: If ``group_by`` is not an indexed column.
+        """
+        if group_by is not None and group_by not in self.GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by {group_by!r}")
+        where, params = self._where(since, until, severities, event_types, apids)
+        if group_by is None:
+            sql = f"SELECT NULL, COUNT(*) FROM events{where}"
+        else:
+            sql = f"SELECT {group_by}, COUNT(*) FROM events{where} GROUP BY {group_by}"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return {key: count for key, count in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,102 +1,578 @@
-import struct
 import logging
 import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from satellite_sim.crypto.keyring import Keyring
 from satellite_sim.crypto.verifier import HMACVerifier
+from satellite_sim.satellite.ccsds import (
+    KEY_ID_LEN,
+    PRIMARY_HEADER_LEN,
+    SEC_HEADER_LEN,
+    PrimaryHeader,
+    decode_key_id,
+    decode_primary_header,
+)
+from satellite_sim.satellite.metrics import FirewallMetrics
+from satellite_sim.satellite.suppression import ViolationAggregator
+from satellite_sim.satellite.prefilters import KeyIDFilter, Prefilter, default_prefilters
+from satellite_sim.satellite.replay import ReplayGuard
 from satellite_sim.satellite.telemetry import TelemetrySystem
+from satellite_sim.satellite.verdict import Verdict
 
 logger = logging.getLogger(__name__)
 
+Buffer = Union[bytes, bytearray, memoryview]
+
+CommandHandler = Callable[[str], None]
+
+
+# Telemetry event type and severity emitted by process_packet for each rejection
+_REJECTION_EVENTS = {
+    Verdict.TOO_SHORT: ("PACKET_REJECTED", "HIGH"),
+    Verdict.BAD_SIGNATURE: ("SECURITY_VIOLATION", "CRITICAL"),
+    Verdict.STALE_TIMESTAMP: ("PACKET_REJECTED", "MEDIUM"),
+    Verdict.PARSE_ERROR: ("PARSING_ERROR", "HIGH"),
+    Verdict.MALFORMED_HEADER: ("PACKET_REJECTED", "HIGH"),
+    Verdict.LENGTH_MISMATCH: ("PACKET_REJECTED", "HIGH"),
+    Verdict.APID_NOT_ALLOWED: ("PACKET_REJECTED", "HIGH"),
+    Verdict.RATE_LIMITED: ("PACKET_REJECTED", "MEDIUM"),
+    Verdict.REPLAY: ("SECURITY_VIOLATION", "CRITICAL"),
+    Verdict.UNKNOWN_KEY: ("SECURITY_VIOLATION", "CRITICAL"),
+}
+
+_SEVERITY_RANK = {"INFO": 0, "LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
+
+
+def _batch_severity(reasons: Dict[str, int]) -> str:
+    """
+    Severity of a BATCH_PROCESSED event: the highest severity process_packet would
+    have reported for any of the batch's rejections, or INFO if there were none.
+    """
+    severity = "INFO"
+    for name in reasons:
+        candidate = _REJECTION_EVENTS[Verdict[name]][1]
+        if _SEVERITY_RANK[candidate] > _SEVERITY_RANK[severity]:
+            severity = candidate
+    return severity
+
+
+@dataclass
+class BatchResult:
+    """
+    Result of SpaceFirewall.process_batch.
+
+    ``verdicts`` holds one Verdict code per input packet, in input order.
+    """
+
+    verdicts: "array[int]"
+    accepted: int
+    rejected: int
+    elapsed: float
+    reasons: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def packets_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.verdicts) / self.elapsed
+
 
 class SpaceFirewall:
     """
     The 'Space Firewall' running on the satellite.
     Validates incoming CCSDS packets and enforces security policies.
+
+    Before the HMAC is computed, each packet runs through an ordered pipeline of
+    cheap prefilters (see satellite_sim.satellite.prefilters) so attack traffic is
+    shed early; ``stage_rejections`` counts rejections per stage and
+    ``hmac_verifications`` how many packets reached the HMAC.
+
+    Authenticated packets then pass an anti-replay check (per-APID sequence window
+    plus recently seen MACs) before their command is executed.
+
+    With a Keyring, packets carry a 2-byte key ID after the secondary-header
+    timestamp and are verified with that key's pre-keyed context, so several
+    stations (and old and new keys during a rotation) cost no more than one key.
+
+    Accepted commands are routed by APID through a dispatch table; see
+    register_handler().
+
+    With a FirewallMetrics instance attached, process_packet() records the time
+    spent in each stage and process_batch() the time per batch; see
+    metrics_snapshot(). Without one, no clocks are read.
+
+    With a ViolationAggregator attached, per-packet rejection events go through it,
+    so a flood of identical violations is reported as periodic summaries instead
+    of one telemetry event per packet. The counters above are unaffected.
     """
 
-    def __init__(self, secret_key: bytes, telemetry: TelemetrySystem):
-        self.verifier = HMACVerifier(secret_key)
+    SIGNATURE_LEN = 32
+    MIN_PACKET_LEN = 38
+    FRESHNESS_WINDOW = 60.0
+
+    def __init__(
+        self,
+        secret_key: Optional[bytes],
+        telemetry: TelemetrySystem,
+        prefilters: Optional[List[Prefilter]] = None,
+        replay_guard: Optional[ReplayGuard] = None,
+        replay_protection: bool = True,
+        metrics: Optional[FirewallMetrics] = None,
+        violations: Optional[ViolationAggregator] = None,
+        keyring: Optional[Keyring] = None,
+    ):
+        """
+        Args:
+            secret_key (bytes): Shared HMAC key. Pass None when using a keyring.
+            telemetry (TelemetrySystem): Where security events are reported.
+            prefilters (List[Prefilter]): Pre-HMAC checks, run in order. Defaults to
+                header sanity, length field and freshness window checks.
+            replay_guard (ReplayGuard): Anti-replay state. Defaults to a new guard.
+            replay_protection (bool): Set False to disable replay detection.
+            metrics (FirewallMetrics): Enables per-stage latency instrumentation.
+            violations (ViolationAggregator): Collapses repeated rejection events.
+            keyring (Keyring): Verify each packet with the key named by the key ID in
+                its secondary header. A KeyIDFilter enforcing the keys' validity
+                windows is appended to the prefilters unless one is already present.
+
+        Raises:
+            ValueError: Unless exactly one of ``secret_key`` and ``keyring`` is given.
+        """
+        if (secret_key is None) == (keyring is None):
+            raise ValueError("Provide either a secret key or a keyring")
+        self.verifier = HMACVerifier(secret_key) if secret_key is not None else None
+        self.keyring = keyring
         self.telemetry = telemetry
+        self.prefilters = (
+            prefilters if prefilters is not None else default_prefilters(self.FRESHNESS_WINDOW)
+        )
+        if keyring is not None and not any(isinstance(p, KeyIDFilter) for p in self.prefilters):
+            self.prefilters = [*self.prefilters, KeyIDFilter(keyring)]
+        self.replay_guard: Optional[ReplayGuard] = None
+        if replay_protection:
+            self.replay_guard = replay_guard if replay_guard is not None else ReplayGuard()
         self.accepted_commands = 0
         self.rejected_commands = 0
+        self.stage_rejections: "Counter[str]" = Counter()
+        self.hmac_verifications = 0
+        self.handlers: Dict[int, CommandHandler] = {}
+        self.default_handler: Optional[CommandHandler] = None
+        self.metrics = metrics
+        self.violations = violations
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Telemetry owns open files and threads and stays with the parent process;
+        # a pickled firewall (e.g. in a ParallelFirewall worker) can only verify.
+        state = self.__dict__.copy()
+        state["telemetry"] = None
+        state["replay_guard"] = None
+        state["handlers"] = {}
+        state["default_handler"] = None
+        state["metrics"] = None
+        state["violations"] = None
+        return state
 
-    def process_packet(self, packet_data: bytes):
+    def register_handler(self, apid: int, handler: CommandHandler) -> None:
         """
-        Ingest a raw packet, validate it, and decide whether to execute or drop.
+        Route accepted commands for an APID to ``handler``.
 
         Args:
-            packet_data (bytes): The received byte stream.
+            apid (int): 11-bit Application Process ID.
+            handler (Callable[[str], None]): Called with the decoded command string.
+        """
+        self.handlers[apid & 0x7FF] = handler
+
+    def get_filter_stats(self) -> Dict[str, int]:
+        """
+        Return rejection counts per prefilter stage plus the number of packets that
+        reached HMAC verification.
         """
-        logger.info(f"Received packet of size {len(packet_data)} bytes.")
+        stats = {"min_length": self.stage_rejections["min_length"]}
+        for prefilter in self.prefilters:
+            stats[prefilter.name] = self.stage_rejections[prefilter.name]
+        stats["hmac_verifications"] = self.hmac_verifications
+        return stats
 
-        # 1. Basic Length Check
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """
+        Return the firewall counters plus, when instrumentation is enabled, the
+        per-stage latency histograms and per-verdict counts under ``metrics``.
+        """
+        return {
+            "accepted": self.accepted_commands,
+            "rejected": self.rejected_commands,
+            "hmac_verifications": self.hmac_verifications,
+            "stage_rejections": dict(self.stage_rejections),
+            "metrics": self.metrics.snapshot() if self.metrics is not None else None,
+        }
+
+    def _prefilter(self, packet: memoryview, current_time: float) -> Tuple[Verdict, Any]:
+        """
+        Decode the primary header and run the prefilter pipeline.
+
+        Returns:
+            Tuple[Verdict, Any]: ACCEPTED with the PrimaryHeader, or the rejecting
+            stage's verdict with its details.
+        """
+        # Basic Length Check
         # Min length: 6 (Primary) + 0 (Sec) + 1 (Payload) + 32 (HMAC) = 39 bytes approx
-        if len(packet_data) < 38:
-            self.telemetry.log_event(
-                "PACKET_REJECTED", {"reason": "Packet too short", "size": len(packet_data)}, "HIGH"
-            )
-            self.rejected_commands += 1
-            return
+        size = len(packet)
+        if size < self.MIN_PACKET_LEN:
+            self.stage_rejections["min_length"] += 1
+            return Verdict.TOO_SHORT, {"reason": "Packet too short", "size": size}
+
+        header = decode_primary_header(packet)
+        for prefilter in self.prefilters:
+            details = prefilter.check(packet, header, self.SIGNATURE_LEN, current_time)
+            if details is not None:
+                self.stage_rejections[prefilter.name] += 1
+                return prefilter.verdict, details
+
+        return Verdict.ACCEPTED, header
+
+    def _verify(self, packet: memoryview, header: PrimaryHeader) -> Tuple[Verdict, Any]:
+        """
+        Check the HMAC and decode the payload of a packet that passed the prefilters.
+
+        This has no side effects, so ParallelFirewall can run it in worker processes.
+
+        Returns:
+            Tuple[Verdict, Any]: ACCEPTED with ``(PrimaryHeader, command, mac, key_id)``
+            (``key_id`` is None without a keyring), or a rejection verdict with its
+            details.
+        """
+        payload_start = PRIMARY_HEADER_LEN + SEC_HEADER_LEN
+        verifier = self.verifier
+        key_id: Optional[int] = None
+        if self.keyring is not None:
+            key_id = decode_key_id(packet)
+            entry = self.keyring.get(key_id)
+            if entry is None:
+                return Verdict.UNKNOWN_KEY, {
+                    "reason": "Unknown key ID",
+                    "apid": header.apid,
+                    "key_id": key_id,
+                }
+            verifier = entry.verifier
+            payload_start += KEY_ID_LEN
+        assert verifier is not None
 
-        # 2. Extract Components
         # Assuming HMAC-SHA256 is always the last 32 bytes
-        signature_len = 32
-        data_part = packet_data[:-signature_len]
-        received_signature = packet_data[-signature_len:]
+        data_end = len(packet) - self.SIGNATURE_LEN
+        data_part = packet[:data_end]
+        received_signature = packet[data_end:]
+
+        if not verifier.verify(data_part, received_signature):
+            return Verdict.BAD_SIGNATURE, {
+                "reason": "Invalid HMAC Signature",
+                "apid": header.apid,
+                "signature_received": received_signature[:4].hex() + "...",
+            }
+
+        try:
+            payload = packet[payload_start:data_end]
+            command_str = str(payload, "utf-8")
+            return Verdict.ACCEPTED, (header, command_str, bytes(received_signature), key_id)
+        except Exception as e:
+            return Verdict.PARSE_ERROR, {"error": str(e), "apid": header.apid}
+
+    def _inspect(self, packet_data: Buffer, current_time: float) -> Tuple[Verdict, Any]:
+        """
+        Validate a packet: prefilters first, then the HMAC and payload.
+
+        The packet is only ever accessed through a memoryview, so it can be a slice of
+        a larger receive buffer and no per-field copies are made.
 
-        # 3. Validate Signature
-        if not self.verifier.verify(data_part, received_signature):
+        Returns:
+            Tuple[Verdict, Any]: The verdict, plus ``(PrimaryHeader, command, mac,
+            key_id)`` when authenticated or a dict of rejection details otherwise. Replay
+            detection is applied afterwards by _admit().
+        """
+        packet = memoryview(packet_data)
+        verdict, result = self._prefilter(packet, current_time)
+        if verdict is not Verdict.ACCEPTED:
+            return verdict, result
+        self.hmac_verifications += 1
+        return self._verify(packet, result)
+
+    def _admit(
+        self, result: Tuple[PrimaryHeader, str, bytes, Optional[int]]
+    ) -> Tuple[Verdict, Any]:
+        """
+        Run the anti-replay check on an authenticated packet, recording it if new.
+
+        In keyring mode each key has its own sequence windows, since every station
+        holding a key keeps its own sequence counter.
+
+        Returns:
+            Tuple[Verdict, Any]: ACCEPTED with ``(PrimaryHeader, command)``, or REPLAY
+            with its details.
+        """
+        header, command_str, mac, key_id = result
+        if self.replay_guard is not None:
+            details = self.replay_guard.check_and_update(
+                header.apid, header.sequence_count, mac, key_id
+            )
+            if details is not None:
+                self.stage_rejections["replay"] += 1
+                return Verdict.REPLAY, details
+        return Verdict.ACCEPTED, (header, command_str)
+
+    def process_packet(self, packet_data: Buffer) -> Verdict:
+        """
+        Ingest a raw packet, validate it, and decide whether to execute or drop.
+
+        Args:
+            packet_data (bytes): The received byte stream.
+
+        Returns:
+            Verdict: ACCEPTED, or the reason the packet was rejected.
+        """
+        logger.info("Received packet of size %d bytes.", len(packet_data))
+        if self.metrics is not None:
+            return self._process_packet_timed(packet_data)
+
+        verdict, result = self._inspect(packet_data, time.time())
+        if verdict is Verdict.ACCEPTED:
+            verdict, result = self._admit(result)
+
+        if verdict is Verdict.ACCEPTED:
+            # Execute Command
+            header, command_str = result
+            verdict = self._execute_command(command_str, header)
+        else:
+            self._reject(verdict, result)
+        return verdict
+
+    def _process_packet_timed(self, packet_data: Buffer) -> Verdict:
+        """
+        process_packet() with each stage timed into ``self.metrics``.
+
+        Stages: ``decode`` (length check and header decode), one per prefilter,
+        ``hmac`` (signature check and payload decode), ``replay``, ``execute`` or
+        ``reject`` (dispatch and telemetry), and ``total``.
+        """
+        metrics = self.metrics
+        assert metrics is not None
+        observe = metrics.observe
+        clock = time.perf_counter
+        start = mark = clock()
+
+        packet = memoryview(packet_data)
+        verdict, result = self._prefilter_timed(packet, time.time(), observe, clock)
+        mark = clock()
+        if verdict is Verdict.ACCEPTED:
+            self.hmac_verifications += 1
+            verdict, result = self._verify(packet, result)
+            now = clock()
+            observe("hmac", now - mark)
+            mark = now
+            if verdict is Verdict.ACCEPTED:
+                verdict, result = self._admit(result)
+                now = clock()
+                observe("replay", now - mark)
+                mark = now
+
+        if verdict is Verdict.ACCEPTED:
+            header, command_str = result
+            verdict = self._execute_command(command_str, header)
+            stage = "execute"
+        else:
+            self._reject(verdict, result)
+            stage = "reject"
+        now = clock()
+        observe(stage, now - mark)
+        observe("total", now - start)
+        metrics.verdicts[verdict.name] += 1
+        return verdict
+
+    def _prefilter_timed(
+        self,
+        packet: memoryview,
+        current_time: float,
+        observe: Callable[[str, float], None],
+        clock: Callable[[], float],
+    ) -> Tuple[Verdict, Any]:
+        """
+        _prefilter() with the header decode and each prefilter timed separately.
+        """
+        mark = clock()
+        size = len(packet)
+        if size < self.MIN_PACKET_LEN:
+            self.stage_rejections["min_length"] += 1
+            observe("decode", clock() - mark)
+            return Verdict.TOO_SHORT, {"reason": "Packet too short", "size": size}
+
+        header = decode_primary_header(packet)
+        now = clock()
+        observe("decode", now - mark)
+        for prefilter in self.prefilters:
+            mark = now
+            details = prefilter.check(packet, header, self.SIGNATURE_LEN, current_time)
+            now = clock()
+            observe(prefilter.name, now - mark)
+            if details is not None:
+                self.stage_rejections[prefilter.name] += 1
+                return prefilter.verdict, details
+
+        return Verdict.ACCEPTED, header
+
+    def _reject(self, verdict: Verdict, details: Dict[str, Any]) -> None:
+        """
+        Count a rejected packet and report it to telemetry.
+        """
+        self.rejected_commands += 1
+        event_type, severity = _REJECTION_EVENTS[verdict]
+        if self.violations is not None:
+            self.violations.record(event_type, details, severity)
+        else:
+            self.telemetry.log_event(event_type, details, severity)
+
+    def process_batch(
+        self, packets: Iterable[Buffer], current_time: Optional[float] = None
+    ) -> BatchResult:
+        """
+        Validate and execute a batch of packets.
+
+        Unlike process_packet, per-packet logging and telemetry are replaced by a
+        single BATCH_PROCESSED event summarising the batch, and the freshness check
+        uses one reference time for the whole batch.
+
+        Args:
+            packets (Iterable[bytes]): The received packets, in arrival order.
+            current_time (float): Reference time for freshness checks. Defaults to now.
+
+        Returns:
+            BatchResult: Per-packet verdict codes plus aggregate counts and throughput.
+        """
+        start = time.perf_counter()
+        now = time.time() if current_time is None else current_time
+        inspect = self._inspect
+        return self._apply_batch((inspect(p, now) for p in packets), start)
+
+    def process_buffer(
+        self,
+        buffer: Buffer,
+        offsets: Sequence[int],
+        current_time: Optional[float] = None,
+    ) -> BatchResult:
+        """
+        Validate packets stored back to back in one receive buffer.
+
+        Each packet is handed to the validator as a memoryview slice of ``buffer``,
+        so the batch is processed without copying packet bytes.
+
+        Args:
+            buffer (Buffer): Contiguous packet data (bytes, bytearray, mmap, ...).
+            offsets (Sequence[int]): N+1 increasing boundaries; packet i occupies
+                ``buffer[offsets[i]:offsets[i + 1]]``.
+            current_time (float): Reference time for freshness checks. Defaults to now.
+
+        Returns:
+            BatchResult: Same as process_batch.
+        """
+        view = memoryview(buffer)
+        packets = (view[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1))
+        return self.process_batch(packets, current_time)
+
+    def _apply_batch(self, results: Iterable[Tuple[Verdict, Any]], start: float) -> BatchResult:
+        """
+        Execute accepted commands in order and account for a batch of inspection
+        results, emitting one summary telemetry event.
+
+        Args:
+            results (Iterable[Tuple[Verdict, Any]]): _inspect() results in arrival order;
+                authenticated packets still go through _admit() here.
+            start (float): perf_counter() value taken when the batch started.
+        """
+        verdicts = array("B")
+        append = verdicts.append
+        accepted = 0
+
+        for verdict, result in results:
+            if verdict == Verdict.ACCEPTED:
+                verdict, result = self._admit(result)
+            if verdict == Verdict.ACCEPTED:
+                header, command_str = result
+                error = self._dispatch(header.apid, command_str)
+                if error is None:
+                    accepted += 1
+                else:
+                    # Handler failures are rare enough to report individually
+                    verdict = Verdict.PARSE_ERROR
+                    self.telemetry.log_event("PARSING_ERROR", error, "HIGH")
+            append(verdict)
+
+        elapsed = time.perf_counter() - start
+        rejected = len(verdicts) - accepted
+        self.accepted_commands += accepted
+        self.rejected_commands += rejected
+
+        reasons = {
+            Verdict(code).name: count
+            for code, count in Counter(verdicts).items()
+            if code != Verdict.ACCEPTED
+        }
+        batch_result = BatchResult(verdicts, accepted, rejected, elapsed, reasons)
+        if self.metrics is not None and verdicts:
+            self.metrics.observe("batch", elapsed)
+            self.metrics.verdicts.update(reasons)
+            self.metrics.verdicts[Verdict.ACCEPTED.name] += accepted
+
+        if verdicts:
             self.telemetry.log_event(
-                "SECURITY_VIOLATION",
+                "BATCH_PROCESSED",
                 {
-                    "reason": "Invalid HMAC Signature",
-                    "signature_received": received_signature.hex()[:8] + "...",
+                    "packets": len(verdicts),
+                    "accepted": accepted,
+                    "rejected": reasons,
+                    "packets_per_second": round(batch_result.packets_per_second, 1),
                 },
-                "CRITICAL",
+                _batch_severity(reasons),
+            )
+            logger.info(
+                "Processed batch of %d packets: %d accepted, %d rejected (%.0f pkt/s)",
+                len(verdicts),
+                accepted,
+                rejected,
+                batch_result.packets_per_second,
             )
-            self.rejected_commands += 1
-            return
+        return batch_result
 
-        # 4. Parse Header (Simplified CCSDS parsing)
-        try:
-            # Primary Header is first 6 bytes
-            primary_header = data_part[:6]
-            # Unpack to check APID, etc if needed
-            # byte1_2, byte3_4, length = struct.unpack('>HHH', primary_header)
-
-            # Secondary Header (Timestamp) - next 8 bytes
-            timestamp_bytes = data_part[6:14]
-            packet_timestamp = struct.unpack(">d", timestamp_bytes)[0]
-
-            # 5. Check Freshness (Anti-Replay / Freshness)
-            current_time = time.time()
-            if abs(current_time - packet_timestamp) > 60.0:  # 60 second window
-                self.telemetry.log_event(
-                    "PACKET_REJECTED",
-                    {
-                        "reason": "Timestamp stale",
-                        "packet_time": packet_timestamp,
-                        "current_time": current_time,
-                    },
-                    "MEDIUM",
-                )
-                self.rejected_commands += 1
-                return
-
-            # 6. Extract Payload
-            payload_bytes = data_part[14:]
-            command_str = payload_bytes.decode("utf-8")
-
-            # 7. Execute Command
-            self._execute_command(command_str)
+    def _dispatch(self, apid: int, command_str: str) -> Optional[Dict[str, Any]]:
+        """
+        Run the handler registered for the packet's APID, if any.
 
+        Returns:
+            Optional[Dict[str, Any]]: None if the command ran, otherwise rejection
+            details describing the exception raised by the handler.
+        """
+        handler = self.handlers.get(apid, self.default_handler)
+        if handler is None:
+            return None
+        try:
+            handler(command_str)
         except Exception as e:
-            self.telemetry.log_event("PARSING_ERROR", {"error": str(e)}, "HIGH")
-            self.rejected_commands += 1
+            logger.exception("Handler for APID 0x%03X failed on %r", apid, command_str)
+            return {"error": str(e), "apid": apid, "command": command_str}
+        return None
 
-    def _execute_command(self, command_str: str):
+    def _execute_command(self, command_str: str, header: PrimaryHeader) -> Verdict:
         """
         Simulate command execution.
+
+        Returns:
+            Verdict: ACCEPTED, or PARSE_ERROR if the command handler raised.
         """
+        error = self._dispatch(header.apid, command_str)
+        if error is not None:
+            self._reject(Verdict.PARSE_ERROR, error)
+            return Verdict.PARSE_ERROR
         self.accepted_commands += 1
-        self.telemetry.log_event("COMMAND_EXECUTED", {"command": command_str}, "INFO")
-        logger.info(f"*** EXECUTING COMMAND: {command_str} ***")
+        self.telemetry.log_event(
+            "COMMAND_EXECUTED", {"command": command_str, "apid": header.apid}, "INFO"
+        )
+        logger.info("*** EXECUTING COMMAND: %s ***", command_str)
+        return Verdict.ACCEPTED
@@ -0,0 +1,206 @@
+import bisect
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds in seconds; chosen to resolve both microsecond stages (prefilters,
+# HMAC) and millisecond ones (telemetry I/O, whole batches).
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    2.5e-2,
+    0.1,
+    1.0,
+)
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram (Prometheus-style cumulative buckets on export).
+
+    Recording is a bisect over the bucket bounds plus two additions, so the cost
+    does not depend on how many values have been observed.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        # One extra slot for values above the last bound (+Inf)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket that contains it.
+
+        Values beyond the last bucket are reported as the last bound.
+        """
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return self.bounds[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        counts = list(self.counts)
+        cumulative = []
+        running = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": [[bound, n] for bound, n in zip(self.bounds, cumulative)]
+            + [["+Inf", cumulative[-1]]],
+        }
+
+
+class FirewallMetrics:
+    """
+    Per-stage latency histograms and per-reason verdict counters for SpaceFirewall.
+
+    Pass an instance as ``SpaceFirewall(..., metrics=FirewallMetrics())`` to enable
+    instrumentation; without one the firewall skips all timing.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.stages: Dict[str, Histogram] = {}
+        self.verdicts: "Counter[str]" = Counter()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a JSON-serialisable copy of all histograms and counters.
+        """
+        return {
+            "stages": {name: h.snapshot() for name, h in list(self.stages.items())},
+            "verdicts": dict(self.verdicts),
+        }
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+def render_prometheus(snapshot: Dict[str, Any], prefix: str = "satellite_firewall") -> str:
+    """
+    Render a SpaceFirewall.metrics_snapshot() in the Prometheus text exposition format.
+    """
+    lines: List[str] = []
+
+    def metric(name: str, kind: str, help_text: str) -> str:
+        full = f"{prefix}_{name}"
+        lines.append(f"# HELP {full} {help_text}")
+        lines.append(f"# TYPE {full} {kind}")
+        return full
+
+    for name, key, help_text in (
+        ("accepted_total", "accepted", "Commands accepted and executed."),
+        ("rejected_total", "rejected", "Packets rejected."),
+        ("hmac_verifications_total", "hmac_verifications", "Packets that reached HMAC."),
+    ):
+        lines.append(f"{metric(name, 'counter', help_text)} {snapshot[key]}")
+
+    full = metric("stage_rejections_total", "counter", "Rejections per filter stage.")
+    for stage, count in sorted(snapshot["stage_rejections"].items()):
+        lines.append(f"{full}{_labels(stage=stage)} {count}")
+
+    metrics = snapshot.get("metrics")
+    if metrics is not None:
+        full = metric("verdicts_total", "counter", "Packets per verdict.")
+        for verdict, count in sorted(metrics["verdicts"].items()):
+            lines.append(f"{full}{_labels(verdict=verdict)} {count}")
+
+        full = metric("stage_seconds", "histogram", "Time spent per firewall stage.")
+        for stage, hist in sorted(metrics["stages"].items()):
+            for bound, count in hist["buckets"]:
+                lines.append(f"{full}_bucket{_labels(stage=stage, le=bound)} {count}")
+            lines.append(f"{full}_sum{_labels(stage=stage)} {hist['sum']:.9f}")
+            lines.append(f"{full}_count{_labels(stage=stage)} {hist['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    Serve Prometheus text from a render callback at ``/metrics`` on a local port.
+
+    Runs in a daemon thread; requests only read counters, so the firewall keeps
+    running on its own thread.
+    """
+
+    def __init__(self, render: Callable[[], str], host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            render (Callable[[], str]): Produces the exposition text for each scrape.
+            host (str): Interface to bind (localhost by default).
+            port (int): Port to bind; 0 picks a free one (see ``address``).
+        """
+        self.render = render
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.address: Tuple[str, int] = self._server.server_address[:2]  # type: ignore
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
@@ -0,0 +1,144 @@
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from satellite_sim.satellite.ccsds import PrimaryHeader
+from satellite_sim.satellite.firewall import BatchResult, Buffer, SpaceFirewall, Verdict
+
+logger = logging.getLogger(__name__)
+
+# Verification-only copy of the parent's firewall, one per worker process.
+_worker_firewall: Optional[SpaceFirewall] = None
+
+
+def _init_worker(firewall: SpaceFirewall) -> None:
+    global _worker_firewall
+    _worker_firewall = firewall
+
+
+def _keyring_version(firewall: SpaceFirewall) -> Optional[int]:
+    return None if firewall.keyring is None else firewall.keyring.version
+
+
+def _verify_chunk(
+    task: Tuple[Optional[int], Sequence[Tuple[bytes, PrimaryHeader]]],
+) -> List[Tuple[Verdict, Any]]:
+    keyring_version, chunk = task
+    assert _worker_firewall is not None
+    if _keyring_version(_worker_firewall) != keyring_version:
+        # Verifying against an outdated keyring would reject packets signed with new keys
+        raise RuntimeError("Worker keyring is out of date")
+    verify = _worker_firewall._verify
+    return [verify(memoryview(packet), header) for packet, header in chunk]
+
+
+class ParallelFirewall:
+    """
+    Shards HMAC verification for a SpaceFirewall across worker processes.
+
+    The parent runs the firewall's cheap (and possibly stateful) prefilters; packets
+    that survive are split into contiguous chunks and HMAC-verified in parallel.
+    Results are merged back in arrival order in the parent, which executes accepted
+    commands and owns all counters and telemetry. Ordering of accepted commands (and
+    therefore per-APID ordering) is the same as with SpaceFirewall.process_batch.
+
+    Workers get a copy of the firewall, including its keyring, when they start. Each
+    chunk carries the parent's keyring version; if keys were added, rotated or
+    retired since the workers started, the pool is restarted with the current
+    keyring before the next batch is verified.
+    """
+
+    def __init__(
+        self, firewall: SpaceFirewall, workers: Optional[int] = None, chunk_size: int = 1024
+    ):
+        """
+        Args:
+            firewall (SpaceFirewall): The firewall whose policy and state are used.
+            workers (int): Number of worker processes. Defaults to the CPU count.
+            chunk_size (int): Packets sent to a worker per task.
+        """
+        self.firewall = firewall
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = self._start_workers()
+
+    def _start_workers(self) -> ProcessPoolExecutor:
+        keyring = self.firewall.keyring
+        self._keyring = keyring
+        self._keyring_version = _keyring_version(self.firewall)
+        return ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(self.firewall,)
+        )
+
+    def _sync_keyring(self) -> None:
+        """
+        Restart the workers if the firewall's keyring changed since they started.
+        """
+        firewall = self.firewall
+        if (
+            firewall.keyring is self._keyring
+            and _keyring_version(firewall) == self._keyring_version
+        ):
+            return
+        logger.info("Keyring changed; restarting %d verification workers", self.workers)
+        self._executor.shutdown(wait=True)
+        self._executor = self._start_workers()
+
+    def process_batch(
+        self, packets: Iterable[Buffer], current_time: Optional[float] = None
+    ) -> BatchResult:
+        """
+        Validate a batch of packets in parallel and apply the results to the firewall.
+
+        Args:
+            packets (Iterable[bytes]): The received packets, in arrival order.
+            current_time (float): Reference time for freshness checks. Defaults to now.
+
+        Returns:
+            BatchResult: Same as SpaceFirewall.process_batch.
+        """
+        start = time.perf_counter()
+        now = time.time() if current_time is None else current_time
+        firewall = self.firewall
+
+        results: List[Optional[Tuple[Verdict, Any]]] = []
+        pending: List[Tuple[bytes, PrimaryHeader]] = []
+        slots: List[int] = []
+        for packet_data in packets:
+            packet = memoryview(packet_data)
+            verdict, result = firewall._prefilter(packet, now)
+            if verdict is Verdict.ACCEPTED:
+                slots.append(len(results))
+                pending.append((bytes(packet), result))
+                results.append(None)
+            else:
+                results.append((verdict, result))
+
+        firewall.hmac_verifications += len(pending)
+        if pending:
+            self._sync_keyring()
+        version = self._keyring_version
+        chunks = [
+            (version, pending[i : i + self.chunk_size])
+            for i in range(0, len(pending), self.chunk_size)
+        ]
+        verified = itertools.chain.from_iterable(self._executor.map(_verify_chunk, chunks))
+        for slot, outcome in zip(slots, verified):
+            results[slot] = outcome
+
+        return firewall._apply_batch((outcome for outcome in results if outcome is not None), start)
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes.
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ParallelFirewall":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
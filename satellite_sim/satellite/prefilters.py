@@ -0,0 +1,209 @@
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from satellite_sim.crypto.keyring import Keyring
+from satellite_sim.satellite.ccsds import PrimaryHeader, decode_key_id, decode_timestamp
+from satellite_sim.satellite.verdict import Verdict
+
+Details = Optional[Dict[str, Any]]
+
+
+class Prefilter:
+    """
+    A cheap check run by SpaceFirewall on the decoded primary header before the
+    HMAC is computed.
+
+    Subclasses set ``name`` (used for per-stage counters) and ``verdict`` (reported
+    when the filter rejects a packet) and implement check().
+    """
+
+    name = "prefilter"
+    verdict = Verdict.PARSE_ERROR
+
+    def check(
+        self, packet: memoryview, header: PrimaryHeader, signature_len: int, now: float
+    ) -> Details:
+        """
+        Inspect a packet.
+
+        Args:
+            packet (memoryview): The whole packet, including the trailing HMAC.
+            header (PrimaryHeader): The already decoded primary header.
+            signature_len (int): Length of the trailing HMAC.
+            now (float): Reference time for time-based checks.
+
+        Returns:
+            Optional[Dict[str, Any]]: Rejection details, or None to let the packet through.
+        """
+        raise NotImplementedError
+
+
+class HeaderSanityFilter(Prefilter):
+    """
+    Rejects packets that are not version-0 telecommands with a secondary header.
+    """
+
+    name = "header_sanity"
+    verdict = Verdict.MALFORMED_HEADER
+
+    def check(
+        self, packet: memoryview, header: PrimaryHeader, signature_len: int, now: float
+    ) -> Details:
+        if header.version == 0 and header.packet_type == 1 and header.sec_header_flag:
+            return None
+        return {
+            "reason": "Malformed primary header",
+            "apid": header.apid,
+            "version": header.version,
+            "packet_type": header.packet_type,
+            "sec_header_flag": header.sec_header_flag,
+        }
+
+
+class LengthFieldFilter(Prefilter):
+    """
+    Rejects packets whose size disagrees with the primary-header length field.
+    """
+
+    name = "length_field"
+    verdict = Verdict.LENGTH_MISMATCH
+
+    def check(
+        self, packet: memoryview, header: PrimaryHeader, signature_len: int, now: float
+    ) -> Details:
+        declared = header.total_length + signature_len
+        if declared == len(packet):
+            return None
+        return {
+            "reason": "Length field mismatch",
+            "apid": header.apid,
+            "declared": declared,
+            "size": len(packet),
+        }
+
+
+class AllowedAPIDFilter(Prefilter):
+    """
+    Rejects packets addressed to APIDs outside an allow-list.
+    """
+
+    name = "allowed_apid"
+    verdict = Verdict.APID_NOT_ALLOWED
+
+    def __init__(self, apids: Iterable[int]):
+        self.apids = frozenset(apids)
+
+    def check(
+        self, packet: memoryview, header: PrimaryHeader, signature_len: int, now: float
+    ) -> Details:
+        if header.apid in self.apids:
+            return None
+        return {"reason": "APID not allowed", "apid": header.apid}
+
+
+class TimestampWindowFilter(Prefilter):
+    """
+    Rejects packets whose secondary-header timestamp is outside the freshness window.
+
+    The timestamp is not authenticated yet at this point, but the HMAC check still
+    runs afterwards, so checking it first only saves work.
+    """
+
+    name = "timestamp_window"
+    verdict = Verdict.STALE_TIMESTAMP
+
+    def __init__(self, window: float = 60.0):
+        self.window = window
+
+    def check(
+        self, packet: memoryview, header: PrimaryHeader, signature_len: int, now: float
+    ) -> Details:
+        packet_time = decode_timestamp(packet)
+        if abs(now - packet_time) <= self.window:
+            return None
+        return {
+            "reason": "Timestamp stale",
+            "apid": header.apid,
+            "packet_time": packet_time,
+            "current_time": now,
+        }
+
+
+class RateLimitFilter(Prefilter):
+    """
+    Token-bucket rate limit per source (the APID unless ``key`` says otherwise).
+
+    Tokens refill from the reference time passed to check(); a batch shares one
+    reference time, so within a batch a source can spend at most ``burst`` packets.
+    """
+
+    name = "rate_limit"
+    verdict = Verdict.RATE_LIMITED
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        key: Optional[Callable[[PrimaryHeader], Hashable]] = None,
+    ):
+        """
+        Args:
+            rate (float): Sustained packets per second allowed per source.
+            burst (int): Bucket size. Defaults to one second's worth of packets.
+            key (Callable): Maps a header to its source. Defaults to the APID.
+        """
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max(1, int(rate)))
+        self.key = key
+        self._buckets: Dict[Hashable, Tuple[float, float]] = {}
+
+    def check(
+        self, packet: memoryview, header: PrimaryHeader, signature_len: int, now: float
+    ) -> Details:
+        source = header.apid if self.key is None else self.key(header)
+        tokens, last = self._buckets.get(source, (self.burst, now))
+        tokens = min(self.burst, tokens + max(0.0, now - last) * self.rate)
+        if tokens >= 1.0:
+            self._buckets[source] = (tokens - 1.0, now)
+            return None
+        self._buckets[source] = (tokens, now)
+        return {"reason": "Rate limit exceeded", "apid": header.apid}
+
+
+class KeyIDFilter(Prefilter):
+    """
+    Rejects packets whose secondary-header key ID is unknown or outside its validity
+    window at the reference time.
+
+    SpaceFirewall adds this filter automatically when it is given a keyring.
+    """
+
+    name = "key_id"
+    verdict = Verdict.UNKNOWN_KEY
+
+    def __init__(self, keyring: Keyring):
+        self.keyring = keyring
+
+    def check(
+        self, packet: memoryview, header: PrimaryHeader, signature_len: int, now: float
+    ) -> Details:
+        key_id = decode_key_id(packet)
+        entry = self.keyring.get(key_id)
+        if entry is None:
+            return {"reason": "Unknown key ID", "apid": header.apid, "key_id": key_id}
+        if entry.valid_at(now):
+            return None
+        return {
+            "reason": "Key not valid at this time",
+            "apid": header.apid,
+            "key_id": key_id,
+            "not_before": entry.not_before,
+            "not_after": entry.not_after,
+        }
+
+
+def default_prefilters(freshness_window: float = 60.0) -> List[Prefilter]:
+    """
+    The pipeline SpaceFirewall uses when none is given: header sanity, length field
+    consistency and the timestamp freshness window, in that order.
+    """
+    return [HeaderSanityFilter(), LengthFieldFilter(), TimestampWindowFilter(freshness_window)]
@@ -0,0 +1,122 @@
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+# CCSDS sequence counts are 14 bits and wrap around
+SEQUENCE_MODULUS = 1 << 14
+_HALF_RANGE = SEQUENCE_MODULUS // 2
+
+
+class SequenceWindow:
+    """
+    IPsec-style sliding anti-replay window over a 14-bit sequence counter.
+
+    ``top`` is the highest sequence count accepted so far and bit ``i`` of
+    ``bitmap`` records whether ``top - i`` has been seen. Counts up to half the
+    sequence space ahead of ``top`` (modulo wraparound) advance the window; older
+    counts are accepted once if they are still inside the window.
+    """
+
+    __slots__ = ("size", "top", "bitmap", "_mask")
+
+    def __init__(self, size: int = 64):
+        self.size = size
+        self.top: Optional[int] = None
+        self.bitmap = 0
+        self._mask = (1 << size) - 1
+
+    def check_and_update(self, seq: int) -> Optional[str]:
+        """
+        Record ``seq`` if it has not been seen before.
+
+        Returns:
+            Optional[str]: None if the count is new, otherwise why it was refused.
+        """
+        if self.top is None:
+            self.top, self.bitmap = seq, 1
+            return None
+
+        ahead = (seq - self.top) % SEQUENCE_MODULUS
+        if ahead == 0:
+            return "Duplicate sequence count"
+        if ahead < _HALF_RANGE:
+            self.bitmap = ((self.bitmap << ahead) | 1) & self._mask
+            self.top = seq
+            return None
+
+        behind = SEQUENCE_MODULUS - ahead
+        if behind >= self.size:
+            return "Sequence count outside replay window"
+        bit = 1 << behind
+        if self.bitmap & bit:
+            return "Duplicate sequence count"
+        self.bitmap |= bit
+        return None
+
+
+class ReplayGuard:
+    """
+    Constant-time, constant-memory duplicate detection for authenticated packets.
+
+    Keeps a SequenceWindow per APID (per APID and key ID when packets carry
+    one), backed by a bounded cache of the MACs of the last ``mac_cache_size``
+    accepted packets. The MAC covers the header, so an exact re-send repeats
+    both its sequence count and its MAC; the cache rejects it even where the
+    window would not, such as an old packet whose count reads as ahead of the
+    window once the 14-bit counter has wrapped.
+
+    The windows trust the counter: if a sender's counter is reset, its new,
+    legitimate packets are rejected as duplicates or outside the window until
+    their counts read as ahead of the old high-water mark, which normally
+    means until they pass it.
+    """
+
+    def __init__(self, window_size: int = 64, mac_cache_size: int = 4096):
+        """
+        Args:
+            window_size (int): Width of each sequence window.
+            mac_cache_size (int): Number of recent MACs remembered.
+        """
+        self.window_size = window_size
+        self.mac_cache_size = mac_cache_size
+        self._windows: Dict[Tuple[int, Optional[int]], SequenceWindow] = {}
+        self._recent_macs: Set[bytes] = set()
+        self._mac_order: Deque[bytes] = deque()
+
+    def check_and_update(
+        self, apid: int, seq: int, mac: bytes, key_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Check an authenticated packet and, if it is new, remember it.
+
+        Args:
+            apid (int): The packet's APID.
+            seq (int): The packet's 14-bit sequence count.
+            mac (bytes): The packet's verified MAC.
+            key_id (int): The key that signed the packet, if a keyring is in use.
+                Each (APID, key ID) pair gets its own sequence window.
+
+        Returns:
+            Optional[Dict[str, Any]]: Rejection details, or None if the packet is new.
+        """
+        if mac in self._recent_macs:
+            return self._details("Replayed packet (duplicate MAC)", apid, seq, key_id)
+
+        window = self._windows.get((apid, key_id))
+        if window is None:
+            window = self._windows[(apid, key_id)] = SequenceWindow(self.window_size)
+        reason = window.check_and_update(seq)
+        if reason is not None:
+            return self._details(reason, apid, seq, key_id)
+
+        self._recent_macs.add(mac)
+        self._mac_order.append(mac)
+        if len(self._mac_order) > self.mac_cache_size:
+            self._recent_macs.discard(self._mac_order.popleft())
+        return None
+
+    @staticmethod
+    def _details(reason: str, apid: int, seq: int, key_id: Optional[int]) -> Dict[str, Any]:
+        details: Dict[str, Any] = {"reason": reason, "apid": apid, "sequence": seq}
+        if key_id is not None:
+            details["key_id"] = key_id
+        return details
@@ -0,0 +1,180 @@
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from satellite_sim.satellite.telemetry import TelemetrySystem
+
+# Loggers that emit a record per packet on the receive path
+NOISY_LOGGERS = (
+    "satellite_sim.satellite.firewall",
+    "satellite_sim.satellite.telemetry",
+    "satellite_sim.crypto.verifier",
+    "satellite_sim.crypto.hmac_signer",
+    "satellite_sim.ground_station.legit",
+    "satellite_sim.ground_station.rogue",
+)
+
+
+class ViolationAggregator:
+    """
+    Collapse repeated identical security violations into periodic summary events.
+
+    Violations are keyed by (event type, reason, APID). Within each window the
+    first ``burst`` occurrences of a key are reported to telemetry in full; the
+    rest are only counted. Once the window has passed, a single VIOLATION_SUMMARY
+    event reports how many were suppressed, e.g. "120 SECURITY_VIOLATION events
+    (Invalid HMAC Signature) from APID 0x100 in last 5 s".
+    """
+
+    SUMMARY_EVENT = "VIOLATION_SUMMARY"
+
+    def __init__(
+        self,
+        telemetry: TelemetrySystem,
+        window: float = 5.0,
+        burst: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            telemetry (TelemetrySystem): Receives full and summary events.
+            window (float): Seconds over which repeats are collapsed.
+            burst (int): Occurrences per key and window reported in full.
+            clock (Callable[[], float]): Monotonic time source.
+        """
+        self.telemetry = telemetry
+        self.window = window
+        self.burst = burst
+        self.clock = clock
+        # key -> [window start, occurrences, severity]
+        self._windows: Dict[Tuple[str, Any, Any], List[Any]] = {}
+        self._next_sweep = clock() + window
+        self.suppressed = 0
+
+    def record(self, event_type: str, details: Dict[str, Any], severity: str) -> bool:
+        """
+        Report a violation, or count it if its key is over budget for this window.
+
+        Returns:
+            bool: True if the event was sent to telemetry in full.
+        """
+        now = self.clock()
+        if now >= self._next_sweep:
+            self.flush(now)
+
+        key = (event_type, details.get("reason"), details.get("apid"))
+        state = self._windows.get(key)
+        if state is None:
+            state = self._windows[key] = [now, 0, severity]
+        state[1] += 1
+        if state[1] <= self.burst:
+            self.telemetry.log_event(event_type, details, severity)
+            return True
+        self.suppressed += 1
+        return False
+
+    def flush(self, now: Optional[float] = None) -> None:
+        """
+        Emit summaries for windows that have ended (all windows if ``now`` is None).
+        """
+        sweep_all = now is None
+        if now is None:
+            now = self.clock()
+        for key, (start, count, severity) in list(self._windows.items()):
+            if not sweep_all and now - start < self.window:
+                continue
+            del self._windows[key]
+            if count > self.burst:
+                self._emit_summary(key, count - self.burst, severity, now - start)
+        self._next_sweep = now + self.window
+
+    def _emit_summary(
+        self, key: Tuple[str, Any, Any], suppressed: int, severity: str, elapsed: float
+    ) -> None:
+        event_type, reason, apid = key
+        source = f" from APID {apid:#05x}" if isinstance(apid, int) else ""
+        label = f" ({reason})" if reason else ""
+        span = max(elapsed, self.window)
+        self.telemetry.log_event(
+            self.SUMMARY_EVENT,
+            {
+                "event_type": event_type,
+                "reason": reason,
+                "apid": apid,
+                "suppressed": suppressed,
+                "window_seconds": self.window,
+                "message": f"{suppressed} {event_type} events{label}{source} in last {span:g} s",
+            },
+            severity,
+        )
+
+
+class SuppressionFilter(logging.Filter):
+    """
+    Rate-limit repeated log records and sample DEBUG records.
+
+    Records are grouped by logger, level and *unformatted* message template, so the
+    filter never formats a record it drops. Each group may emit ``burst`` records
+    per ``interval`` seconds; the first record after a suppressed stretch notes how
+    many were dropped. Only every ``debug_sample``-th DEBUG record is kept.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        burst: int = 10,
+        debug_sample: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self.debug_sample = debug_sample
+        self.clock = clock
+        self._debug_seen = 0
+        # key -> [window start, records in window, suppressed]
+        self._groups: Dict[Tuple[str, int, Any], List[Any]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno <= logging.DEBUG and self.debug_sample > 1:
+            self._debug_seen += 1
+            if self._debug_seen % self.debug_sample != 1:
+                return False
+
+        now = self.clock()
+        key = (record.name, record.levelno, record.msg)
+        group = self._groups.get(key)
+        if group is None or now - group[0] >= self.interval:
+            suppressed = group[2] if group is not None else 0
+            self._groups[key] = [now, 1, 0]
+            if suppressed:
+                record.msg = (
+                    f"{record.getMessage()} "
+                    f"[{suppressed} similar messages suppressed in the last {self.interval:g} s]"
+                )
+                record.args = None
+            return True
+        group[1] += 1
+        if group[1] <= self.burst:
+            return True
+        group[2] += 1
+        return False
+
+
+def install_log_suppression(
+    loggers: Iterable[str] = NOISY_LOGGERS, **kwargs: Any
+) -> SuppressionFilter:
+    """
+    Attach one SuppressionFilter to each of the given loggers.
+
+    Args:
+        loggers (Iterable[str]): Logger names; defaults to the per-packet loggers.
+        **kwargs: Passed to SuppressionFilter.
+
+    Returns:
+        SuppressionFilter: The installed filter (shared by all the loggers).
+    """
+    suppression = SuppressionFilter(**kwargs)
+    for name in loggers:
+        logging.getLogger(name).addFilter(suppression)
+    return suppression
@@ -1,54 +1,244 @@
-import json
 import logging
+import queue
+import sys
+import threading
 import time
-from dataclasses import dataclass, asdict
-from typing import Dict, Any
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+from satellite_sim.satellite.event_store import EventStore, NDJSONEventStore
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class SecurityEvent:
+    """
+    A single telemetry event.
+
+    Slotted to keep per-event memory small; converted to a dict only when the
+    event is persisted or returned from get_all_events().
+    """
+
+    __slots__ = ("timestamp", "event_type", "details", "severity")
+
     timestamp: float
     event_type: str
     details: Dict[str, Any]
     severity: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "details": dict(self.details),
+            "severity": self.severity,
+        }
+
+
+def _format_log_entry(event: SecurityEvent) -> str:
+    return (
+        f"[{time.ctime(event.timestamp)}] [{event.severity}] "
+        f"{event.event_type}: {event.details}\n"
+    )
+
 
 class TelemetrySystem:
     """
     Handles logging of security events and telemetry downlink.
+
+    In buffered mode, events are queued in memory and written to disk in batches by
+    a background writer thread, so callers on the packet path never wait on file I/O.
+    Use ``flush()``/``close()`` or a ``with`` block to make sure everything is written.
     """
 
-    def __init__(self, log_file: str = "telemetry.log", events_file: str = "security_events.json"):
+    _STOP = object()
+    _FLUSH = object()
+
+    def __init__(
+        self,
+        log_file: str = "telemetry.log",
+        events_file: str = "security_events.json",
+        event_store: Optional[EventStore] = None,
+        buffered: bool = False,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        max_queue: int = 10000,
+        max_events: Optional[int] = 10000,
+    ):
+        """
+        Args:
+            log_file (str): Human-readable telemetry log.
+            events_file (str): JSON array snapshot of all security events.
+            event_store (EventStore): Persistence backend for structured events.
+                Defaults to an append-only NDJSON journal compacted into events_file.
+            buffered (bool): Write events from a background thread instead of inline.
+            batch_size (int): Maximum number of events written per batch.
+            flush_interval (float): Maximum seconds an event waits before being written.
+            max_queue (int): Queue capacity; log_event blocks when it is full.
+            max_events (int): Number of recent events kept in memory (ring buffer).
+                None keeps every event. Counters always cover the full session.
+        """
         self.log_file = log_file
         self.events_file = events_file
-        self.events = []
+        self.max_events = max_events
+        self.events: "deque[SecurityEvent]" = deque(maxlen=max_events)
+        self.total_events = 0
+        self.event_counts: "Counter[tuple]" = Counter()
+        self.event_store = event_store if event_store is not None else NDJSONEventStore(events_file)
+        self.event_store.reset()
 
         # clear previous logs
         with open(self.log_file, "w") as f:
             f.write("--- SATELLITE TELEMETRY STREAM START ---\n")
 
-    def log_event(self, event_type: str, details: Dict[str, Any], severity: str = "INFO"):
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._closed = False
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._writer: Optional[threading.Thread] = None
+        if buffered:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="telemetry-writer", daemon=True
+            )
+            self._writer.start()
+
+    def log_event(self, event_type: str, details: Dict[str, Any], severity: str = "INFO") -> None:
         """
         Logs a security event to the telemetry stream.
+
+        Raises:
+            RuntimeError: If the telemetry system has been closed.
         """
+        if self._closed:
+            raise RuntimeError(f"Cannot log {event_type}: telemetry system is closed")
+        # Event type and severity come from a small fixed vocabulary; interning
+        # lets every retained event share the same string objects.
+        event_type = sys.intern(event_type)
+        severity = sys.intern(severity)
         event = SecurityEvent(
             timestamp=time.time(), event_type=event_type, details=details, severity=severity
         )
 
-        self.events.append(asdict(event))
+        self.events.append(event)
+        self.total_events += 1
+        self.event_counts[(event_type, severity)] += 1
+
+        if self._writer is not None:
+            self._queue.put(event)
+        else:
+            self._write_batch([event])
+
+        logger.info("Telemetry Sent: %s - %s", event_type, severity)
+
+    def get_all_events(self) -> List[Dict[str, Any]]:
+        """
+        Return the retained events, oldest first.
 
+        Only the most recent ``max_events`` events are kept; see get_summary()
+        for counts over the whole session.
+        """
+        return [event.to_dict() for event in self.events]
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Return aggregated event counters for the whole session.
+
+        Returns:
+            Dict[str, Any]: Totals plus counts by event type and by severity.
+        """
+        by_type: "Counter[str]" = Counter()
+        by_severity: "Counter[str]" = Counter()
+        for (event_type, severity), count in self.event_counts.items():
+            by_type[event_type] += count
+            by_severity[severity] += count
+        return {
+            "total_events": self.total_events,
+            "retained_events": len(self.events),
+            "dropped_events": self.total_events - len(self.events),
+            "by_type": dict(by_type),
+            "by_severity": dict(by_severity),
+        }
+
+    def _write_batch(self, events: List[SecurityEvent]) -> None:
         # Write to text log
-        log_entry = f"[{time.ctime(event.timestamp)}] [{severity}] {event_type}: {details}\n"
         with open(self.log_file, "a") as f:
-            f.write(log_entry)
+            f.write("".join(_format_log_entry(e) for e in events))
+
+        # Persist structured events (simulating a structured downlink)
+        self.event_store.append_many([e.to_dict() for e in events])
+
+    def _collect_batch(self, item: Any) -> Tuple[List[SecurityEvent], int, bool]:
+        """
+        Gather queued events into a batch, starting with ``item``.
 
-        # Write to JSON dump (simulating a structured downlink)
-        with open(self.events_file, "w") as f:
-            json.dump(self.events, f, indent=2)
+        Returns:
+            Tuple[List[SecurityEvent], int, bool]: The events, how many queue items
+            were consumed (including sentinels), and whether a stop was requested.
+        """
+        batch: List[SecurityEvent] = []
+        consumed = 0
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            consumed += 1
+            if item is self._STOP:
+                return batch, consumed, True
+            if item is self._FLUSH:
+                return batch, consumed, False
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= self.batch_size or remaining <= 0:
+                return batch, consumed, False
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return batch, consumed, False
+
+    def _writer_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch, consumed, stopping = self._collect_batch(item)
+            try:
+                if batch:
+                    self._write_batch(batch)
+                self.event_store.flush()
+            except Exception:
+                logger.exception("Telemetry writer failed to persist a batch")
+            finally:
+                for _ in range(consumed):
+                    self._queue.task_done()
+
+    def flush(self) -> None:
+        """
+        Block until all queued events are written, then flush the event store.
+        """
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(self._FLUSH)
+            self._queue.join()
+        self.event_store.flush()
+
+    def close(self) -> None:
+        """
+        Drain the queue, stop the writer thread and close the event store,
+        writing a final events_file snapshot. Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._queue.put(self._STOP)
+            self._writer.join()
+        self.event_store.close()
 
-        logger.info(f"Telemetry Sent: {event_type} - {severity}")
+    def __enter__(self) -> "TelemetrySystem":
+        return self
 
-    def get_all_events(self):
-        return self.events
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
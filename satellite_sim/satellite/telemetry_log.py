@@ -0,0 +1,230 @@
+import os
+import re
+import time
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO
+
+# Matches the lines written by TelemetrySystem: "[<ctime>] [<SEVERITY>] <TYPE>: <details>"
+_LINE_RE = re.compile(r"^\[(?P<time>[^\]]+)\] \[(?P<severity>[A-Z]+)\] (?P<type>[A-Z_]+): ")
+_SINCE_RE = re.compile(r"^(?P<value>\d+(?:\.\d+)?)(?P<unit>[smhd])$")
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+@lru_cache(maxsize=4096)
+def _parse_ctime(text: str) -> float:
+    # Many consecutive events share the same second, so the cache absorbs most calls
+    return time.mktime(time.strptime(text, "%a %b %d %H:%M:%S %Y"))
+
+
+class LogEntry(NamedTuple):
+    """
+    One parsed line of the human-readable telemetry log.
+    """
+
+    time_text: str
+    severity: str
+    event_type: str
+    line: str
+
+    @property
+    def timestamp(self) -> float:
+        return _parse_ctime(self.time_text)
+
+
+def parse_line(line: str) -> Optional[LogEntry]:
+    """
+    Parse a telemetry log line; returns None for banners and unrecognised lines.
+    """
+    match = _LINE_RE.match(line)
+    if match is None:
+        return None
+    return LogEntry(match["time"], match["severity"], match["type"], line.rstrip("\n"))
+
+
+def parse_since(value: str, now: Optional[float] = None) -> float:
+    """
+    Turn a --since value into an epoch timestamp.
+
+    Accepts a relative duration (``90s``, ``15m``, ``2h``, ``1d``), an ISO 8601
+    date/time, or a raw epoch timestamp.
+
+    Raises:
+        ValueError: If the value is not in any of these forms.
+    """
+    match = _SINCE_RE.match(value)
+    if match is not None:
+        now = time.time() if now is None else now
+        return now - float(match["value"]) * _UNITS[match["unit"]]
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    return datetime.fromisoformat(value).timestamp()
+
+
+class LogFilter:
+    """
+    Severity / event type / start time filter applied to log entries.
+    """
+
+    def __init__(
+        self,
+        severities: Optional[Sequence[str]] = None,
+        event_types: Optional[Sequence[str]] = None,
+        since: Optional[float] = None,
+    ):
+        self.severities = {s.upper() for s in severities} if severities else None
+        self.event_types = {t.upper() for t in event_types} if event_types else None
+        self.since = since
+
+    def matches(self, entry: LogEntry) -> bool:
+        if self.severities is not None and entry.severity not in self.severities:
+            return False
+        if self.event_types is not None and entry.event_type not in self.event_types:
+            return False
+        return self.since is None or entry.timestamp >= self.since
+
+
+def read_lines_reverse(path: str, chunk_size: int = 65536) -> Iterator[str]:
+    """
+    Yield the lines of a file from last to first, reading fixed-size chunks from the end.
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            step = min(chunk_size, position)
+            position -= step
+            f.seek(position)
+            lines = (f.read(step) + remainder).split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier chunk
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line.decode("utf-8", errors="replace")
+        if remainder:
+            yield remainder.decode("utf-8", errors="replace")
+
+
+def iter_entries(path: str, log_filter: Optional[LogFilter] = None) -> Iterator[LogEntry]:
+    """
+    Stream matching entries from the start of the log, one line in memory at a time.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            entry = parse_line(line)
+            if entry is not None and (log_filter is None or log_filter.matches(entry)):
+                yield entry
+
+
+def tail_entries(path: str, count: int, log_filter: Optional[LogFilter] = None) -> List[LogEntry]:
+    """
+    Return the last ``count`` matching entries, oldest first.
+
+    The file is scanned backwards, so the cost depends on how far back the matches
+    are rather than on the size of the log. With a ``since`` filter the scan stops
+    at the first older entry, since the log is written in time order.
+    """
+    entries: List[LogEntry] = []
+    if count <= 0:
+        return entries
+    for line in read_lines_reverse(path):
+        entry = parse_line(line)
+        if entry is None:
+            continue
+        if log_filter is not None:
+            if log_filter.since is not None and entry.timestamp < log_filter.since:
+                break
+            if not log_filter.matches(entry):
+                continue
+        entries.append(entry)
+        if len(entries) >= count:
+            break
+    entries.reverse()
+    return entries
+
+
+def follow_entries(
+    path: str,
+    log_filter: Optional[LogFilter] = None,
+    poll_interval: float = 0.5,
+    from_end: bool = True,
+    max_polls: Optional[int] = None,
+) -> Iterator[LogEntry]:
+    """
+    Yield matching entries as they are appended to the log (like ``tail -f``).
+
+    The starting position is taken when this function is called, not on the first
+    iteration. The file is polled for growth; if it is truncated or replaced (a new
+    telemetry session starts), reading restarts from the beginning of the new file.
+
+    Args:
+        path (str): Telemetry log to follow.
+        log_filter (LogFilter): Only yield matching entries.
+        poll_interval (float): Seconds to sleep when no new data is available.
+        from_end (bool): Skip the existing content and only yield new entries.
+        max_polls (int): Stop after this many idle polls (None follows forever).
+    """
+    f = open(path, "r", encoding="utf-8", errors="replace")
+    if from_end:
+        f.seek(0, os.SEEK_END)
+    return _follow(path, f, log_filter, poll_interval, max_polls)
+
+
+def _follow(
+    path: str,
+    f: TextIO,
+    log_filter: Optional[LogFilter],
+    poll_interval: float,
+    max_polls: Optional[int],
+) -> Iterator[LogEntry]:
+    try:
+        inode = os.fstat(f.fileno()).st_ino
+        partial = ""
+        idle = 0
+        while max_polls is None or idle < max_polls:
+            line = f.readline()
+            if line.endswith("\n"):
+                entry = parse_line(partial + line)
+                partial = ""
+                idle = 0
+                if entry is not None and (log_filter is None or log_filter.matches(entry)):
+                    yield entry
+                continue
+            partial += line
+            try:
+                st: Optional[os.stat_result] = os.stat(path)
+            except FileNotFoundError:
+                st = None
+            if st is not None and (st.st_ino != inode or st.st_size < f.tell()):
+                f.close()
+                f = open(path, "r", encoding="utf-8", errors="replace")
+                inode = os.fstat(f.fileno()).st_ino
+                partial = ""
+                continue
+            idle += 1
+            time.sleep(poll_interval)
+    finally:
+        f.close()
+
+
+def summarize_entries(entries: Iterable[LogEntry]) -> Dict[str, Any]:
+    """
+    Aggregate entries into the same shape as TelemetrySystem.get_summary().
+    """
+    by_type: "Counter[str]" = Counter()
+    by_severity: "Counter[str]" = Counter()
+    total = 0
+    for entry in entries:
+        total += 1
+        by_type[entry.event_type] += 1
+        by_severity[entry.severity] += 1
+    return {
+        "total_events": total,
+        "retained_events": total,
+        "dropped_events": 0,
+        "by_type": dict(by_type),
+        "by_severity": dict(by_severity),
+    }
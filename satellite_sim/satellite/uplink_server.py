@@ -0,0 +1,226 @@
+import asyncio
+import logging
+from typing import Any, List, Optional, Set, Tuple
+
+from satellite_sim.satellite.ccsds import PRIMARY_HEADER_LEN, decode_primary_header
+from satellite_sim.satellite.firewall import SpaceFirewall
+
+logger = logging.getLogger(__name__)
+
+
+async def read_packet(reader: asyncio.StreamReader, signature_len: int = 32) -> Optional[bytes]:
+    """
+    Read one CCSDS packet (plus its HMAC trailer) from a byte stream.
+
+    Packets are delimited by the primary-header length field, so no extra framing
+    is needed on the wire.
+
+    Returns:
+        Optional[bytes]: The packet, or None if the stream ended cleanly between packets.
+
+    Raises:
+        asyncio.IncompleteReadError: If the stream ends in the middle of a packet.
+    """
+    try:
+        header = await reader.readexactly(PRIMARY_HEADER_LEN)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise
+    body_len = decode_primary_header(header).data_length + 1 + signature_len
+    return header + await reader.readexactly(body_len)
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: "UplinkServer"):
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        self.server._enqueue_nowait(data)
+
+
+class UplinkServer:
+    """
+    asyncio front-end that receives CCSDS packets over TCP, UDP or a Unix socket and
+    feeds them to a SpaceFirewall in batches.
+
+    All listeners share one bounded queue. A single consumer task takes whatever is
+    queued (up to ``batch_size``) and runs it through process_batch(), so batches
+    grow with load and stay small when traffic is light. Stream readers wait when
+    the queue is full; UDP datagrams are dropped and counted instead.
+    """
+
+    def __init__(self, firewall: SpaceFirewall, batch_size: int = 256, max_queue: int = 10000):
+        """
+        Args:
+            firewall (SpaceFirewall): Receives every framed packet.
+            batch_size (int): Maximum packets per process_batch() call.
+            max_queue (int): Packets buffered between the sockets and the firewall.
+        """
+        self.firewall = firewall
+        self.batch_size = batch_size
+        self.max_queue = max_queue
+
+        self.packets_received = 0
+        self.packets_dropped = 0
+        self.batches_processed = 0
+        self.framing_errors = 0
+        self.connections_total = 0
+
+        self._queue: Optional["asyncio.Queue[Optional[bytes]]"] = None
+        self._consumer: Optional["asyncio.Task[None]"] = None
+        self._servers: List[asyncio.AbstractServer] = []
+        self._transports: List[asyncio.BaseTransport] = []
+        self._connections: Set["asyncio.Task[Any]"] = set()
+
+    @property
+    def connections_active(self) -> int:
+        return len(self._connections)
+
+    def _ensure_started(self) -> "asyncio.Queue[Optional[bytes]]":
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._consumer = asyncio.get_running_loop().create_task(self._consume())
+        return self._queue
+
+    def _enqueue_nowait(self, packet: bytes) -> None:
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(packet)
+            self.packets_received += 1
+        except asyncio.QueueFull:
+            self.packets_dropped += 1
+
+    def _collect_batch(self, first: Optional[bytes]) -> Tuple[List[bytes], bool]:
+        """
+        Take whatever is already queued, up to ``batch_size``, without waiting.
+
+        Returns:
+            Tuple[List[bytes], bool]: The batch, and whether the stop sentinel was seen.
+        """
+        assert self._queue is not None
+        if first is None:
+            return [], True
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _consume(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            batch, stopping = self._collect_batch(await queue.get())
+            if batch:
+                try:
+                    self.firewall.process_batch(batch)
+                    self.batches_processed += 1
+                except Exception:
+                    logger.exception("Firewall failed to process a batch")
+            for _ in range(len(batch) + stopping):
+                queue.task_done()
+            if stopping:
+                return
+
+    async def _handle_stream(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        self.connections_total += 1
+        queue = self._ensure_started()
+        try:
+            while True:
+                packet = await read_packet(reader, self.firewall.SIGNATURE_LEN)
+                if packet is None:
+                    break
+                await queue.put(packet)
+                self.packets_received += 1
+        except asyncio.IncompleteReadError:
+            self.framing_errors += 1
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+            if task is not None:
+                self._connections.discard(task)
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """
+        Listen for framed packets over TCP.
+
+        Returns:
+            Tuple[str, int]: The bound address (useful with port 0).
+        """
+        self._ensure_started()
+        server = await asyncio.start_server(self._handle_stream, host, port, backlog=4096)
+        self._servers.append(server)
+        host, port = server.sockets[0].getsockname()[:2]
+        return host, port
+
+    async def start_unix(self, path: str) -> str:
+        """
+        Listen for framed packets on a local Unix socket.
+        """
+        self._ensure_started()
+        server = await asyncio.start_unix_server(self._handle_stream, path, backlog=4096)
+        self._servers.append(server)
+        return path
+
+    async def start_udp(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """
+        Listen for packets over UDP, one packet per datagram.
+
+        Returns:
+            Tuple[str, int]: The bound address (useful with port 0).
+        """
+        self._ensure_started()
+        transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: _DatagramProtocol(self), local_addr=(host, port)
+        )
+        self._transports.append(transport)
+        host, port = transport.get_extra_info("sockname")[:2]
+        return host, port
+
+    async def drain(self) -> None:
+        """
+        Wait until every packet received so far has been through the firewall.
+        """
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """
+        Stop listening, drop open connections and process what is still queued.
+        """
+        for server in self._servers:
+            server.close()
+        for transport in self._transports:
+            transport.close()
+        for task in list(self._connections):
+            task.cancel()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+        self._transports.clear()
+
+        if self._queue is not None and self._consumer is not None:
+            await self._queue.put(None)
+            await self._consumer
+        self._queue = None
+        self._consumer = None
+
+    async def __aenter__(self) -> "UplinkServer":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
@@ -0,0 +1,20 @@
+from enum import IntEnum
+
+
+class Verdict(IntEnum):
+    """
+    Outcome codes for a processed packet. ACCEPTED is 0; everything else is a
+    rejection reason.
+    """
+
+    ACCEPTED = 0
+    TOO_SHORT = 1
+    BAD_SIGNATURE = 2
+    STALE_TIMESTAMP = 3
+    PARSE_ERROR = 4
+    MALFORMED_HEADER = 5
+    LENGTH_MISMATCH = 6
+    APID_NOT_ALLOWED = 7
+    RATE_LIMITED = 8
+    REPLAY = 9
+    UNKNOWN_KEY = 10
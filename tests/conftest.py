@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+
+from satellite_sim.satellite.firewall import SpaceFirewall
+from satellite_sim.satellite.telemetry import TelemetrySystem
+
+# Shared test secret
+TEST_SECRET = b"TEST_SECRET_KEY_123"
+
+
+@pytest.fixture
+def telemetry(tmp_path):
+    """Create a fresh telemetry system writing under the test's tmp_path."""
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"), events_file=str(tmp_path / "events.json")
+    )
+    yield telemetry
+    telemetry.close()
+
+
+@pytest.fixture
+def firewall(telemetry):
+    """Create a firewall instance keyed with TEST_SECRET."""
+    return SpaceFirewall(TEST_SECRET, telemetry)
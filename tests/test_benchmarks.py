@@ -0,0 +1,45 @@
+from benchmarks.suite import BENCHMARKS, compare, run_benchmark, run_suite
+
+
+def _report(**ops_per_sec):
+    return {
+        "meta": {"calibration": 1000.0},
+        "results": {name: {"ops_per_sec": value} for name, value in ops_per_sec.items()},
+    }
+
+
+def test_compare_flags_regressions():
+    """Test that only drops beyond the threshold count as regressions."""
+    baseline = _report(a=100.0, b=100.0, c=100.0)
+    current = _report(a=95.0, b=80.0, d=50.0)
+
+    rows = {row["name"]: row for row in compare(current, baseline, threshold=0.10)}
+
+    assert set(rows) == {"a", "b"}
+    assert not rows["a"]["regressed"]
+    assert rows["b"]["regressed"]
+
+
+def test_compare_normalizes_for_machine_speed():
+    """Test that a uniformly slower machine is not reported as a regression."""
+    baseline = _report(a=100.0)
+    current = _report(a=50.0)
+    current["meta"]["calibration"] = 500.0
+
+    assert compare(current, baseline)[0]["regressed"]
+    assert not compare(current, baseline, normalize=True)[0]["regressed"]
+
+
+def test_every_benchmark_runs():
+    """Smoke-run each registered benchmark at a tiny scale."""
+    for bench in BENCHMARKS:
+        result = run_benchmark(bench, rounds=1, scale=0.001)
+        assert result["ops_per_sec"] > 0
+
+
+def test_run_suite_selects_by_name():
+    """Test benchmark selection and report metadata."""
+    report = run_suite(["build_packet"], rounds=1, scale=0.001)
+
+    assert list(report["results"]) == ["build_packet"]
+    assert report["meta"]["calibration"] > 0
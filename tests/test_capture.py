@@ -0,0 +1,194 @@
+import os
+import time
+import pytest
+from satellite_sim.channel.capture import MAGIC, CaptureReader, CaptureWriter
+from satellite_sim.channel.uplink import UplinkChannel
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from satellite_sim.pipeline.streaming import StreamingPipeline, mixed_traffic
+from satellite_sim.satellite.firewall import SpaceFirewall, Verdict
+from satellite_sim.satellite.telemetry import TelemetrySystem
+from tests.conftest import TEST_SECRET
+
+
+def _traffic(count, attack_ratio=0.3, seed=7):
+    return list(
+        mixed_traffic(
+            LegitGroundStation(apid=0x100, secret_key=TEST_SECRET),
+            RogueGroundStation(apid=0x100),
+            count=count,
+            attack_ratio=attack_ratio,
+            seed=seed,
+        )
+    )
+
+
+def test_capture_round_trip(tmp_path):
+    """Test that packets and arrival times come back unchanged, by index and in order."""
+    path = str(tmp_path / "uplink.cap")
+    packets = [b"\x01", b"", b"x" * 1000, bytes(range(256))]
+    with CaptureWriter(path) as writer:
+        for i, packet in enumerate(packets):
+            writer.write(packet, arrival_time=100.0 + i)
+        assert len(writer) == 4
+
+    with CaptureReader(path) as reader:
+        assert len(reader) == 4
+        assert [bytes(r.packet) for r in reader] == packets
+        assert [r.arrival_time for r in reader] == [100.0, 101.0, 102.0, 103.0]
+        assert bytes(reader.record(2).packet) == b"x" * 1000
+        assert reader.arrival_time(3) == 103.0
+        assert [bytes(p) for p in reader.packets(1, 3)] == packets[1:3]
+        # The index is used straight from the mapping
+        assert isinstance(reader.offsets, memoryview)
+
+
+def test_capture_without_index_is_rebuilt(tmp_path):
+    """Test that an unterminated capture (e.g. after a crash) is still readable."""
+    path = str(tmp_path / "crashed.cap")
+    writer = CaptureWriter(path)
+    writer.write(b"first", 1.0)
+    writer.write(b"second", 2.0)
+    writer._file.flush()
+
+    # Simulate a partial third record
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 7)
+
+    with CaptureReader(path) as reader:
+        assert [bytes(r.packet) for r in reader] == [b"first", b"second"]
+
+
+def test_reader_rejects_foreign_files(tmp_path):
+    """Test that non-capture and empty files raise ValueError."""
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"NOTACAPTURE" * 4)
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+
+    for path in (other, empty):
+        with pytest.raises(ValueError):
+            CaptureReader(str(path))
+
+
+def test_empty_capture(tmp_path, firewall):
+    """Test that a capture with no packets opens and replays nothing."""
+    path = str(tmp_path / "empty.cap")
+    CaptureWriter(path).close()
+
+    with CaptureReader(path) as reader:
+        assert len(reader) == 0
+        assert reader.replay(firewall).packets == 0
+    with open(path, "rb") as f:
+        assert f.read(8) == MAGIC
+
+
+def test_uplink_tap_records_delivered_packets(tmp_path):
+    """Test that the channel tap captures what arrives, not what was lost."""
+    path = str(tmp_path / "uplink.cap")
+    packets = _traffic(200)
+    before = time.time()
+    with CaptureWriter(path) as writer:
+        channel = UplinkChannel(noise_level=0.2, seed=3, tap=writer.write)
+        single = [channel.transmit(p) for p in packets[:100]]
+        batch = channel.transmit_batch(packets[100:], send_interval=0.001)
+
+    delivered = [p for p in single if p is not None] + [d.packet for d in batch]
+    with CaptureReader(path) as reader:
+        assert len(reader) == len(delivered) == channel.packets_sent - channel.packets_lost
+        assert [bytes(r.packet) for r in reader] == delivered
+        times = [r.arrival_time for r in reader]
+        assert before <= times[0] and times == sorted(times)
+
+
+def test_replay_matches_live_verdicts(tmp_path, firewall):
+    """Test that replaying a capture reproduces the live firewall's decisions."""
+    path = str(tmp_path / "uplink.cap")
+    live_telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "live.log"), events_file=str(tmp_path / "live.json")
+    )
+    live = SpaceFirewall(TEST_SECRET, live_telemetry)
+    with CaptureWriter(path) as writer:
+        channel = UplinkChannel(bit_error_rate=1e-4, seed=5, tap=writer.write)
+        report = StreamingPipeline(iter(_traffic(500)), live, channel, batch_size=64).run()
+    live_telemetry.close()
+
+    with CaptureReader(path) as reader:
+        replay = reader.replay(firewall, batch_size=100)
+
+    assert replay.packets == report.packets_received
+    assert replay.accepted == report.accepted
+    assert replay.rejected == report.rejected
+    assert replay.reasons == report.reasons
+    assert replay.batches == 5
+
+
+def test_replay_uses_recorded_time(tmp_path, firewall):
+    """Test that old captures still pass freshness checks unless told otherwise."""
+    path = str(tmp_path / "old.cap")
+    station = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    with CaptureWriter(path) as writer:
+        for batch in [station.create_batch(["A", "B"], timestamp=1_000.0)]:
+            for packet in batch:
+                writer.write(packet, arrival_time=1_000.5)
+
+    with CaptureReader(path) as reader:
+        assert reader.replay(firewall).accepted == 2
+        stale = reader.replay(firewall, recorded_time=False)
+    assert stale.reasons == {Verdict.STALE_TIMESTAMP.name: 2}
+
+
+def test_paced_replay_follows_arrival_times(tmp_path, firewall):
+    """Test that paced replay takes the captured duration (scaled by speed)."""
+    path = str(tmp_path / "paced.cap")
+    station = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    now = time.time()
+    with CaptureWriter(path) as writer:
+        for i in range(5):
+            writer.write(station.create_command(f"CMD_{i}"), arrival_time=now + i * 0.1)
+
+    with CaptureReader(path) as reader:
+        fast = reader.replay(firewall, pace=True, speed=4.0)
+    assert fast.packets == 5
+    assert 0.1 - 0.02 <= fast.elapsed < 0.4
+    assert fast.batches >= 2
+
+
+@pytest.mark.parametrize("kwargs", [{"speed": 0.0}, {"speed": -2.0}, {"batch_size": 0}])
+def test_replay_rejects_invalid_pacing(tmp_path, firewall, kwargs):
+    """Test that a non-positive speed or batch size is refused instead of hanging."""
+    path = str(tmp_path / "invalid.cap")
+    with CaptureWriter(path) as writer:
+        writer.write(LegitGroundStation(apid=0x100, secret_key=TEST_SECRET).create_command("A"))
+
+    with CaptureReader(path) as reader:
+        with pytest.raises(ValueError):
+            reader.replay(firewall, pace=True, **kwargs)
+
+
+def test_replay_command_rejects_non_positive_speed(tmp_path, monkeypatch):
+    """Test that `sat_cli replay --speed 0` fails before touching any files."""
+    from typer.testing import CliRunner
+
+    from satellite_sim.cli.sat_cli import app
+
+    monkeypatch.chdir(tmp_path)
+    path = str(tmp_path / "cli.cap")
+    with CaptureWriter(path) as writer:
+        writer.write(LegitGroundStation(apid=0x100, secret_key=TEST_SECRET).create_command("A"))
+
+    result = CliRunner().invoke(app, ["replay", path, "--pace", "--speed", "0"])
+
+    assert result.exit_code == 2
+    assert "--speed" in result.output
+    assert not (tmp_path / "telemetry.log").exists()
+
+
+def test_capture_size_is_compact(tmp_path):
+    """Test the per-record overhead: 12-byte header plus 8 bytes of index."""
+    path = str(tmp_path / "size.cap")
+    with CaptureWriter(path) as writer:
+        for _ in range(100):
+            writer.write(b"p" * 50, 0.0)
+
+    assert os.path.getsize(path) == 16 + 100 * (12 + 50) + 8 * 100 + 24
@@ -0,0 +1,201 @@
+import asyncio
+import socket
+import threading
+import time
+import pytest
+from satellite_sim.cli.client import DaemonClient, DaemonError, connect
+from satellite_sim.cli.daemon import SatelliteDaemon, SatelliteState
+from satellite_sim.satellite.telemetry import TelemetrySystem
+from tests.conftest import TEST_SECRET
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets")
+
+
+@pytest.fixture
+def state(tmp_path):
+    return SatelliteState(
+        TEST_SECRET,
+        log_file=str(tmp_path / "telem.log"),
+        events_file=str(tmp_path / "events.json"),
+        index_db=str(tmp_path / "events.db"),
+    )
+
+
+@pytest.fixture
+def running_daemon(state, tmp_path):
+    path = str(tmp_path / "sat.sock")
+    daemon = SatelliteDaemon(state, path)
+    thread = threading.Thread(target=asyncio.run, args=(daemon.serve(),), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    client = connect(path)
+    while client is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+        client = connect(path)
+    assert client is not None
+    client.close()
+    yield daemon
+    with DaemonClient(path) as client:
+        try:
+            client.request("shutdown")
+        except OSError:
+            pass
+    thread.join(timeout=5)
+
+
+def test_state_persists_sequence_counts(state):
+    """Test that repeated legit sends are not mistaken for replays."""
+    for cmd in ["A", "B", "A"]:
+        result = state.send("legit", cmd)
+        assert result["verdict"] == "ACCEPTED"
+
+    result = state.send("rogue", "SHUTDOWN", attack_type="BAD_SIGNATURE")
+    assert result["verdict"] == "BAD_SIGNATURE"
+    assert (result["accepted"], result["rejected"]) == (3, 1)
+
+
+def test_state_unknown_station(state):
+    """Test that unknown stations are rejected."""
+    with pytest.raises(ValueError):
+        state.send("alien", "HELLO")
+
+
+def test_daemon_keeps_counters_across_clients(running_daemon):
+    """Test that separate client connections share one firewall."""
+    for _ in range(3):
+        with DaemonClient(running_daemon.path) as client:
+            client.request("send", station="legit", cmd="ADJUST_THRUST")
+    with DaemonClient(running_daemon.path) as client:
+        client.request("send", station="rogue", cmd="SHUTDOWN", attack_type="NO_SIGNATURE")
+        stats = client.request("stats")
+        report = client.request("report")
+
+    assert (stats["accepted"], stats["rejected"]) == (3, 1)
+    assert stats["stage_rejections"] == {"min_length": 1}
+    assert report["summary"]["total_events"] == 4
+
+
+def test_daemon_rejects_bad_requests(running_daemon):
+    """Test error responses for unknown ops and missing arguments."""
+    with DaemonClient(running_daemon.path) as client:
+        with pytest.raises(DaemonError):
+            client.request("launch")
+        with pytest.raises(DaemonError):
+            client.request("send", station="legit")
+        assert "pid" in client.request("ping")
+
+
+def test_connect_without_daemon(tmp_path):
+    """Test that connect() reports no daemon instead of raising."""
+    assert connect(str(tmp_path / "missing.sock")) is None
+
+
+def test_state_report_filters(state):
+    """Test report limits, filters and summary-only mode."""
+    for i in range(5):
+        state.send("legit", f"CMD_{i}")
+    state.send("rogue", "SHUTDOWN")
+
+    critical = state.report(severities=["critical"])
+    latest = state.report(limit=2)
+    summary = state.report(summary_only=True)
+
+    assert [e["event_type"] for e in critical["events"]] == ["SECURITY_VIOLATION"]
+    assert [e["details"].get("command") for e in latest["events"]] == ["CMD_4", None]
+    assert summary["events"] == []
+    assert summary["summary"]["total_events"] == 6
+
+
+def test_daemon_command_refuses_second_daemon(running_daemon, tmp_path):
+    """Test that `sat_cli daemon` will not start over a live daemon's socket."""
+    from typer.testing import CliRunner
+
+    from satellite_sim.cli.sat_cli import app
+
+    with DaemonClient(running_daemon.path) as client:
+        client.request("send", station="legit", cmd="PING_PAYLOAD")
+
+    result = CliRunner().invoke(app, ["daemon", "--socket", running_daemon.path])
+
+    assert result.exit_code == 1
+    assert "already running" in result.output
+    assert "PING_PAYLOAD" in (tmp_path / "telem.log").read_text()
+    client = connect(running_daemon.path)
+    assert client is not None
+    client.close()
+
+
+def test_export_report_without_daemon_reads_files_in_place(tmp_path, monkeypatch):
+    """Test that export-report with no daemon reports from disk and leaves the files intact."""
+    from typer.testing import CliRunner
+
+    from satellite_sim.cli.sat_cli import app
+
+    monkeypatch.chdir(tmp_path)
+    with TelemetrySystem() as telemetry:
+        telemetry.log_event("EVT_A", {"n": 1}, "INFO")
+        telemetry.log_event("EVT_B", {"n": 2}, "CRITICAL")
+        telemetry.log_event("EVT_A", {"n": 3}, "INFO")
+    files = ["telemetry.log", "security_events.json", "security_events.ndjson"]
+    before = {name: (tmp_path / name).read_bytes() for name in files}
+
+    runner = CliRunner()
+    socket_path = str(tmp_path / "absent.sock")
+    result = runner.invoke(app, ["export-report", "--socket", socket_path])
+    assert result.exit_code == 0, result.output
+    assert "EVT_A" in result.output and "EVT_B" in result.output
+    assert "Report exported with 3 events" in result.output
+
+    result = runner.invoke(
+        app, ["export-report", "--socket", socket_path, "--severity", "critical", "--limit", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "'n': 2" in result.output
+    assert "'n': 1" not in result.output
+
+    assert {name: (tmp_path / name).read_bytes() for name in files} == before
+    assert not (tmp_path / "security_events.db").exists()
+
+
+def test_daemon_command_indexes_events_in_batches(tmp_path, monkeypatch):
+    """Test that `sat_cli daemon` writes the SQLite index in batches, not one event at a time."""
+    from typer.testing import CliRunner
+
+    from satellite_sim.cli.sat_cli import app
+    from satellite_sim.satellite.event_store import SQLiteEventStore
+
+    batches = []
+    append_many = SQLiteEventStore.append_many
+
+    def record_batch(self, events):
+        batches.append(len(events))
+        append_many(self, events)
+
+    def send_and_stop(self):
+        for i in range(50):
+            self.handle({"op": "send", "station": "legit", "cmd": f"PING_{i}"})
+        self.state.close()
+
+    monkeypatch.setattr(SQLiteEventStore, "append", lambda self, event: record_batch(self, [event]))
+    monkeypatch.setattr(SQLiteEventStore, "append_many", record_batch)
+    monkeypatch.setattr(SatelliteDaemon, "run", send_and_stop)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(app, ["daemon", "--socket", str(tmp_path / "sat.sock")])
+
+    assert result.exit_code == 0, result.output
+    assert sum(batches) >= 50
+    assert len(batches) < sum(batches)
+
+
+def test_daemon_reports_malformed_params(running_daemon):
+    """Test that wrong-typed parameters get an error response, not a dropped connection."""
+    with DaemonClient(running_daemon.path) as client:
+        with pytest.raises(DaemonError, match="Bad send request"):
+            client.request("send", station=["legit"], cmd=1)
+        with pytest.raises(DaemonError, match="Bad report request"):
+            client.request("report", limit="abc")
+        client.request("send", station="legit", cmd="PING")
+        stats = client.request("stats")
+
+    assert (stats["accepted"], stats["rejected"]) == (1, 0)
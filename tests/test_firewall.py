@@ -1,23 +1,9 @@
 import pytest
-from satellite_sim.satellite.firewall import SpaceFirewall
-from satellite_sim.satellite.telemetry import TelemetrySystem
+import time
+from satellite_sim.satellite.firewall import Verdict
 from satellite_sim.ground_station.legit import LegitGroundStation
 from satellite_sim.ground_station.rogue import RogueGroundStation
-
-# Shared test secret
-TEST_SECRET = b"TEST_SECRET_KEY_123"
-
-
-@pytest.fixture
-def telemetry():
-    """Create a fresh telemetry system for each test."""
-    return TelemetrySystem(log_file="test_telemetry.log", events_file="test_events.json")
-
-
-@pytest.fixture
-def firewall(telemetry):
-    """Create a firewall instance with test telemetry."""
-    return SpaceFirewall(TEST_SECRET, telemetry)
+from tests.conftest import TEST_SECRET
 
 
 @pytest.fixture
@@ -92,3 +78,167 @@ def test_mixed_commands(firewall, legit_station, rogue_station):
 
     assert firewall.accepted_commands == 2
     assert firewall.rejected_commands == 3
+
+
+def test_process_packet_returns_verdict(firewall, legit_station, rogue_station):
+    """Test that process_packet reports the outcome for each packet."""
+    assert firewall.process_packet(legit_station.create_command("CMD")) == Verdict.ACCEPTED
+    assert (
+        firewall.process_packet(rogue_station.create_attack_packet("CMD", "BAD_SIGNATURE"))
+        == Verdict.BAD_SIGNATURE
+    )
+    assert firewall.process_packet(b"SHORT") == Verdict.TOO_SHORT
+
+
+def test_process_batch_verdicts(firewall, telemetry, legit_station, rogue_station):
+    """Test that a batch returns per-packet verdicts in order with one summary event."""
+    packets = [
+        legit_station.create_command("LEGIT_0"),
+        rogue_station.create_attack_packet("ATTACK", "BAD_SIGNATURE"),
+        b"SHORT",
+        legit_station.create_command("LEGIT_1"),
+    ]
+
+    result = firewall.process_batch(packets)
+
+    assert list(result.verdicts) == [
+        Verdict.ACCEPTED,
+        Verdict.BAD_SIGNATURE,
+        Verdict.TOO_SHORT,
+        Verdict.ACCEPTED,
+    ]
+    assert result.accepted == 2
+    assert result.rejected == 2
+    assert result.reasons == {"BAD_SIGNATURE": 1, "TOO_SHORT": 1}
+    assert firewall.accepted_commands == 2
+    assert firewall.rejected_commands == 2
+
+    events = telemetry.get_all_events()
+    assert len(events) == 1
+    assert events[0]["event_type"] == "BATCH_PROCESSED"
+    assert events[0]["severity"] == "CRITICAL"
+
+
+def test_batch_severity_matches_per_packet_events(firewall, telemetry, legit_station):
+    """Test that the batch event is as severe as the worst per-packet rejection event."""
+    packet = legit_station.create_command("CMD")
+    stale = legit_station.create_command("OLD")
+
+    results = [
+        firewall.process_batch([legit_station.create_command("OK")]),
+        firewall.process_batch([packet, packet]),
+        firewall.process_batch([stale], current_time=time.time() + 3600),
+        firewall.process_batch([b"SHORT", stale], current_time=time.time() + 3600),
+    ]
+
+    assert [r.reasons for r in results] == [
+        {},
+        {"REPLAY": 1},
+        {"STALE_TIMESTAMP": 1},
+        {"TOO_SHORT": 1, "STALE_TIMESTAMP": 1},
+    ]
+    events = telemetry.get_all_events()
+    assert [e["severity"] for e in events] == ["INFO", "CRITICAL", "MEDIUM", "HIGH"]
+
+
+def test_process_batch_rejects_stale_packets(firewall, legit_station):
+    """Test that batch freshness checks use the supplied reference time."""
+    packet = legit_station.create_command("CMD")
+
+    result = firewall.process_batch([packet], current_time=time.time() + 3600)
+
+    assert list(result.verdicts) == [Verdict.STALE_TIMESTAMP]
+
+
+def test_process_buffer_validates_packets_in_place(firewall, legit_station, rogue_station):
+    """Test validating packets packed back to back in one receive buffer."""
+    packets = [
+        legit_station.create_command("LEGIT_0"),
+        rogue_station.create_attack_packet("ATTACK", "BAD_SIGNATURE"),
+        legit_station.create_command("LEGIT_1"),
+    ]
+    buffer = bytearray()
+    offsets = [0]
+    for packet in packets:
+        buffer += packet
+        offsets.append(len(buffer))
+
+    result = firewall.process_buffer(buffer, offsets)
+
+    assert list(result.verdicts) == [Verdict.ACCEPTED, Verdict.BAD_SIGNATURE, Verdict.ACCEPTED]
+    assert firewall.accepted_commands == 2
+
+
+def test_process_packet_accepts_memoryview(firewall, legit_station):
+    """Test that a memoryview slice is accepted without conversion to bytes."""
+    packet = legit_station.create_command("VIEW_CMD")
+    buffer = bytearray(b"\x00" * 4 + packet)
+
+    assert firewall.process_packet(memoryview(buffer)[4:]) == Verdict.ACCEPTED
+    assert firewall.telemetry.get_all_events()[0]["details"]["command"] == "VIEW_CMD"
+
+
+def test_malformed_header_rejected_before_hmac(firewall, legit_station, monkeypatch):
+    """Test that structurally invalid packets never reach HMAC verification."""
+    packet = bytearray(legit_station.create_command("CMD"))
+    packet[0] |= 0xE0  # version != 0
+
+    def fail_verify(*args):
+        raise AssertionError("HMAC should not be computed")
+
+    monkeypatch.setattr(firewall.verifier, "verify", fail_verify)
+
+    assert firewall.process_packet(bytes(packet)) == Verdict.MALFORMED_HEADER
+    assert firewall.rejected_commands == 1
+
+
+def test_length_field_mismatch_rejected(firewall, rogue_station):
+    """Test that packets whose size disagrees with the length field are rejected."""
+    packet = rogue_station.create_attack_packet("MALICIOUS_CMD_WITH_LONG_NAME", "SHORT_SIGNATURE")
+
+    assert firewall.process_packet(packet) == Verdict.LENGTH_MISMATCH
+
+
+def test_commands_dispatched_by_apid(firewall):
+    """Test that accepted commands are routed to the handler for their APID."""
+    routed = []
+    firewall.register_handler(0x100, lambda cmd: routed.append(("payload", cmd)))
+    firewall.register_handler(0x200, lambda cmd: routed.append(("attitude", cmd)))
+
+    packets = [
+        LegitGroundStation(apid=0x200, secret_key=TEST_SECRET).create_command("SLEW"),
+        LegitGroundStation(apid=0x100, secret_key=TEST_SECRET).create_command("CAPTURE"),
+        LegitGroundStation(apid=0x300, secret_key=TEST_SECRET).create_command("UNROUTED"),
+    ]
+    firewall.process_packet(packets[0])
+    firewall.process_batch(packets[1:])
+
+    assert routed == [("attitude", "SLEW"), ("payload", "CAPTURE")]
+    assert firewall.accepted_commands == 3
+
+
+def test_handler_exception_rejects_packet(firewall, telemetry):
+    """Test that a failing command handler rejects its packet without aborting the batch."""
+    routed = []
+
+    def handler(cmd):
+        if cmd == "EXPLODE":
+            raise RuntimeError("actuator fault")
+        routed.append(cmd)
+
+    firewall.register_handler(0x100, handler)
+    station = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+
+    assert firewall.process_packet(station.create_command("EXPLODE")) == Verdict.PARSE_ERROR
+    event = telemetry.get_all_events()[-1]
+    assert event["event_type"] == "PARSING_ERROR"
+    assert event["details"]["error"] == "actuator fault"
+
+    batch = [station.create_command(cmd) for cmd in ("BEFORE", "EXPLODE", "AFTER")]
+    result = firewall.process_batch(batch)
+
+    assert list(result.verdicts) == [Verdict.ACCEPTED, Verdict.PARSE_ERROR, Verdict.ACCEPTED]
+    assert result.reasons == {"PARSE_ERROR": 1}
+    assert routed == ["BEFORE", "AFTER"]
+    assert firewall.accepted_commands == 2
+    assert firewall.rejected_commands == 2
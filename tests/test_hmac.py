@@ -1,3 +1,6 @@
+import hashlib
+import hmac
+import pickle
 import pytest
 from satellite_sim.crypto.hmac_signer import HMACSigner
 from satellite_sim.crypto.verifier import HMACVerifier
@@ -30,3 +33,26 @@ def test_hmac_tampering():
     # Tamper with signature
     tampered_sig = signature[:-1] + b"\x00"
     assert verifier.verify(data, tampered_sig) is False
+
+
+def test_hmac_matches_reference_implementation():
+    secret = b"TEST_KEY"
+    data = b"Hello Satellite"
+    expected = hmac.new(secret, data, hashlib.sha256).digest()
+
+    assert HMACSigner(secret).sign(data) == expected
+    assert HMACSigner(secret, one_shot=True).sign(data) == expected
+    assert HMACVerifier(secret, one_shot=True).verify(data, expected) is True
+
+    # Reusing the keyed context must not leak state between messages
+    signer = HMACSigner(secret)
+    signer.sign(b"other data")
+    assert signer.sign(data) == expected
+
+
+def test_verifier_survives_pickling():
+    secret = b"TEST_KEY"
+    signature = HMACSigner(secret).sign(b"data")
+    verifier = pickle.loads(pickle.dumps(HMACVerifier(secret)))
+
+    assert verifier.verify(b"data", signature) is True
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Self time (microseconds) of all satellite_sim modules loaded by the import under test
+IMPORT_BUDGET_US = 50_000
+
+
+def _python(args, cwd):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    return subprocess.run(
+        [sys.executable, *args], cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _own_import_time(module, cwd):
+    """Sum the self time reported by -X importtime for satellite_sim modules."""
+    stderr = _python(["-X", "importtime", "-c", f"import {module}"], cwd).stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        if name.strip().startswith("satellite_sim") and self_us.strip().isdigit():
+            total += int(self_us)
+    return total
+
+
+def test_package_import_is_lazy(tmp_path):
+    """Test that importing the package does not load any subsystem."""
+    out = _python(
+        [
+            "-c",
+            "import sys, satellite_sim, satellite_sim.satellite;"
+            "print(sorted(m for m in sys.modules if m.startswith('satellite_sim.')))",
+        ],
+        tmp_path,
+    ).stdout
+    assert out.strip() == "['satellite_sim._lazy', 'satellite_sim.satellite']"
+
+
+def test_lazy_exports_resolve():
+    """Test that lazily exported names resolve to the defining classes."""
+    import satellite_sim
+    from satellite_sim.satellite import firewall
+
+    assert satellite_sim.SpaceFirewall is firewall.SpaceFirewall
+    assert "SpaceFirewall" in dir(satellite_sim)
+    with pytest.raises(AttributeError):
+        satellite_sim.NotAThing
+
+
+def test_cli_import_has_no_side_effects(tmp_path):
+    """Test that importing the CLI and running --help create no files."""
+    _python(["-c", "import satellite_sim.cli.sat_cli"], tmp_path)
+    _python(["-m", "satellite_sim.cli.sat_cli", "--help"], tmp_path)
+    _python(["-m", "satellite_sim.cli.sat_cli", "watch-telemetry"], tmp_path)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_cli_import_skips_simulator(tmp_path):
+    """Test that the CLI module does not import the firewall, asyncio or rich.table."""
+    out = _python(
+        [
+            "-c",
+            "import sys, satellite_sim.cli.sat_cli;"
+            "print([m for m in ('satellite_sim.satellite.firewall', 'asyncio', 'rich.table')"
+            " if m in sys.modules])",
+        ],
+        tmp_path,
+    ).stdout
+    assert out.strip() == "[]"
+
+
+@pytest.mark.parametrize("module", ["satellite_sim", "satellite_sim.cli.sat_cli"])
+def test_import_time_budget(module, tmp_path):
+    """Test that our own modules stay within the import-time budget."""
+    assert _own_import_time(module, tmp_path) < IMPORT_BUDGET_US
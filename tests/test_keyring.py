@@ -0,0 +1,150 @@
+import pickle
+import time
+import pytest
+from satellite_sim.crypto.keyring import Keyring
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.packet_builder import CCSDSPacketBuilder
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from satellite_sim.satellite.ccsds import decode_key_id, decode_timestamp
+from satellite_sim.satellite.firewall import SpaceFirewall, Verdict
+from satellite_sim.satellite.prefilters import KeyIDFilter
+from tests.conftest import TEST_SECRET
+
+
+@pytest.fixture
+def keyring():
+    keyring = Keyring()
+    keyring.add(1, b"ALPHA_KEY", station_id="STATION_ALPHA")
+    keyring.add(2, b"BRAVO_KEY", station_id="STATION_BRAVO")
+    return keyring
+
+
+def test_keyring_add_and_lookup(keyring):
+    """Test registration, lookup and ID validation."""
+    assert len(keyring) == 2
+    assert 1 in keyring and 3 not in keyring
+    assert keyring.get(2).secret_key == b"BRAVO_KEY"
+    assert keyring.get(3) is None
+
+    with pytest.raises(ValueError):
+        keyring.add(1, b"DUPLICATE")
+    with pytest.raises(ValueError):
+        keyring.add(0x10000, b"TOO_BIG")
+
+
+def test_builder_embeds_key_id():
+    """Test that key IDs follow the timestamp in both single and batch builds."""
+    builder = CCSDSPacketBuilder(apid=0x100, key_id=0xBEEF)
+    packet = builder.build_packet("PING")
+    batch = builder.build_batch(["A", "BB"], timestamp=123.0)
+
+    assert decode_key_id(packet) == 0xBEEF
+    assert packet.endswith(b"PING")
+    assert len(packet) == 6 + 8 + 2 + 4
+    for view in batch:
+        assert decode_key_id(view) == 0xBEEF
+        assert decode_timestamp(view) == 123.0
+    assert bytes(batch[1]).endswith(b"BB")
+
+
+def test_firewall_verifies_per_station_keys(telemetry, keyring):
+    """Test that each station's packets verify with its own key."""
+    firewall = SpaceFirewall(None, telemetry, keyring=keyring)
+    alpha = LegitGroundStation.from_keyring(0x100, keyring.get(1))
+    bravo = LegitGroundStation.from_keyring(0x101, keyring.get(2))
+
+    assert firewall.process_packet(alpha.create_command("SLEW")) == Verdict.ACCEPTED
+    assert firewall.process_packet(bravo.create_command("CAPTURE")) == Verdict.ACCEPTED
+    assert bravo.station_id == "STATION_BRAVO"
+
+    # Claiming another station's key ID does not help
+    impostor = LegitGroundStation(0x100, b"ALPHA_KEY", key_id=2)
+    assert firewall.process_packet(impostor.create_command("SLEW")) == Verdict.BAD_SIGNATURE
+
+
+def test_stations_sharing_an_apid_have_separate_replay_windows(telemetry, keyring):
+    """Test that per-station sequence counters on one APID do not collide."""
+    keyring.add(3, b"CHARLIE_KEY", station_id="STATION_CHARLIE")
+    firewall = SpaceFirewall(None, telemetry, keyring=keyring)
+    stations = [LegitGroundStation.from_keyring(0x100, keyring.get(k)) for k in (1, 2, 3)]
+
+    packets = [station.create_command(f"CMD_{i}") for i in range(3) for station in stations]
+    single = [firewall.process_packet(packet) for packet in packets[:3]]
+    batch = firewall.process_batch(packets[3:])
+
+    assert single == [Verdict.ACCEPTED] * 3
+    assert list(batch.verdicts) == [Verdict.ACCEPTED] * 6
+
+    # Replays are still caught within each station's window
+    replay = firewall.process_batch([packets[4]])
+    assert list(replay.verdicts) == [Verdict.REPLAY]
+    assert telemetry.events[-1].details["rejected"] == {"REPLAY": 1}
+
+
+def test_firewall_rejects_unknown_key_before_hmac(telemetry, keyring):
+    """Test that an unknown key ID is rejected by the prefilter without an HMAC."""
+    firewall = SpaceFirewall(None, telemetry, keyring=keyring)
+    stranger = LegitGroundStation(0x100, b"OTHER_KEY", key_id=9)
+
+    assert firewall.process_packet(stranger.create_command("X")) == Verdict.UNKNOWN_KEY
+    assert firewall.stage_rejections["key_id"] == 1
+    assert firewall.hmac_verifications == 0
+    assert telemetry.events[-1].details["key_id"] == 9
+
+    rogue = RogueGroundStation(apid=0x100)
+    assert firewall.process_packet(rogue.create_attack_packet("X")) != Verdict.ACCEPTED
+
+
+def test_key_rotation_overlap(telemetry, keyring):
+    """Test that old and new keys both verify during the overlap, then only the new one."""
+    firewall = SpaceFirewall(None, telemetry, keyring=keyring, replay_protection=False)
+    old_station = LegitGroundStation.from_keyring(0x100, keyring.get(1))
+    new_station = LegitGroundStation.from_keyring(0x100, keyring.get(1))
+    now = time.time()
+
+    entry = keyring.rotate(1, 11, b"ALPHA_KEY_V2", overlap=30.0, now=now)
+    new_station.rotate_key(entry.secret_key, entry.key_id)
+    assert entry.station_id == "STATION_ALPHA"
+    assert new_station.key_id == 11
+
+    during = firewall.process_batch(
+        [old_station.create_command("A"), new_station.create_command("B")], current_time=now + 10
+    )
+    assert list(during.verdicts) == [Verdict.ACCEPTED, Verdict.ACCEPTED]
+
+    after = firewall.process_batch(
+        [old_station.create_command("A"), new_station.create_command("B")], current_time=now + 40
+    )
+    assert list(after.verdicts) == [Verdict.UNKNOWN_KEY, Verdict.ACCEPTED]
+
+
+def test_key_not_yet_valid_is_rejected(telemetry):
+    """Test the not_before side of the validity window."""
+    keyring = Keyring()
+    keyring.add(5, TEST_SECRET, not_before=time.time() + 3600)
+    firewall = SpaceFirewall(None, telemetry, keyring=keyring)
+    station = LegitGroundStation(0x100, TEST_SECRET, key_id=5)
+
+    assert firewall.process_packet(station.create_command("EARLY")) == Verdict.UNKNOWN_KEY
+    assert telemetry.events[-1].details["reason"] == "Key not valid at this time"
+
+
+def test_firewall_requires_exactly_one_key_source(telemetry, keyring):
+    """Test constructor validation and that the key filter is added once."""
+    with pytest.raises(ValueError):
+        SpaceFirewall(None, telemetry)
+    with pytest.raises(ValueError):
+        SpaceFirewall(TEST_SECRET, telemetry, keyring=keyring)
+
+    firewall = SpaceFirewall(None, telemetry, prefilters=[KeyIDFilter(keyring)], keyring=keyring)
+    assert len(firewall.prefilters) == 1
+
+
+def test_keyring_survives_pickling(keyring):
+    """Test that a pickled keyring (as sent to ParallelFirewall workers) still verifies."""
+    station = LegitGroundStation.from_keyring(0x100, keyring.get(2))
+    packet = station.create_command("PING")
+
+    copy = pickle.loads(pickle.dumps(keyring))
+
+    assert copy.get(2).verifier.verify(packet[:-32], packet[-32:])
@@ -0,0 +1,102 @@
+import time
+import types
+import urllib.request
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from satellite_sim.satellite import firewall as firewall_module
+from satellite_sim.satellite.firewall import SpaceFirewall
+from satellite_sim.satellite.metrics import (
+    FirewallMetrics,
+    Histogram,
+    MetricsServer,
+    render_prometheus,
+)
+from tests.conftest import TEST_SECRET
+
+
+def test_histogram_buckets_and_quantiles():
+    """Test bucket placement, cumulative export and quantile estimates."""
+    hist = Histogram([1.0, 2.0, 5.0])
+    for value in [0.5, 1.0, 1.5, 3.0, 10.0]:
+        hist.observe(value)
+
+    snapshot = hist.snapshot()
+
+    assert snapshot["count"] == 5
+    assert snapshot["sum"] == 16.0
+    assert snapshot["buckets"] == [[1.0, 2], [2.0, 3], [5.0, 4], ["+Inf", 5]]
+    assert hist.quantile(0.5) == 2.0
+    assert hist.quantile(0.99) == 5.0
+
+
+def test_instrumented_firewall_records_stages(telemetry):
+    """Test per-stage timings and verdict counts from process_packet."""
+    metrics = FirewallMetrics()
+    firewall = SpaceFirewall(TEST_SECRET, telemetry, metrics=metrics)
+    legit = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    rogue = RogueGroundStation(apid=0x100)
+
+    firewall.process_packet(legit.create_command("A"))
+    firewall.process_packet(rogue.create_attack_packet("B", "BAD_SIGNATURE"))
+    firewall.process_packet(rogue.create_attack_packet("C", "NO_SIGNATURE"))
+
+    stages = {name: h.count for name, h in metrics.stages.items()}
+    assert stages["total"] == 3
+    assert stages["decode"] == 3
+    assert stages["hmac"] == 2
+    assert stages["replay"] == 1
+    assert stages["execute"] == 1
+    assert stages["reject"] == 2
+    assert stages["timestamp_window"] == 2
+    assert metrics.verdicts == {"ACCEPTED": 1, "BAD_SIGNATURE": 1, "TOO_SHORT": 1}
+
+
+def test_batch_metrics(telemetry):
+    """Test that batches record one latency sample and per-verdict counts."""
+    metrics = FirewallMetrics()
+    firewall = SpaceFirewall(TEST_SECRET, telemetry, metrics=metrics)
+    legit = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+
+    firewall.process_batch([legit.create_command(f"C{i}") for i in range(4)] + [b"short"])
+
+    assert metrics.stages["batch"].count == 1
+    assert metrics.verdicts == {"ACCEPTED": 4, "TOO_SHORT": 1}
+
+
+def test_disabled_instrumentation_reads_no_clock(telemetry, monkeypatch):
+    """Test that without metrics process_packet never calls perf_counter."""
+
+    def fail():
+        raise AssertionError("perf_counter called with instrumentation disabled")
+
+    monkeypatch.setattr(
+        firewall_module, "time", types.SimpleNamespace(time=time.time, perf_counter=fail)
+    )
+    firewall = SpaceFirewall(TEST_SECRET, telemetry)
+    legit = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+
+    firewall.process_packet(legit.create_command("A"))
+
+    assert firewall.metrics_snapshot()["metrics"] is None
+    assert firewall.metrics_snapshot()["accepted"] == 1
+
+
+def test_prometheus_export_and_server(telemetry):
+    """Test the text format and serving it over local HTTP."""
+    firewall = SpaceFirewall(TEST_SECRET, telemetry, metrics=FirewallMetrics())
+    firewall.process_packet(b"short")
+
+    text = render_prometheus(firewall.metrics_snapshot())
+    assert "# TYPE satellite_firewall_stage_seconds histogram" in text
+    assert 'satellite_firewall_stage_seconds_count{stage="total"} 1' in text
+    assert 'satellite_firewall_verdicts_total{verdict="TOO_SHORT"} 1' in text
+    assert "satellite_firewall_rejected_total 1" in text
+
+    server = MetricsServer(lambda: render_prometheus(firewall.metrics_snapshot())).start()
+    try:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+    finally:
+        server.close()
+    assert body == text
@@ -1,6 +1,9 @@
 import pytest
 import struct
 from satellite_sim.ground_station.packet_builder import CCSDSPacketBuilder
+from satellite_sim.satellite.ccsds import decode_primary_header
+from satellite_sim.ground_station.legit import LegitGroundStation
+from tests.conftest import TEST_SECRET
 
 
 def test_packet_structure():
@@ -22,3 +25,65 @@ def test_packet_structure():
     # Check Payload
     # Header (6) + Timestamp (8) = 14 bytes offset
     assert packet[14:] == b"TEST_CMD"
+
+
+def test_primary_header_round_trip():
+    builder = CCSDSPacketBuilder(apid=0x123)
+    builder.sequence_count = 42
+    packet = builder.build_packet("TEST_CMD")
+
+    header = decode_primary_header(packet)
+
+    assert header.version == 0
+    assert header.packet_type == 1
+    assert header.sec_header_flag == 1
+    assert header.apid == 0x123
+    assert header.sequence_flags == 3
+    assert header.sequence_count == 42
+    assert header.packet_data_length == 8 + len("TEST_CMD")
+    assert header.total_length == len(packet)
+
+
+def test_primary_header_decodes_at_offset():
+    packet = CCSDSPacketBuilder(apid=0x7FF).build_packet("X")
+    buffer = bytearray(b"\xff" * 3) + packet
+
+    assert decode_primary_header(buffer, 3).apid == 0x7FF
+
+
+def test_build_batch_matches_single_packets():
+    batch_builder = CCSDSPacketBuilder(apid=0x123)
+    single_builder = CCSDSPacketBuilder(apid=0x123)
+    commands = ["CMD_A", "LONGER_COMMAND_B", "C"]
+
+    batch = batch_builder.build_batch(commands, timestamp=1234.5)
+
+    assert len(batch) == 3
+    for packet, cmd in zip(batch, commands):
+        expected = single_builder.build_packet(cmd)
+        # Identical apart from the timestamp
+        assert bytes(packet[:6]) == expected[:6]
+        assert struct.unpack(">d", packet[6:14])[0] == 1234.5
+        assert bytes(packet[14:]) == expected[14:]
+    assert batch_builder.sequence_count == single_builder.sequence_count == 3
+
+
+def test_build_batch_sequence_wraparound():
+    builder = CCSDSPacketBuilder(apid=0x100)
+    builder.sequence_count = 16382
+
+    batch = builder.build_batch(["A", "B", "C", "D"])
+
+    counts = [decode_primary_header(packet).sequence_count for packet in batch]
+    assert counts == [16382, 16383, 0, 1]
+    assert builder.sequence_count == 2
+
+
+def test_signed_batch_accepted_by_firewall(firewall):
+    station = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+
+    batch = station.create_batch([f"CMD_{i}" for i in range(100)])
+    result = firewall.process_buffer(batch.buffer, batch.offsets)
+
+    assert result.accepted == 100
+    assert bytes(batch[5]) == bytes(batch.buffer[batch.offsets[5] : batch.offsets[6]])
@@ -0,0 +1,61 @@
+from satellite_sim.crypto.keyring import Keyring
+from satellite_sim.satellite.firewall import SpaceFirewall, Verdict
+from satellite_sim.satellite.parallel import ParallelFirewall
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from tests.conftest import TEST_SECRET
+
+
+def test_parallel_matches_serial_verdicts(firewall):
+    """Test that sharded verification returns verdicts in arrival order."""
+    legit = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    rogue = RogueGroundStation(apid=0x100)
+    packets = []
+    for i in range(20):
+        packets.append(legit.create_command(f"CMD_{i}"))
+        packets.append(rogue.create_attack_packet(f"ATTACK_{i}", "BAD_SIGNATURE"))
+    packets.append(b"SHORT")
+
+    with ParallelFirewall(firewall, workers=2, chunk_size=7) as parallel:
+        result = parallel.process_batch(packets)
+
+    expected = [Verdict.ACCEPTED, Verdict.BAD_SIGNATURE] * 20 + [Verdict.TOO_SHORT]
+    assert list(result.verdicts) == expected
+    assert firewall.accepted_commands == 20
+    assert firewall.rejected_commands == 21
+    assert firewall.telemetry.get_all_events()[-1]["event_type"] == "BATCH_PROCESSED"
+
+
+def test_parallel_preserves_command_order(firewall):
+    """Test that accepted commands are executed in arrival order in the parent."""
+    legit = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    packets = [legit.create_command(f"CMD_{i}") for i in range(50)]
+    executed = []
+    firewall.register_handler(0x100, executed.append)
+
+    with ParallelFirewall(firewall, workers=3, chunk_size=4) as parallel:
+        parallel.process_batch(packets)
+
+    assert executed == [f"CMD_{i}" for i in range(50)]
+
+
+def test_parallel_workers_see_keyring_changes(telemetry):
+    """Test that packets signed with keys added after the pool started still verify."""
+    keyring = Keyring()
+    keyring.add(1, b"ALPHA_KEY", station_id="STATION_ALPHA")
+    firewall = SpaceFirewall(None, telemetry, keyring=keyring)
+    alpha = LegitGroundStation.from_keyring(0x100, keyring.get(1))
+
+    with ParallelFirewall(firewall, workers=2, chunk_size=2) as parallel:
+        before = parallel.process_batch([alpha.create_command(f"OLD_{i}") for i in range(4)])
+
+        entry = keyring.rotate(1, 2, b"ALPHA_KEY_V2")
+        alpha.rotate_key(entry.secret_key, entry.key_id)
+        rotated = parallel.process_batch([alpha.create_command(f"NEW_{i}") for i in range(4)])
+
+        bravo = LegitGroundStation.from_keyring(0x200, keyring.add(3, b"BRAVO_KEY"))
+        added = parallel.process_batch([bravo.create_command("HELLO")])
+
+    assert list(before.verdicts) == [Verdict.ACCEPTED] * 4
+    assert list(rotated.verdicts) == [Verdict.ACCEPTED] * 4
+    assert list(added.verdicts) == [Verdict.ACCEPTED]
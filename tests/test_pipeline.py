@@ -0,0 +1,61 @@
+import itertools
+import pytest
+from satellite_sim.channel.uplink import UplinkChannel
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from satellite_sim.pipeline.streaming import StreamingPipeline, mixed_traffic
+from tests.conftest import TEST_SECRET
+
+
+@pytest.fixture
+def stations():
+    return (
+        LegitGroundStation(apid=0x100, secret_key=TEST_SECRET),
+        RogueGroundStation(apid=0x100),
+    )
+
+
+def test_pipeline_mixed_scenario(firewall, stations):
+    """Test an end-to-end mixed legit/attack run over a perfect channel."""
+    legit, rogue = stations
+    source = mixed_traffic(legit, rogue, count=500, attack_ratio=0.4, seed=1)
+
+    report = StreamingPipeline(source, firewall, UplinkChannel(), batch_size=64).run()
+
+    assert report.packets_sent == report.packets_received == 500
+    assert report.accepted + report.rejected == 500
+    assert 0 < report.rejected < 500
+    assert report.accepted == firewall.accepted_commands
+    assert [s.name for s in report.stages] == ["source", "channel", "firewall"]
+    assert all(s.items == 500 and s.batches == 8 for s in report.stages)
+    assert report.packets_per_second > 0
+
+
+def test_pipeline_pulls_lazily_from_source(firewall, stations):
+    """Test backpressure: the source only produces what downstream consumes."""
+    legit, rogue = stations
+    produced = []
+
+    def counting_source():
+        for packet in mixed_traffic(legit, rogue, count=None, attack_ratio=0.0):
+            produced.append(1)
+            yield packet
+
+    pipeline = StreamingPipeline(counting_source(), firewall, batch_size=10)
+    results = list(itertools.islice(iter(pipeline), 3))
+
+    assert len(results) == 3
+    assert len(produced) == 30
+    assert firewall.accepted_commands == 30
+
+
+def test_pipeline_counts_channel_loss(firewall, stations):
+    legit, rogue = stations
+    source = mixed_traffic(legit, rogue, count=200, attack_ratio=0.0)
+    channel = UplinkChannel(noise_level=0.5, seed=2)
+
+    report = StreamingPipeline(source, firewall, channel, batch_size=50).run()
+
+    assert report.packets_sent == 200
+    assert report.packets_received == 200 - channel.packets_lost
+    assert report.accepted == report.packets_received
@@ -0,0 +1,87 @@
+import time
+from satellite_sim.satellite.firewall import SpaceFirewall, Verdict
+from satellite_sim.satellite.prefilters import (
+    AllowedAPIDFilter,
+    RateLimitFilter,
+    default_prefilters,
+)
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from tests.conftest import TEST_SECRET
+
+
+def test_allowed_apid_filter(telemetry):
+    """Test that packets for APIDs outside the allow-list are shed before HMAC."""
+    firewall = SpaceFirewall(
+        TEST_SECRET, telemetry, prefilters=default_prefilters() + [AllowedAPIDFilter({0x100})]
+    )
+    allowed = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    blocked = LegitGroundStation(apid=0x222, secret_key=TEST_SECRET)
+
+    assert firewall.process_packet(allowed.create_command("OK")) == Verdict.ACCEPTED
+    assert firewall.process_packet(blocked.create_command("NOPE")) == Verdict.APID_NOT_ALLOWED
+    assert firewall.hmac_verifications == 1
+
+
+def test_rate_limit_filter_per_apid(telemetry):
+    """Test that a source exceeding its burst is rate limited and refills over time."""
+    firewall = SpaceFirewall(
+        TEST_SECRET, telemetry, prefilters=default_prefilters() + [RateLimitFilter(rate=2, burst=2)]
+    )
+    station = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    other = LegitGroundStation(apid=0x101, secret_key=TEST_SECRET)
+    now = time.time()
+
+    result = firewall.process_batch(
+        [station.create_command(f"CMD_{i}") for i in range(3)] + [other.create_command("X")],
+        current_time=now,
+    )
+    assert list(result.verdicts) == [
+        Verdict.ACCEPTED,
+        Verdict.ACCEPTED,
+        Verdict.RATE_LIMITED,
+        Verdict.ACCEPTED,
+    ]
+
+    # One second later the bucket has refilled
+    result = firewall.process_batch([station.create_command("LATER")], current_time=now + 1)
+    assert list(result.verdicts) == [Verdict.ACCEPTED]
+
+
+def test_timestamp_checked_before_hmac(telemetry):
+    """Test that stale packets do not cost an HMAC computation."""
+    firewall = SpaceFirewall(TEST_SECRET, telemetry)
+    rogue = RogueGroundStation(apid=0x100)
+    packet = rogue.create_attack_packet("OLD", "BAD_SIGNATURE")
+
+    result = firewall.process_batch([packet], current_time=time.time() + 3600)
+
+    assert list(result.verdicts) == [Verdict.STALE_TIMESTAMP]
+    assert firewall.hmac_verifications == 0
+
+
+def test_filter_stats_show_shed_traffic(telemetry):
+    """Test per-stage counters under a mixed flood."""
+    firewall = SpaceFirewall(
+        TEST_SECRET,
+        telemetry,
+        prefilters=default_prefilters() + [AllowedAPIDFilter({0x100})],
+    )
+    legit = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    rogue = RogueGroundStation(apid=0x100)
+    packets = [legit.create_command("OK")]
+    packets += [b"\x00" * 10] * 3
+    packets += [rogue.create_attack_packet("X", "SHORT_SIGNATURE") + b"\x00" * 20] * 2
+    packets += [LegitGroundStation(apid=0x300, secret_key=TEST_SECRET).create_command("Y")]
+    packets += [rogue.create_attack_packet("BAD", "BAD_SIGNATURE")]
+
+    firewall.process_batch(packets)
+
+    assert firewall.get_filter_stats() == {
+        "min_length": 3,
+        "header_sanity": 0,
+        "length_field": 2,
+        "timestamp_window": 0,
+        "allowed_apid": 1,
+        "hmac_verifications": 2,
+    }
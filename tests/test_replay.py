@@ -0,0 +1,77 @@
+from satellite_sim.satellite.firewall import SpaceFirewall, Verdict
+from satellite_sim.satellite.replay import ReplayGuard, SequenceWindow
+from satellite_sim.ground_station.legit import LegitGroundStation
+from tests.conftest import TEST_SECRET
+
+
+def test_window_rejects_duplicates():
+    window = SequenceWindow(size=8)
+    assert window.check_and_update(5) is None
+    assert window.check_and_update(5) is not None
+
+
+def test_window_accepts_out_of_order_within_window():
+    window = SequenceWindow(size=8)
+    for seq in (10, 12, 11, 9):
+        assert window.check_and_update(seq) is None
+    assert window.check_and_update(11) is not None
+
+
+def test_window_rejects_counts_older_than_window():
+    window = SequenceWindow(size=8)
+    window.check_and_update(100)
+    assert window.check_and_update(92) is not None
+    assert window.check_and_update(93) is None
+
+
+def test_window_handles_wraparound():
+    window = SequenceWindow(size=8)
+    assert window.check_and_update(16382) is None
+    assert window.check_and_update(16383) is None
+    assert window.check_and_update(0) is None
+    assert window.check_and_update(1) is None
+    # Late arrival from before the wrap is still inside the window
+    assert window.check_and_update(16381) is None
+    assert window.check_and_update(16383) is not None
+
+
+def test_guard_mac_cache_is_bounded():
+    guard = ReplayGuard(window_size=64, mac_cache_size=2)
+    guard.check_and_update(0x100, 0, b"mac-0")
+    guard.check_and_update(0x101, 0, b"mac-1")
+    guard.check_and_update(0x102, 0, b"mac-2")
+
+    assert len(guard._recent_macs) == 2
+    assert guard.check_and_update(0x103, 0, b"mac-2") is not None
+
+
+def test_firewall_rejects_replayed_packet(firewall):
+    """Test that re-sending an accepted packet within the freshness window is rejected."""
+    station = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    packet = station.create_command("FIRE_THRUSTER")
+
+    assert firewall.process_packet(packet) == Verdict.ACCEPTED
+    assert firewall.process_packet(packet) == Verdict.REPLAY
+    assert firewall.accepted_commands == 1
+    assert firewall.rejected_commands == 1
+    assert firewall.telemetry.get_all_events()[-1]["event_type"] == "SECURITY_VIOLATION"
+
+
+def test_batch_rejects_replays_within_batch(firewall):
+    station = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    first = station.create_command("A")
+    second = station.create_command("B")
+
+    result = firewall.process_batch([first, second, first])
+
+    assert list(result.verdicts) == [Verdict.ACCEPTED, Verdict.ACCEPTED, Verdict.REPLAY]
+
+
+def test_replay_protection_can_be_disabled(telemetry):
+    firewall = SpaceFirewall(TEST_SECRET, telemetry, replay_protection=False)
+    packet = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET).create_command("A")
+
+    firewall.process_packet(packet)
+    firewall.process_packet(packet)
+
+    assert firewall.accepted_commands == 2
@@ -0,0 +1,150 @@
+import logging
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.ground_station.rogue import RogueGroundStation
+from satellite_sim.satellite.firewall import SpaceFirewall
+from satellite_sim.satellite.suppression import (
+    SuppressionFilter,
+    ViolationAggregator,
+    install_log_suppression,
+)
+from tests.conftest import TEST_SECRET
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _event_types(telemetry):
+    return [e.event_type for e in telemetry.events]
+
+
+def test_aggregator_collapses_repeats_into_summary(telemetry):
+    """Test that repeats beyond the burst are counted and summarised after the window."""
+    clock = FakeClock()
+    violations = ViolationAggregator(telemetry, window=5.0, burst=2, clock=clock)
+    details = {"reason": "Invalid HMAC Signature", "apid": 0x100}
+
+    reported = [violations.record("SECURITY_VIOLATION", details, "CRITICAL") for _ in range(50)]
+
+    assert reported[:2] == [True, True]
+    assert not any(reported[2:])
+    assert violations.suppressed == 48
+    assert _event_types(telemetry) == ["SECURITY_VIOLATION"] * 2
+
+    # The next violation after the window closes triggers the summary
+    clock.now += 5.0
+    violations.record("SECURITY_VIOLATION", details, "CRITICAL")
+
+    summary = telemetry.events[2]
+    assert summary.event_type == "VIOLATION_SUMMARY"
+    assert summary.severity == "CRITICAL"
+    assert summary.details["suppressed"] == 48
+    assert summary.details["apid"] == 0x100
+    assert summary.details["message"] == (
+        "48 SECURITY_VIOLATION events (Invalid HMAC Signature) from APID 0x100 in last 5 s"
+    )
+    assert telemetry.events[3].event_type == "SECURITY_VIOLATION"
+
+
+def test_aggregator_keys_by_reason_and_apid(telemetry):
+    """Test that different reasons and APIDs are budgeted separately."""
+    violations = ViolationAggregator(telemetry, burst=1, clock=FakeClock())
+
+    for apid in (0x100, 0x200):
+        for reason in ("Invalid HMAC Signature", "Timestamp stale"):
+            violations.record("PACKET_REJECTED", {"reason": reason, "apid": apid}, "HIGH")
+            violations.record("PACKET_REJECTED", {"reason": reason, "apid": apid}, "HIGH")
+
+    assert len(telemetry.events) == 4
+    assert violations.suppressed == 4
+
+    violations.flush()
+
+    summaries = [e for e in telemetry.events if e.event_type == "VIOLATION_SUMMARY"]
+    assert len(summaries) == 4
+    assert all(e.details["suppressed"] == 1 for e in summaries)
+
+
+def test_aggregator_flush_without_suppression_emits_nothing(telemetry):
+    """Test that keys that stayed within their burst produce no summary."""
+    violations = ViolationAggregator(telemetry, burst=3, clock=FakeClock())
+    violations.record("PACKET_REJECTED", {"reason": "Timestamp stale", "apid": 1}, "MEDIUM")
+
+    violations.flush()
+
+    assert _event_types(telemetry) == ["PACKET_REJECTED"]
+
+
+def test_firewall_attack_flood_is_summarised(telemetry):
+    """Test that a bad-signature flood yields a few events plus one summary."""
+    violations = ViolationAggregator(telemetry, burst=3, clock=FakeClock())
+    firewall = SpaceFirewall(TEST_SECRET, telemetry, violations=violations)
+    rogue = RogueGroundStation(apid=0x100)
+    legit = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+
+    for i in range(100):
+        firewall.process_packet(rogue.create_attack_packet(f"ATTACK_{i}"))
+    firewall.process_packet(legit.create_command("PING"))
+    violations.flush()
+
+    # Firewall counters still see every packet
+    assert firewall.rejected_commands == 100
+    assert firewall.accepted_commands == 1
+    types = _event_types(telemetry)
+    assert types.count("SECURITY_VIOLATION") == 3
+    assert types.count("COMMAND_EXECUTED") == 1
+    assert telemetry.events[-1].details["suppressed"] == 97
+
+
+def test_suppression_filter_rate_limits_by_template():
+    """Test that records sharing a template are capped and the drop count is reported."""
+    clock = FakeClock()
+    suppression = SuppressionFilter(interval=5.0, burst=3, debug_sample=1, clock=clock)
+
+    def record(n):
+        return logging.LogRecord("fw", logging.WARNING, __file__, 1, "bad packet %d", (n,), None)
+
+    passed = [suppression.filter(record(i)) for i in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+
+    # A different template has its own budget
+    other = logging.LogRecord("fw", logging.WARNING, __file__, 1, "other", None, None)
+    assert suppression.filter(other)
+
+    clock.now += 5.0
+    resumed = record(10)
+    assert suppression.filter(resumed)
+    assert resumed.getMessage() == "bad packet 10 [7 similar messages suppressed in the last 5 s]"
+
+
+def test_suppression_filter_samples_debug_records():
+    """Test that only every Nth DEBUG record passes."""
+    suppression = SuppressionFilter(burst=1000, debug_sample=10, clock=FakeClock())
+
+    passed = [
+        suppression.filter(
+            logging.LogRecord("fw", logging.DEBUG, __file__, 1, "detail %d", (i,), None)
+        )
+        for i in range(100)
+    ]
+
+    assert sum(passed) == 10
+    assert passed[0]
+
+
+def test_install_log_suppression_filters_named_loggers(caplog):
+    """Test that suppressed records from an installed logger never reach handlers."""
+    name = "satellite_sim.tests.suppression"
+    suppression = install_log_suppression([name], burst=2, clock=FakeClock())
+    try:
+        with caplog.at_level(logging.INFO, logger=name):
+            for i in range(20):
+                logging.getLogger(name).info("packet %d", i)
+    finally:
+        logging.getLogger(name).removeFilter(suppression)
+
+    assert [r.getMessage() for r in caplog.records] == ["packet 0", "packet 1"]
@@ -1,6 +1,13 @@
+import json
 import pytest
 import time
 from satellite_sim.satellite.telemetry import TelemetrySystem, SecurityEvent
+from satellite_sim.satellite.event_store import (
+    JSONArrayEventStore,
+    MultiEventStore,
+    NDJSONEventStore,
+    SQLiteEventStore,
+)
 
 
 def test_telemetry_initialization():
@@ -49,3 +56,261 @@ def test_telemetry_timestamp():
     timestamp = events[0]["timestamp"]
 
     assert before <= timestamp <= after
+
+
+def test_ndjson_store_appends_and_compacts(tmp_path):
+    """Test that events are journaled as NDJSON and compacted to a JSON array."""
+    events_file = tmp_path / "events.json"
+    store = NDJSONEventStore(str(events_file), compact_every=2)
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"), events_file=str(events_file), event_store=store
+    )
+
+    telemetry.log_event("EVENT_1", {"data": 1}, "INFO")
+    telemetry.log_event("EVENT_2", {"data": 2}, "HIGH")
+    telemetry.log_event("EVENT_3", {"data": 3}, "LOW")
+    telemetry.flush()
+
+    lines = (tmp_path / "events.ndjson").read_text().splitlines()
+    assert [json.loads(line)["event_type"] for line in lines] == ["EVENT_1", "EVENT_2", "EVENT_3"]
+
+    # Periodic snapshot only covers the first two events until close()
+    assert len(json.loads(events_file.read_text())) == 2
+
+    telemetry.close()
+    snapshot = json.loads(events_file.read_text())
+    assert [e["event_type"] for e in snapshot] == ["EVENT_1", "EVENT_2", "EVENT_3"]
+    assert snapshot[1]["details"] == {"data": 2}
+
+
+def test_empty_store_compacts_to_empty_array(tmp_path):
+    """Test that closing telemetry without events writes an empty array."""
+    events_file = tmp_path / "events.json"
+    telemetry = TelemetrySystem(log_file=str(tmp_path / "telem.log"), events_file=str(events_file))
+    telemetry.close()
+
+    assert json.loads(events_file.read_text()) == []
+
+
+def test_ndjson_compaction_reads_only_new_events(tmp_path):
+    """Test that each compaction only reads the journal lines added since the last one."""
+    events_file = tmp_path / "events.json"
+    store = NDJSONEventStore(str(events_file), compact_every=10)
+    read_per_compaction = []
+    read_journal = store._read_journal
+
+    def counting_read(offset):
+        lines, end = read_journal(offset)
+        read_per_compaction.append(len(lines))
+        return lines, end
+
+    store._read_journal = counting_read
+    for i in range(500):
+        store.append({"event_type": "EVENT", "details": {"i": i}})
+    store.append_many([{"event_type": "EVENT", "details": {"i": i}} for i in range(500, 505)])
+    store.close()
+
+    assert len(read_per_compaction) == 51
+    assert max(read_per_compaction) == 10
+    snapshot = json.loads(events_file.read_text())
+    assert [e["details"]["i"] for e in snapshot] == list(range(505))
+
+
+def test_ndjson_compaction_rewrites_modified_snapshot(tmp_path):
+    """Test that a snapshot changed on disk is rebuilt from the whole journal."""
+    events_file = tmp_path / "events.json"
+    store = NDJSONEventStore(str(events_file), compact_every=2)
+    store.append_many([{"n": 1}, {"n": 2}])
+    events_file.write_text("[]\n")
+    store.append_many([{"n": 3}, {"n": 4}])
+    store.close()
+
+    assert json.loads(events_file.read_text()) == [{"n": 1}, {"n": 2}, {"n": 3}, {"n": 4}]
+
+
+def test_legacy_json_array_store(tmp_path):
+    """Test that the legacy backend still rewrites the full array per event."""
+    events_file = tmp_path / "events.json"
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"),
+        events_file=str(events_file),
+        event_store=JSONArrayEventStore(str(events_file)),
+    )
+    telemetry.log_event("EVENT_1", {}, "INFO")
+
+    assert json.loads(events_file.read_text())[0]["event_type"] == "EVENT_1"
+
+
+def test_buffered_telemetry_flushes_in_background(tmp_path):
+    """Test that buffered mode writes events from the writer thread."""
+    log_file = tmp_path / "telem.log"
+    events_file = tmp_path / "events.json"
+
+    with TelemetrySystem(
+        log_file=str(log_file), events_file=str(events_file), buffered=True, batch_size=4
+    ) as telemetry:
+        for i in range(10):
+            telemetry.log_event("BUFFERED_EVENT", {"i": i}, "INFO")
+
+        # In-memory view is updated synchronously
+        assert len(telemetry.get_all_events()) == 10
+
+        telemetry.flush()
+        journal = (tmp_path / "events.ndjson").read_text().splitlines()
+        assert [json.loads(line)["details"]["i"] for line in journal] == list(range(10))
+
+    assert log_file.read_text().count("BUFFERED_EVENT") == 10
+    assert len(json.loads(events_file.read_text())) == 10
+
+
+def test_buffered_telemetry_close_is_idempotent(tmp_path):
+    """Test that close() can be called more than once."""
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"),
+        events_file=str(tmp_path / "events.json"),
+        buffered=True,
+    )
+    telemetry.log_event("EVENT", {}, "INFO")
+    telemetry.close()
+    telemetry.close()
+
+    assert len(json.loads((tmp_path / "events.json").read_text())) == 1
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_log_event_after_close_raises(tmp_path, buffered):
+    """Test that events logged after close() are rejected instead of queued and lost."""
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"),
+        events_file=str(tmp_path / "events.json"),
+        buffered=buffered,
+        max_queue=1,
+    )
+    telemetry.log_event("EVENT", {}, "INFO")
+    telemetry.close()
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="closed"):
+            telemetry.log_event("LATE_EVENT", {}, "INFO")
+
+    assert telemetry.total_events == 1
+    assert "LATE_EVENT" not in (tmp_path / "telem.log").read_text()
+
+
+def test_telemetry_ring_buffer_retention(tmp_path):
+    """Test that only the most recent events are retained in memory."""
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"),
+        events_file=str(tmp_path / "events.json"),
+        max_events=3,
+    )
+
+    for i in range(5):
+        telemetry.log_event("EVENT", {"i": i}, "INFO")
+
+    events = telemetry.get_all_events()
+    assert [e["details"]["i"] for e in events] == [2, 3, 4]
+
+
+def test_telemetry_summary_counts_all_events(tmp_path):
+    """Test that counters cover events evicted from the ring buffer."""
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"),
+        events_file=str(tmp_path / "events.json"),
+        max_events=2,
+    )
+
+    telemetry.log_event("SECURITY_VIOLATION", {}, "CRITICAL")
+    telemetry.log_event("SECURITY_VIOLATION", {}, "CRITICAL")
+    telemetry.log_event("PACKET_REJECTED", {}, "HIGH")
+    telemetry.log_event("COMMAND_EXECUTED", {}, "INFO")
+
+    summary = telemetry.get_summary()
+    assert summary["total_events"] == 4
+    assert summary["retained_events"] == 2
+    assert summary["dropped_events"] == 2
+    assert summary["by_type"] == {
+        "SECURITY_VIOLATION": 2,
+        "PACKET_REJECTED": 1,
+        "COMMAND_EXECUTED": 1,
+    }
+    assert summary["by_severity"] == {"CRITICAL": 2, "HIGH": 1, "INFO": 1}
+
+
+def test_security_event_is_slotted():
+    """Test that events are stored compactly and materialized on demand."""
+    event = SecurityEvent(timestamp=1.0, event_type="E", details={"k": "v"}, severity="INFO")
+
+    assert not hasattr(event, "__dict__")
+    assert event.to_dict() == {
+        "timestamp": 1.0,
+        "event_type": "E",
+        "details": {"k": "v"},
+        "severity": "INFO",
+    }
+
+
+def test_get_all_events_returns_fresh_dicts(tmp_path):
+    """Test that callers mutating returned events do not affect stored events."""
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"), events_file=str(tmp_path / "events.json")
+    )
+    telemetry.log_event("EVENT", {"key": "value"}, "INFO")
+
+    telemetry.get_all_events()[0]["details"]["key"] = "changed"
+
+    assert telemetry.get_all_events()[0]["details"]["key"] == "value"
+
+
+def test_sqlite_store_query_and_count(tmp_path):
+    """Test indexed queries and per-APID counts over stored events."""
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    telemetry = TelemetrySystem(
+        log_file=str(tmp_path / "telem.log"),
+        events_file=str(tmp_path / "events.json"),
+        event_store=store,
+        buffered=True,
+    )
+    for i in range(30):
+        telemetry.log_event("COMMAND_EXECUTED", {"command": f"C{i}", "apid": 0x100}, "INFO")
+    for apid in (0x100, 0x200, 0x200):
+        telemetry.log_event("SECURITY_VIOLATION", {"reason": "bad", "apid": apid}, "CRITICAL")
+    telemetry.log_event("BATCH_PROCESSED", {"packets": 3}, "HIGH")
+    telemetry.flush()
+
+    critical = store.query(severities=["critical"])
+    assert [e["details"]["apid"] for e in critical] == [0x200, 0x200, 0x100]
+    assert len(store.query(limit=5)) == 5
+    assert store.query(limit=1)[0]["event_type"] == "BATCH_PROCESSED"
+    assert store.count() == {None: 34}
+    assert store.count(severities=["CRITICAL"], group_by="apid") == {0x100: 1, 0x200: 2}
+    assert store.count(since=time.time() + 60) == {None: 0}
+    with pytest.raises(ValueError):
+        store.count(group_by="details")
+    telemetry.close()
+
+
+def test_sqlite_store_keeps_history_across_sessions(tmp_path):
+    """Test that a new telemetry session appends to the index instead of clearing it."""
+    db = str(tmp_path / "events.db")
+    for session in range(2):
+        store = MultiEventStore(
+            [NDJSONEventStore(str(tmp_path / "events.json")), SQLiteEventStore(db)]
+        )
+        with TelemetrySystem(
+            log_file=str(tmp_path / "telem.log"),
+            events_file=str(tmp_path / "events.json"),
+            event_store=store,
+        ) as telemetry:
+            telemetry.log_event("COMMAND_EXECUTED", {"session": session}, "INFO")
+
+    with open(tmp_path / "events.json") as f:
+        assert len(json.load(f)) == 1
+    store = SQLiteEventStore(db)
+    assert store.count() == {None: 2}
+    store.close()
+
+    store = SQLiteEventStore(db, keep_history=False)
+    store.reset()
+    assert store.count() == {None: 0}
+    store.close()
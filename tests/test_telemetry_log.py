@@ -0,0 +1,97 @@
+import time
+import pytest
+from satellite_sim.satellite.telemetry import TelemetrySystem
+from satellite_sim.satellite.telemetry_log import (
+    LogFilter,
+    follow_entries,
+    iter_entries,
+    parse_line,
+    parse_since,
+    read_lines_reverse,
+    summarize_entries,
+    tail_entries,
+)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = str(tmp_path / "telem.log")
+    with TelemetrySystem(log_file=path, events_file=str(tmp_path / "events.json")) as telemetry:
+        for i in range(50):
+            telemetry.log_event("COMMAND_EXECUTED", {"command": f"CMD_{i}"}, "INFO")
+            if i % 10 == 0:
+                telemetry.log_event("SECURITY_VIOLATION", {"reason": f"bad {i}"}, "CRITICAL")
+    return path
+
+
+def test_parse_line():
+    """Test parsing a telemetry log line and skipping the banner."""
+    entry = parse_line("[Fri Nov 20 08:00:00 2024] [CRITICAL] SECURITY_VIOLATION: {'a': 1}\n")
+
+    assert entry.severity == "CRITICAL"
+    assert entry.event_type == "SECURITY_VIOLATION"
+    assert entry.timestamp == time.mktime((2024, 11, 20, 8, 0, 0, 0, 0, -1))
+    assert parse_line("--- SATELLITE TELEMETRY STREAM START ---\n") is None
+
+
+def test_parse_since():
+    """Test relative, epoch and ISO --since values."""
+    assert parse_since("15m", now=1000.0) == 100.0
+    assert parse_since("1h", now=7200.0) == 3600.0
+    assert parse_since("1234.5") == 1234.5
+    assert parse_since("2024-11-20T08:00:00") == time.mktime((2024, 11, 20, 8, 0, 0, 0, 0, -1))
+    with pytest.raises(ValueError):
+        parse_since("yesterday")
+
+
+def test_read_lines_reverse_small_chunks(log_file):
+    """Test that reverse reading across chunk boundaries yields every line."""
+    with open(log_file) as f:
+        lines = f.read().splitlines()
+
+    assert list(read_lines_reverse(log_file, chunk_size=7)) == lines[::-1]
+
+
+def test_iter_entries_filters(log_file):
+    """Test severity and event type filters."""
+    critical = list(iter_entries(log_file, LogFilter(severities=["critical"])))
+    executed = list(iter_entries(log_file, LogFilter(event_types=["COMMAND_EXECUTED"])))
+
+    assert len(critical) == 5
+    assert len(executed) == 50
+    assert len(list(iter_entries(log_file))) == 55
+
+
+def test_tail_entries(log_file):
+    """Test tailing with and without filters."""
+    last = tail_entries(log_file, 3)
+    assert [e.line.endswith("'CMD_49'}") for e in last] == [False, False, True]
+
+    violations = tail_entries(log_file, 2, LogFilter(severities=["CRITICAL"]))
+    assert ["bad 30" in e.line for e in violations] == [True, False]
+    assert "bad 40" in violations[1].line
+
+
+def test_since_filter(log_file):
+    """Test that --since excludes older entries."""
+    assert tail_entries(log_file, 100, LogFilter(since=time.time() + 3600)) == []
+    assert len(tail_entries(log_file, 100, LogFilter(since=time.time() - 3600))) == 55
+
+
+def test_follow_entries(log_file):
+    """Test that follow yields only entries appended after it starts."""
+    follower = follow_entries(log_file, poll_interval=0.01, max_polls=5)
+    with open(log_file, "a") as f:
+        f.write("[Fri Nov 20 08:00:00 2024] [HIGH] PACKET_REJECTED: {'reason': 'x'}\n")
+
+    entries = list(follower)
+
+    assert [e.event_type for e in entries] == ["PACKET_REJECTED"]
+
+
+def test_summarize_entries(log_file):
+    """Test aggregate counts computed from a streamed log."""
+    summary = summarize_entries(iter_entries(log_file))
+
+    assert summary["total_events"] == 55
+    assert summary["by_severity"] == {"INFO": 50, "CRITICAL": 5}
@@ -1,5 +1,7 @@
 import pytest
-from satellite_sim.channel.uplink import UplinkChannel
+from satellite_sim.channel.uplink import GilbertElliott, UplinkChannel
+from satellite_sim.ground_station.legit import LegitGroundStation
+from tests.conftest import TEST_SECRET
 
 
 def test_uplink_perfect_transmission():
@@ -37,3 +39,73 @@ def test_uplink_partial_noise():
     # With 50% noise, we expect roughly 50/50 split (allow some variance)
     assert 30 <= successes <= 70
     assert 30 <= failures <= 70
+
+
+def _bit_differences(a, b):
+    return bin(int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).count("1")
+
+
+def test_uplink_bit_errors_are_reproducible():
+    """Test that a seeded channel corrupts packets identically."""
+    packets = [bytes(range(64))] * 50
+    first = UplinkChannel(bit_error_rate=0.01, seed=7).transmit_batch(packets)
+    second = UplinkChannel(bit_error_rate=0.01, seed=7).transmit_batch(packets)
+
+    assert [d.packet for d in first] == [d.packet for d in second]
+
+
+def test_uplink_bit_error_rate():
+    """Test that the observed bit error count tracks the configured rate."""
+    channel = UplinkChannel(bit_error_rate=0.001, seed=1)
+    packets = [b"\x00" * 125] * 1000  # 1,000,000 bits
+
+    deliveries = channel.transmit_batch(packets)
+
+    flipped = sum(_bit_differences(d.packet, b"\x00" * 125) for d in deliveries)
+    assert flipped == channel.bit_errors
+    assert 800 <= flipped <= 1200
+    assert all(len(d.packet) == 125 for d in deliveries)
+
+
+def test_uplink_burst_errors_cluster():
+    """Test that Gilbert-Elliott errors arrive in bursts."""
+    burst = GilbertElliott(p_good_to_bad=0.0005, p_bad_to_good=0.05, ber_good=0.0, ber_bad=0.5)
+    channel = UplinkChannel(burst=burst, seed=3)
+    packets = [b"\x00" * 100] * 500
+
+    deliveries = channel.transmit_batch(packets)
+
+    corrupted = [d for d in deliveries if d.packet != b"\x00" * 100]
+    assert channel.bit_errors > 0
+    # Errors concentrate in a minority of packets
+    assert len(corrupted) < len(packets) / 2
+    assert channel.bit_errors / len(corrupted) > 2
+
+
+def test_uplink_jitter_reorders_packets():
+    """Test that jitter larger than the send interval reorders deliveries."""
+    channel = UplinkChannel(latency=0.1, jitter=0.05, seed=5)
+    packets = [bytes([i]) for i in range(100)]
+
+    deliveries = channel.transmit_batch(packets, start_time=10.0, send_interval=0.001)
+
+    arrivals = [d.arrival_time for d in deliveries]
+    assert arrivals == sorted(arrivals)
+    assert [d.send_index for d in deliveries] != list(range(100))
+    assert sorted(d.send_index for d in deliveries) == list(range(100))
+    assert all(d.packet == packets[d.send_index] for d in deliveries)
+    assert min(arrivals) >= 10.1
+
+
+def test_corrupted_packets_rejected_by_firewall(firewall):
+    """Test that bit errors never produce an accepted command with altered content."""
+    station = LegitGroundStation(apid=0x100, secret_key=TEST_SECRET)
+    packets = [station.create_command(f"CMD_{i}") for i in range(200)]
+
+    channel = UplinkChannel(bit_error_rate=0.002, seed=11)
+    deliveries = channel.transmit_batch(packets)
+    result = firewall.process_batch(d.packet for d in deliveries)
+
+    clean = sum(1 for d in deliveries if d.packet == packets[d.send_index])
+    assert result.accepted == clean
+    assert channel.packets_corrupted == len(deliveries) - clean > 0
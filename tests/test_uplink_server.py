@@ -0,0 +1,113 @@
+import asyncio
+import socket
+import pytest
+from satellite_sim.ground_station.legit import LegitGroundStation
+from satellite_sim.satellite.uplink_server import UplinkServer, read_packet
+from tests.conftest import TEST_SECRET
+
+
+def _packets(count, apid=0x100):
+    station = LegitGroundStation(apid=apid, secret_key=TEST_SECRET)
+    return [station.create_command(f"CMD_{i}") for i in range(count)]
+
+
+def test_read_packet_frames_stream():
+    """Test that back-to-back packets are split on the CCSDS length field."""
+    packets = _packets(3)
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"".join(packets))
+        reader.feed_eof()
+        return [await read_packet(reader) for _ in range(4)]
+
+    assert asyncio.run(run()) == packets + [None]
+
+
+def test_read_packet_truncated_stream():
+    """Test that a stream ending mid-packet is reported as a framing error."""
+    packet = _packets(1)[0]
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(packet[:-5])
+        reader.feed_eof()
+        await read_packet(reader)
+
+    with pytest.raises(asyncio.IncompleteReadError):
+        asyncio.run(run())
+
+
+def test_tcp_many_connections(firewall):
+    """Test that concurrent TCP clients all get their packets through the firewall."""
+    clients = 200
+    stations = [_packets(3, apid=0x100 + i) for i in range(clients)]
+
+    async def run():
+        server = UplinkServer(firewall, batch_size=128)
+        host, port = await server.start_tcp()
+
+        async def client(packets):
+            _, writer = await asyncio.open_connection(host, port)
+            writer.write(b"".join(packets))
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        await asyncio.gather(*(client(p) for p in stations))
+        while server.packets_received < clients * 3:
+            await asyncio.sleep(0.01)
+        await server.drain()
+        await server.close()
+        return server
+
+    server = asyncio.run(run())
+
+    assert server.connections_total == clients
+    assert server.framing_errors == 0
+    assert firewall.accepted_commands == clients * 3
+    assert server.batches_processed < clients * 3
+
+
+def test_udp_datagrams(firewall):
+    """Test one packet per datagram, including a forged one."""
+    packets = _packets(5)
+    forged = packets[0][:-1] + bytes([packets[0][-1] ^ 0xFF])
+
+    async def run():
+        server = UplinkServer(firewall)
+        host, port = await server.start_udp()
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for packet in packets + [forged]:
+                sock.sendto(packet, (host, port))
+        while server.packets_received < 6:
+            await asyncio.sleep(0.01)
+        await server.close()
+
+    asyncio.run(run())
+
+    assert firewall.accepted_commands == 5
+    assert firewall.rejected_commands == 1
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets")
+def test_unix_socket(firewall, tmp_path):
+    """Test framed packets over a local Unix socket."""
+    path = str(tmp_path / "uplink.sock")
+    packets = _packets(10)
+
+    async def run():
+        server = UplinkServer(firewall)
+        await server.start_unix(path)
+        _, writer = await asyncio.open_unix_connection(path)
+        writer.write(b"".join(packets))
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+        while server.packets_received < 10:
+            await asyncio.sleep(0.01)
+        await server.close()
+
+    asyncio.run(run())
+
+    assert firewall.accepted_commands == 10